@@ -1,36 +1,153 @@
 import argparse
+import importlib
 from pathlib import Path
+import sys
+import time
+import typing as t
 
+from adventofcode2023.backend import add_backend_argument, use_backend
+from adventofcode2023.cache import (
+    add_answer_store_arguments,
+    add_cache_arguments,
+    answer_store_from_args,
+    file_digest,
+    load_problem,
+    problem_cache_from_args
+)
 from adventofcode2023.day import search_day
+from adventofcode2023.parallel import add_workers_argument, use_workers
+from adventofcode2023.solution import Metrics
 
 
-argparser = argparse.ArgumentParser()
-argparser.add_argument("day")
-argparser.add_argument(
-    "--part",
-    "-p",
-    default=0,
-    type=int,
-    choices=[1, 2],
-    help="which part to run, by default all"
-)
-argparser.add_argument(
-    "--infile",
-    "-i",
-    type=Path,
-    help="path to input file, uses input.txt in the same directory as the solution by default"
-)
+# other modes live in their own modules and are only imported when used
+MODES: dict[str, str] = {
+    "all": "adventofcode2023.runner",
+    "batch": "adventofcode2023.batch",
+    "bench": "adventofcode2023.bench",
+    "check": "adventofcode2023.check",
+    "client": "adventofcode2023.client",
+    "generate": "adventofcode2023.generate",
+    "parse": "adventofcode2023.parsing",
+    "regress": "adventofcode2023.regression",
+    "scale": "adventofcode2023.scaling",
+    "serve": "adventofcode2023.server",
+}
 
-args = argparser.parse_args()
-day = search_day(args.day)
-problem = day.problem_class.from_path(
-    args.infile
-    if args.infile
-    else day.problem_class.default_input_file_path()
-)
-solution = day.solution_class()
-parts = args.part
-if parts == 0 or parts == 1:
-    print(f"Part 1: {solution.p1(problem)}")
-if parts == 0 or parts == 2:
-    print(f"Part 2: {solution.p2(problem)}")
\ No newline at end of file
+
+def solve(argv: list[str]) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023")
+    argparser.add_argument("day", help=f"day to solve, or one of: {", ".join(MODES)}")
+    argparser.add_argument(
+        "--part",
+        "-p",
+        default=0,
+        type=int,
+        choices=[1, 2],
+        help="which part to run, by default all"
+    )
+    argparser.add_argument(
+        "--infile",
+        "-i",
+        type=Path,
+        help="path to input file, uses input.txt in the same directory as the solution by default"
+    )
+    argparser.add_argument(
+        "--stream",
+        action="store_true",
+        help="read the input lazily line by line, days that cannot do so read it whole instead"
+    )
+    argparser.add_argument(
+        "--profile",
+        type=Path,
+        metavar="DIR",
+        help="profile parsing and each part, writing pstats and collapsed stacks to DIR"
+    )
+    argparser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="report peak memory and the top allocation sites at the peak of each step"
+    )
+    argparser.add_argument(
+        "--top",
+        default=10,
+        type=int,
+        help="how many functions or allocation sites to report when profiling"
+    )
+    argparser.add_argument(
+        "--metrics",
+        "-m",
+        action="store_true",
+        help="report the counters each part collects, like nodes visited or cache misses"
+    )
+    add_backend_argument(argparser)
+    add_workers_argument(argparser)
+    add_cache_arguments(argparser)
+    add_answer_store_arguments(argparser)
+
+    args = argparser.parse_args(argv)
+    use_backend(args.backend)
+    use_workers(args.workers)
+    day = search_day(args.day)
+    path = args.infile if args.infile else day.problem_class.default_input_file_path()
+    parts = [1, 2] if args.part == 0 else [args.part]
+
+    if args.profile or args.trace_memory:
+        # profiling always parses and solves from scratch, bypassing every cache
+        from adventofcode2023.profiling import profile_day
+        profile_day(day, path, parts, args.profile, args.trace_memory, args.top)
+        return 0
+
+    answers = answer_store_from_args(args)
+    problems = problem_cache_from_args(args)
+    # hashed once, in chunks, so a streamed input is never read whole
+    input_digest = file_digest(path) if answers or problems else ""
+    stored = {part: answers.get(day, part, input_digest) if answers else None for part in parts}
+    todo = [part for part in parts if stored[part] is None]
+
+    solution = day.solution_class()
+
+    def solve_each() -> t.Iterator[tuple[t.Any, float]]:
+        problem = None
+        for part in todo:
+            # a streamed problem can only be consumed once
+            if args.stream:
+                problem = day.problem_class.stream_path(path)
+            elif problem is None:
+                problem = load_problem(day, path, problems, input_digest)
+            if args.metrics:
+                solution.metrics = Metrics()
+            start = time.perf_counter()
+            answer = solution.p1(problem) if part == 1 else solution.p2(problem)
+            yield answer, time.perf_counter() - start
+
+    # answer and seconds taken for each part that is not stored, solved only
+    # once the parts before it are printed so a failing part loses no answers
+    solved: t.Iterator[tuple[t.Any, float]]
+    if todo == [1, 2] and not args.stream and not args.metrics:
+        solved = solution.solve_both(load_problem(day, path, problems, input_digest))
+    else:
+        solved = solve_each()
+
+    for part in parts:
+        if (s := stored[part]) is not None:
+            print(f"Part {part}: {s.answer}")
+            print(f"(cached, originally took {s.elapsed:.3f} s)", file=sys.stderr)
+            continue
+        answer, elapsed = next(solved)
+        print(f"Part {part}: {answer}", flush=True)
+        for name, count in solution.metrics.snapshot().items():
+            print(f"  {name}: {count}", file=sys.stderr)
+        if answers:
+            answers.put(day, part, input_digest, str(answer), elapsed)
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    if len(argv) >= 1 and argv[0] in MODES:
+        return importlib.import_module(MODES[argv[0]]).main(argv[1:])
+    return solve(argv)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
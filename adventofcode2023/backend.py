@@ -0,0 +1,45 @@
+"""
+Backends solutions can run their array heavy loops on.
+
+Every day runs in pure Python, and some days also have vectorized versions of
+their hot loops written with numpy, kept in an arrays module next to the day
+and only imported when the numpy backend is used. numpy is optional: asking
+for it when it is not installed falls back to pure Python, and days without
+a vectorized version keep to pure Python either way. Both backends give the
+same answers.
+"""
+
+import argparse
+import importlib.util
+import sys
+
+
+BACKENDS: list[str] = ["python", "numpy"]
+
+
+def has_numpy() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+def use_backend(name: str) -> str:
+    """
+    Make every solution run on the named backend, or pure Python if it is not
+    available, returning the backend actually used.
+    """
+    from adventofcode2023.solution import Solution
+    if name not in BACKENDS:
+        raise ValueError(f"no such backend: {name}")
+    if name == "numpy" and not has_numpy():
+        print("numpy is not installed, falling back to pure python", file=sys.stderr)
+        name = "python"
+    Solution.backend = name
+    return name
+
+
+def add_backend_argument(argparser: argparse.ArgumentParser):
+    argparser.add_argument(
+        "--backend",
+        default="python",
+        choices=BACKENDS,
+        help="run vectorized versions of the days that have one, numpy needs to be installed"
+    )
@@ -0,0 +1,249 @@
+"""
+Solve many inputs for a single day in one process, or a pool of them.
+
+Inputs are given as files, directories, whose files are all solved, or glob
+patterns. The day is imported once, so module level tables are built once and
+interpreter startup is paid once for the whole batch instead of per input.
+Results are written as JSON lines as soon as each input is done, in input
+order when solving in process and in completion order otherwise. Inputs are
+solved in processes of their own by the runner's Scheduler when more than one
+job is asked for or memory is budgeted, see adventofcode2023.runner.
+"""
+
+import argparse
+from dataclasses import asdict, dataclass, field
+import glob
+import json
+from pathlib import Path
+import signal
+import sys
+import time
+import typing as t
+
+from adventofcode2023.backend import add_backend_argument, use_backend
+from adventofcode2023.cache import (
+    ProblemCache, add_cache_arguments, load_problem, problem_cache_from_args
+)
+from adventofcode2023.day import DAYS, search_day
+from adventofcode2023.parallel import add_workers_argument, use_workers
+from adventofcode2023.runner import (
+    Budget,
+    Scheduler,
+    TaskTimeout,
+    add_budget_arguments,
+    budget_from_args,
+    peak_rss,
+    raise_timeout,
+    raised_at
+)
+
+
+@dataclass
+class PartResult(object):
+    answer: str | None = None
+    elapsed: float = 0.0
+    error: str | None = None
+
+
+@dataclass
+class InputResult(object):
+    input: str
+    day: int
+    parse_elapsed: float = 0.0
+    parts: dict[int, PartResult] = field(default_factory=dict)
+    error: str | None = None
+    # only measured when solved in a process of its own
+    peak_memory: int | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and all(p.error is None for p in self.parts.values())
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self))
+
+
+def expand_inputs(patterns: list[str]) -> list[Path]:
+    paths: list[Path] = []
+    for pattern in patterns:
+        path = Path(pattern)
+        if path.is_dir():
+            paths.extend(sorted(p for p in path.iterdir() if p.is_file()))
+        elif glob.has_magic(pattern):
+            paths.extend(sorted(Path(p) for p in glob.glob(pattern) if Path(p).is_file()))
+        else:
+            paths.append(path)
+    return paths
+
+
+def solve_input(
+    day: int,
+    path: Path,
+    parts: list[int],
+    timeout: float | None = None,
+    cache: ProblemCache | None = None
+) -> InputResult:
+    """
+    Parse path once and solve each part on it, the timeout applying to the
+    whole input. Running out of time or memory stops the input, blaming the
+    part being solved if any.
+    """
+    result = InputResult(str(path), day)
+    if timeout:
+        signal.signal(signal.SIGALRM, raise_timeout)
+        signal.setitimer(signal.ITIMER_REAL, timeout)
+    part: PartResult | None = None
+    start = time.perf_counter()
+    try:
+        d = DAYS[day]
+        problem = load_problem(d, path, cache)
+        result.parse_elapsed = time.perf_counter() - start
+        solution = d.solution_class()
+        for p in parts:
+            part = result.parts[p] = PartResult()
+            start = time.perf_counter()
+            try:
+                answer = solution.p1(problem) if p == 1 else solution.p2(problem)
+                part.answer = str(answer)
+            except (TaskTimeout, MemoryError):
+                raise
+            except Exception as e:
+                part.error = f"{type(e).__name__}: {e}"
+            finally:
+                part.elapsed = time.perf_counter() - start
+    except (TaskTimeout, MemoryError) as e:
+        if isinstance(e, TaskTimeout):
+            error = f"timed out, {e}"
+        else:
+            error = f"over memory budget, stopped at {raised_at(e)}"
+        if part is not None and part.answer is None:
+            part.error = error
+        else:
+            result.error = error
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        if timeout:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+    return result
+
+
+def warm_up(day: int, backend: str = "python"):
+    use_backend(backend)
+    DAYS[day]
+
+
+def solve_input_alone(
+    day: int,
+    path: Path,
+    parts: list[int],
+    cache: ProblemCache | None = None
+) -> InputResult:
+    """solve_input in a process of its own, where its peak memory is its own"""
+    result = solve_input(day, path, parts, cache=cache)
+    result.peak_memory = peak_rss()
+    return result
+
+
+def run_batch(
+    day: int,
+    paths: list[Path],
+    parts: list[int],
+    jobs: int | None = 1,
+    budget: Budget = Budget(),
+    cache: ProblemCache | None = None,
+    on_result: t.Callable[[InputResult], None] = print,
+    backend: str = "python"
+) -> list[InputResult]:
+    if jobs == 1 and budget.memory is None:
+        results = []
+        for path in paths:
+            result = solve_input(day, path, parts, budget.seconds, cache)
+            on_result(result)
+            results.append(result)
+        return results
+    # by position rather than path, the same input may be given more than once
+    by_index: list[InputResult | None] = [None] * len(paths)
+    # tasks are forked from here where possible, so import the day only once
+    warm_up(day, backend)
+    scheduler = Scheduler(jobs, budget, warm_up, (day, backend))
+    calls = [(solve_input_alone, (day, path, parts, cache)) for path in paths]
+
+    def lost(i: int, reason: str, elapsed: float) -> InputResult:
+        return InputResult(str(paths[i]), day, error=reason)
+
+    for i, result in scheduler.run(calls, lost):
+        on_result(result)
+        by_index[i] = result
+    return [result for result in by_index if result is not None]
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 batch")
+    argparser.add_argument("day", help="day to solve")
+    argparser.add_argument(
+        "inputs",
+        nargs="+",
+        help="input files, directories of input files or glob patterns"
+    )
+    argparser.add_argument(
+        "--part",
+        "-p",
+        default=0,
+        type=int,
+        choices=[1, 2],
+        help="which part to run, by default all"
+    )
+    argparser.add_argument(
+        "--jobs",
+        "-j",
+        default=1,
+        type=int,
+        help="number of inputs solved at once, 1 solves in this process unless memory is budgeted"
+        ", 0 uses one per cpu"
+    )
+    add_budget_arguments(argparser, "input")
+    add_backend_argument(argparser)
+    add_workers_argument(
+        argparser,
+        ", only with --jobs 1 and no --memory since otherwise inputs are solved in"
+        " daemon processes, which cannot start worker processes of their own"
+    )
+    add_cache_arguments(argparser)
+    args = argparser.parse_args(argv)
+    backend = use_backend(args.backend)
+    if args.workers != 1 and (args.jobs != 1 or args.memory is not None):
+        # inputs solved by the scheduler run in daemon processes, which
+        # cannot start worker processes of their own
+        argparser.error("--workers needs inputs solved in this process, --jobs 1 without --memory")
+    use_workers(args.workers)
+
+    day = search_day(args.day).number
+    parts = [1, 2] if args.part == 0 else [args.part]
+    paths = expand_inputs(args.inputs)
+    if not paths:
+        argparser.error("no inputs found")
+    jobs = args.jobs or None
+
+    def emit(result: InputResult):
+        print(result.to_json(), flush=True)
+
+    start = time.perf_counter()
+    results = run_batch(
+        day,
+        paths,
+        parts,
+        jobs,
+        budget_from_args(args),
+        problem_cache_from_args(args),
+        emit,
+        backend
+    )
+    wall = time.perf_counter() - start
+
+    failed = [r for r in results if not r.ok]
+    print(
+        f"{len(results) - len(failed)}/{len(results)} inputs ok, wall {wall:.2f} s",
+        file=sys.stderr
+    )
+    return 1 if failed else 0
@@ -0,0 +1,220 @@
+"""
+Time parsing and both parts of each day separately.
+
+Every step is repeated after a few warmup runs. Solving is always done on a
+freshly parsed problem with a fresh solution so that parts which mutate the
+problem or cache state on the solution do not skew later samples. Peak memory
+is measured in one extra run under tracemalloc so that tracing does not slow
+down the timed samples, and solver counters are collected in that run too.
+"""
+
+import argparse
+from dataclasses import dataclass, field
+import gc
+import json
+from pathlib import Path
+import statistics
+import time
+import tracemalloc
+import typing as t
+
+from adventofcode2023.backend import add_backend_argument, use_backend
+from adventofcode2023.day import DAYS, Day, search_day
+from adventofcode2023.parallel import add_workers_argument, use_workers
+from adventofcode2023.runner import time_limit
+from adventofcode2023.solution import Metrics
+
+
+STEPS = ("parse", "p1", "p2")
+
+
+@dataclass
+class StepResult(object):
+    samples: list[float] = field(default_factory=list)
+    peak_memory: int | None = None
+    counters: dict[str, int] = field(default_factory=dict)
+    error: str | None = None
+
+    @property
+    def min(self) -> float:
+        return min(self.samples)
+
+    @property
+    def median(self) -> float:
+        return statistics.median(self.samples)
+
+    @property
+    def p95(self) -> float:
+        if len(self.samples) < 2:
+            return self.samples[0]
+        return statistics.quantiles(self.samples, n=20, method="inclusive")[-1]
+
+    def to_dict(self) -> dict[str, t.Any]:
+        if self.error is not None:
+            return {"error": self.error}
+        return {
+            "min": self.min,
+            "median": self.median,
+            "p95": self.p95,
+            "peak_memory": self.peak_memory,
+            "counters": self.counters,
+            "samples": self.samples
+        }
+
+
+@dataclass
+class DayResult(object):
+    day: int
+    steps: dict[str, StepResult] = field(default_factory=dict)
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {"day": self.day} | {name: step.to_dict() for name, step in self.steps.items()}
+
+
+def measure(
+    setup: t.Callable[[], t.Any],
+    run: t.Callable[[t.Any], t.Any],
+    repeat: int,
+    warmup: int,
+    memory: bool = True,
+    timeout: float | None = None
+) -> StepResult:
+    """
+    Time run on fresh state from setup, giving up with a TaskTimeout error
+    once any single run takes longer than timeout
+    """
+    result = StepResult()
+    try:
+        for _ in range(warmup):
+            state = setup()
+            with time_limit(timeout):
+                run(state)
+        for _ in range(repeat):
+            state = setup()
+            gc.collect()
+            with time_limit(timeout):
+                start = time.perf_counter()
+                run(state)
+                result.samples.append(time.perf_counter() - start)
+        if not memory:
+            return result
+        state = setup()
+        # solving steps are set up as a (solution, problem) pair
+        solution = state[0] if isinstance(state, tuple) else None
+        if solution is not None:
+            solution.metrics = Metrics()
+        gc.collect()
+        tracemalloc.start()
+        try:
+            with time_limit(timeout):
+                run(state)
+            result.peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+        if solution is not None:
+            result.counters = solution.metrics.snapshot()
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def bench_day(
+    day: Day,
+    data: bytes,
+    repeat: int = 5,
+    warmup: int = 1,
+    steps: t.Iterable[str] = STEPS,
+    memory: bool = True,
+    timeout: float | None = None
+) -> DayResult:
+    parse = lambda: day.problem_class.from_bytes(data)
+    fresh = lambda: (day.solution_class(), parse())
+    runners: dict[str, tuple[t.Callable[[], t.Any], t.Callable[[t.Any], t.Any]]] = {
+        "parse": (lambda: None, lambda _: parse()),
+        "p1": (fresh, lambda sp: sp[0].p1(sp[1])),
+        "p2": (fresh, lambda sp: sp[0].p2(sp[1]))
+    }
+    result = DayResult(day.number)
+    for step in steps:
+        setup, run = runners[step]
+        result.steps[step] = measure(setup, run, repeat, warmup, memory, timeout)
+    return result
+
+
+def format_table(results: list[DayResult]) -> str:
+    lines = [
+        f"{"day":>3} {"step":<5} {"min ms":>10} {"median ms":>10} {"p95 ms":>10} {"peak KiB":>10}"
+    ]
+    for result in results:
+        for name, step in result.steps.items():
+            if step.error is not None:
+                lines.append(f"{result.day:>3} {name:<5} {step.error}")
+                continue
+            peak = "-" if step.peak_memory is None else f"{step.peak_memory / 1024:.1f}"
+            lines.append(
+                f"{result.day:>3} {name:<5}"
+                f" {step.min * 1000:>10.2f}"
+                f" {step.median * 1000:>10.2f}"
+                f" {step.p95 * 1000:>10.2f}"
+                f" {peak:>10}"
+                + "".join(f" {k}={v}" for k, v in step.counters.items())
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 bench")
+    argparser.add_argument("days", nargs="*", help="days to benchmark, by default all")
+    argparser.add_argument("--repeat", "-r", default=5, type=int, help="timed runs per step")
+    argparser.add_argument("--warmup", "-w", default=1, type=int, help="untimed runs per step")
+    argparser.add_argument(
+        "--steps",
+        "-s",
+        default=",".join(STEPS),
+        help=f"comma separated steps to run, any of {", ".join(STEPS)}"
+    )
+    argparser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip the extra traced run used to measure peak memory and counters"
+    )
+    argparser.add_argument(
+        "--infile",
+        "-i",
+        type=Path,
+        help="path to input file, only allowed when benchmarking a single day"
+    )
+    argparser.add_argument(
+        "--json",
+        "-j",
+        type=Path,
+        help="also write the results as json to this path, - for stdout instead of the table"
+    )
+    add_backend_argument(argparser)
+    add_workers_argument(argparser)
+    args = argparser.parse_args(argv)
+    use_backend(args.backend)
+    use_workers(args.workers)
+
+    steps = [s for s in args.steps.split(",") if s]
+    if unknown := [s for s in steps if s not in STEPS]:
+        argparser.error(f"unknown steps: {", ".join(unknown)}")
+    days = [search_day(d) for d in args.days] if args.days else [DAYS[n] for n in DAYS]
+    if args.infile and len(days) != 1:
+        argparser.error("--infile needs exactly one day")
+
+    results: list[DayResult] = []
+    for day in days:
+        path = args.infile or day.problem_class.default_input_file_path()
+        data = path.read_bytes()
+        results.append(bench_day(day, data, args.repeat, args.warmup, steps, args.memory))
+
+    as_json = json.dumps([r.to_dict() for r in results], indent=2)
+    if str(args.json) == "-":
+        print(as_json)
+    else:
+        print(format_table(results))
+        if args.json:
+            args.json.write_text(as_json)
+    return 0
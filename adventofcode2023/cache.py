@@ -0,0 +1,317 @@
+"""
+On-disk caches that let repeated runs skip work they have already done.
+
+Parsed problems are pickled under a key made from the day, the problem class
+and its version, the source of the module defining it and of every module of
+this package it depends on, like the grid or coordinates pickled along with
+it, and a digest of the input, so editing a parser or the input invalidates
+the entry. Entries are evicted least recently used first once the cache
+grows past its size limit. Inputs are hashed in chunks, and only read whole
+when they have to be parsed.
+
+Answers are kept in a sqlite database keyed by day, part, input digest and a
+digest of the solution code, along with how long they originally took to
+compute. Old answers are evicted by age and by count.
+
+Caching is opt-in: pass --cache or set AOC2023_CACHE_DIR, and --no-cache
+turns it off again. Runs without a cache do not pay for importing pickle,
+sqlite3 or tempfile either, they are only imported by the caches using them.
+"""
+
+import argparse
+from dataclasses import dataclass
+from functools import cache
+import hashlib
+import importlib
+import os
+from pathlib import Path
+import sys
+import time
+import types
+
+from adventofcode2023.day import Day
+from adventofcode2023.problem import Problem
+
+
+CACHE_DIR_ENV = "AOC2023_CACHE_DIR"
+DEFAULT_CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "adventofcode2023"
+)
+DEFAULT_CACHE_SIZE = 256 * 1024 * 1024
+
+
+def digest(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+def file_digest(path: os.PathLike) -> str:
+    """digest of the file at path, read in chunks rather than all at once"""
+    with open(path, "rb") as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+@cache
+def source_digest(module_name: str) -> str:
+    m = importlib.import_module(module_name)
+    return digest(Path(m.__file__).read_bytes())
+
+
+def package_dependencies(module_name: str) -> set[str]:
+    """
+    Names of all modules in this package that module_name refers to,
+    directly or indirectly, including itself.
+    """
+    package = __name__.partition(".")[0] + "."
+    seen: set[str] = set()
+    stack = [module_name]
+    while len(stack) >= 1:
+        name = stack.pop()
+        if name in seen:
+            continue
+        seen.add(name)
+        for value in vars(importlib.import_module(name)).values():
+            if isinstance(value, types.ModuleType):
+                dep = value.__name__
+            else:
+                dep = getattr(value, "__module__", None)
+            if isinstance(dep, str) and dep.startswith(package) and dep in sys.modules:
+                stack.append(dep)
+    return seen
+
+
+@cache
+def code_digest(module_name: str) -> str:
+    deps = sorted(package_dependencies(module_name))
+    return digest("".join(f"{dep}:{source_digest(dep)}" for dep in deps).encode())
+
+
+def write_atomic(path: Path, data: bytes):
+    import tempfile
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+    except BaseException:
+        os.unlink(tmp)
+        raise
+
+
+class ProblemCache(object):
+    def __init__(self, directory: Path = DEFAULT_CACHE_DIR, max_bytes: int = DEFAULT_CACHE_SIZE):
+        self.directory = Path(directory) / "problems"
+        self.max_bytes = max_bytes
+
+    def key(self, day: Day, input_digest: str) -> str:
+        cls = day.problem_class
+        header = f"{day.number}:{cls.__module__}.{cls.__qualname__}:{cls.version}"
+        return digest(f"{header}:{code_digest(cls.__module__)}:{input_digest}".encode())
+
+    def entry(self, key: str) -> Path:
+        return self.directory / f"{key}.pickle"
+
+    def get(self, key: str) -> Problem | None:
+        import pickle
+        path = self.entry(key)
+        try:
+            with path.open("rb") as f:
+                problem = pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # stale or truncated entry, parse again and overwrite it
+            path.unlink(missing_ok=True)
+            return None
+        os.utime(path) # mark as recently used
+        return problem
+
+    def put(self, key: str, problem: Problem):
+        import pickle
+        write_atomic(self.entry(key), pickle.dumps(problem, pickle.HIGHEST_PROTOCOL))
+        self.evict()
+
+    def load(self, day: Day, path: os.PathLike, input_digest: str | None = None) -> Problem:
+        """
+        Load the problem for day from path, parsing it only if it is not
+        already cached. The input is only read whole to parse it, pass its
+        file_digest if it is already known to not hash it again.
+        """
+        key = self.key(day, input_digest or file_digest(path))
+        if (problem := self.get(key)) is not None:
+            return problem
+        problem = day.problem_class.from_path(path)
+        self.put(key, problem)
+        return problem
+
+    def evict(self):
+        entries = []
+        for path in self.directory.glob("*.pickle"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+@dataclass
+class StoredAnswer(object):
+    answer: str
+    elapsed: float
+    created: float
+
+
+class AnswerStore(object):
+    SCHEMA = """
+    CREATE TABLE IF NOT EXISTS answers (
+        day INTEGER NOT NULL,
+        part INTEGER NOT NULL,
+        input_digest TEXT NOT NULL,
+        code_digest TEXT NOT NULL,
+        answer TEXT NOT NULL,
+        elapsed REAL NOT NULL,
+        created REAL NOT NULL,
+        used REAL NOT NULL,
+        PRIMARY KEY (day, part, input_digest, code_digest)
+    )
+    """
+
+    def __init__(
+        self,
+        directory: Path = DEFAULT_CACHE_DIR,
+        max_age: float | None = None,
+        max_entries: int | None = None
+    ):
+        import sqlite3
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        self.connection = sqlite3.connect(directory / "answers.sqlite3", timeout=30)
+        self.connection.execute(self.SCHEMA)
+        self.max_age = max_age
+        self.max_entries = max_entries
+
+    def close(self):
+        self.connection.close()
+
+    def get(self, day: Day, part: int, input_digest: str) -> StoredAnswer | None:
+        key = (day.number, part, input_digest, code_digest(day.solution_class.__module__))
+        with self.connection:
+            row = self.connection.execute(
+                "SELECT answer, elapsed, created FROM answers"
+                " WHERE day = ? AND part = ? AND input_digest = ? AND code_digest = ?",
+                key
+            ).fetchone()
+            if row is None:
+                return None
+            self.connection.execute(
+                "UPDATE answers SET used = ?"
+                " WHERE day = ? AND part = ? AND input_digest = ? AND code_digest = ?",
+                (time.time(), *key)
+            )
+        return StoredAnswer(*row)
+
+    def put(self, day: Day, part: int, input_digest: str, answer: str, elapsed: float):
+        now = time.time()
+        with self.connection:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO answers VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    day.number,
+                    part,
+                    input_digest,
+                    code_digest(day.solution_class.__module__),
+                    answer,
+                    elapsed,
+                    now,
+                    now
+                )
+            )
+        self.evict()
+
+    def evict(self):
+        with self.connection:
+            if self.max_age is not None:
+                self.connection.execute(
+                    "DELETE FROM answers WHERE used < ?",
+                    (time.time() - self.max_age,)
+                )
+            if self.max_entries is not None:
+                self.connection.execute(
+                    "DELETE FROM answers WHERE rowid NOT IN"
+                    " (SELECT rowid FROM answers ORDER BY used DESC LIMIT ?)",
+                    (self.max_entries,)
+                )
+
+
+def add_cache_arguments(argparser: argparse.ArgumentParser):
+    argparser.add_argument(
+        "--cache",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help=f"cache parsed problems on disk, on by default when {CACHE_DIR_ENV} is set"
+    )
+    argparser.add_argument(
+        "--cache-dir",
+        type=Path,
+        help=f"cache directory, defaults to {CACHE_DIR_ENV} or {DEFAULT_CACHE_DIR}"
+    )
+    argparser.add_argument(
+        "--cache-size",
+        type=int,
+        default=DEFAULT_CACHE_SIZE // (1024 * 1024),
+        help="maximum size of the problem cache in MiB"
+    )
+
+
+def add_answer_store_arguments(argparser: argparse.ArgumentParser):
+    argparser.add_argument(
+        "--max-answer-age",
+        type=float,
+        help="forget stored answers that have not been used for this many days"
+    )
+    argparser.add_argument(
+        "--max-answers",
+        type=int,
+        default=10000,
+        help="maximum number of stored answers, least recently used are forgotten first"
+    )
+
+
+def cache_dir_from_args(args: argparse.Namespace) -> Path | None:
+    env = os.environ.get(CACHE_DIR_ENV)
+    enabled = args.cache if args.cache is not None else bool(env)
+    if not enabled:
+        return None
+    return args.cache_dir or (Path(env) if env else DEFAULT_CACHE_DIR)
+
+
+def problem_cache_from_args(args: argparse.Namespace) -> ProblemCache | None:
+    directory = cache_dir_from_args(args)
+    if directory is None:
+        return None
+    return ProblemCache(directory, args.cache_size * 1024 * 1024)
+
+
+def answer_store_from_args(args: argparse.Namespace) -> AnswerStore | None:
+    directory = cache_dir_from_args(args)
+    if directory is None:
+        return None
+    max_age = None if args.max_answer_age is None else args.max_answer_age * 24 * 60 * 60
+    return AnswerStore(directory, max_age, args.max_answers)
+
+
+def load_problem(
+    day: Day,
+    path: os.PathLike,
+    cache: ProblemCache | None = None,
+    input_digest: str | None = None
+) -> Problem:
+    if cache is None:
+        return day.problem_class.from_path(path)
+    return cache.load(day, path, input_digest)
@@ -0,0 +1,188 @@
+"""
+Check every day against the example inputs bundled next to it.
+
+Test files are found by globbing each day directory for test*.txt, and each
+part whose answer for that file is known is solved on a freshly parsed
+problem. A part fails if its answer is wrong, if parsing and solving take
+longer than the time budget, which is enforced with SIGALRM so a runaway part
+fails right away instead of hanging the check, or if they allocate more than
+the memory budget at their peak. Memory is measured in a second run under
+tracemalloc so that tracing does not count against the time budget.
+"""
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+import signal
+import sys
+import time
+import tracemalloc
+
+from adventofcode2023.backend import add_backend_argument, use_backend
+from adventofcode2023.day import DAYS, Day, search_day
+from adventofcode2023.runner import TaskTimeout, raise_timeout
+
+
+# answers by day, test file and part, left out where a part only makes sense
+# for the real input. Most are the answers given in the puzzle descriptions,
+# but where a part runs the example with different parameters than the puzzle
+# text does, the answer pinned here was produced by this code and only guards
+# against regressions: day 11 part 2 (expanding by a million rather than by 10
+# or 100) and day 21 part 1 (64 steps rather than 6).
+EXPECTED: dict[int, dict[str, dict[int, str]]] = {
+    1: {"test1.txt": {1: "142"}, "test2.txt": {2: "281"}},
+    2: {"test.txt": {1: "8", 2: "2286"}},
+    3: {"test.txt": {1: "4361", 2: "467835"}},
+    4: {"test.txt": {1: "13", 2: "30"}},
+    5: {"test.txt": {1: "35", 2: "46"}, "test_crlf.txt": {1: "35", 2: "46"}},
+    6: {"test.txt": {1: "288", 2: "71503"}},
+    7: {"test.txt": {1: "6440", 2: "5905"}},
+    8: {"test0.txt": {1: "2"}, "test1.txt": {1: "6"}, "test2.txt": {2: "6"}},
+    9: {"test.txt": {1: "114", 2: "2"}},
+    10: {
+        "test0.txt": {1: "4"},
+        "test1.txt": {1: "8"},
+        "test2.txt": {2: "4"},
+        "test3.txt": {2: "8"},
+        "test4.txt": {2: "10"}
+    },
+    # self-generated pin for part 2
+    11: {"test.txt": {1: "374", 2: "82000210"}},
+    12: {"test.txt": {1: "21", 2: "525152"}},
+    13: {"test.txt": {1: "405", 2: "400"}},
+    14: {"test.txt": {1: "136", 2: "64"}},
+    15: {"test.txt": {1: "1320", 2: "145"}},
+    16: {"test.txt": {1: "46", 2: "51"}},
+    17: {"test.txt": {1: "102", 2: "94"}},
+    18: {"test.txt": {1: "62", 2: "952408144115"}},
+    19: {
+        "test.txt": {1: "19114", 2: "167409079868000"},
+        "test_crlf.txt": {1: "19114", 2: "167409079868000"}
+    },
+    20: {"test0.txt": {1: "32000000"}, "test1.txt": {1: "11687500"}},
+    # self-generated pin
+    21: {"test.txt": {1: "42"}},
+    22: {"test.txt": {1: "5", 2: "7"}},
+    23: {"test.txt": {1: "94", 2: "154"}},
+    # the example asks for a smaller test area than part 1 has built in
+    24: {},
+    25: {"test.txt": {1: "54"}}
+}
+
+
+@dataclass
+class CheckResult(object):
+    day: int
+    test: str
+    part: int
+    expected: str
+    answer: str | None = None
+    elapsed: float = 0.0
+    peak_memory: int | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __str__(self) -> str:
+        outcome = "ok" if self.ok else f"FAIL {self.error}"
+        peak = "" if self.peak_memory is None else f", {self.peak_memory / 1024:.1f} KiB"
+        return (
+            f"Day {self.day:>2} {self.test:<13} Part {self.part}: {outcome}"
+            f" ({self.elapsed * 1000:.1f} ms{peak})"
+        )
+
+
+def discover(day: Day) -> list[Path]:
+    directory = day.problem_class.default_input_file_path().parent
+    return sorted(directory.glob("test*.txt"))
+
+
+def solve(day: Day, input: bytes, part: int) -> str:
+    problem = day.problem_class.from_bytes(input)
+    solution = day.solution_class()
+    return str(solution.p1(problem) if part == 1 else solution.p2(problem))
+
+
+def check_part(
+    day: Day,
+    path: Path,
+    part: int,
+    expected: str,
+    time_budget: float,
+    memory_budget: int
+) -> CheckResult:
+    result = CheckResult(day.number, path.name, part, expected)
+    input = path.read_bytes()
+    signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, time_budget)
+    start = time.perf_counter()
+    try:
+        result.answer = solve(day, input, part)
+    except TaskTimeout:
+        result.error = f"over time budget of {time_budget * 1000:.0f} ms"
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        result.elapsed = time.perf_counter() - start
+    if result.error is not None:
+        return result
+    if result.answer != expected:
+        result.error = f"expected {expected}, got {result.answer}"
+        return result
+    tracemalloc.start()
+    try:
+        solve(day, input, part)
+        result.peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    if result.peak_memory > memory_budget:
+        result.error = f"over memory budget of {memory_budget / 1024:.0f} KiB"
+    return result
+
+
+def check_day(day: Day, time_budget: float, memory_budget: int) -> list[CheckResult]:
+    expected = EXPECTED.get(day.number, {})
+    results = []
+    for path in discover(day):
+        for part, answer in sorted(expected.get(path.name, {}).items()):
+            results.append(check_part(day, path, part, answer, time_budget, memory_budget))
+    return results
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 check")
+    argparser.add_argument("days", nargs="*", help="days to check, by default all")
+    argparser.add_argument(
+        "--time-budget",
+        "-t",
+        default=1000.0,
+        type=float,
+        help="milliseconds each test may take to parse and solve a part"
+    )
+    argparser.add_argument(
+        "--memory-budget",
+        "-m",
+        default=16384,
+        type=int,
+        help="KiB each test may allocate at its peak to parse and solve a part"
+    )
+    add_backend_argument(argparser)
+    args = argparser.parse_args(argv)
+    use_backend(args.backend)
+
+    days = [search_day(d) for d in args.days] if args.days else [DAYS[n] for n in DAYS]
+    results: list[CheckResult] = []
+    for day in days:
+        day_results = check_day(day, args.time_budget / 1000, args.memory_budget * 1024)
+        for result in day_results:
+            print(result, flush=True)
+        if not day_results:
+            print(f"Day {day.number:>2} has no tests with known answers", file=sys.stderr)
+        results.extend(day_results)
+
+    failed = [r for r in results if not r.ok]
+    print(f"{len(results) - len(failed)}/{len(results)} checks ok", file=sys.stderr)
+    return 1 if failed else 0
@@ -0,0 +1,92 @@
+"""
+Send requests to a running solver server, see adventofcode2023.server for the
+protocol.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import socket
+import sys
+import typing as t
+
+from adventofcode2023.server import SOCKET_ENV, default_socket_path
+
+
+def request(path: Path, message: dict[str, t.Any]) -> dict[str, t.Any]:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.connect(str(path))
+        with sock.makefile("rwb") as f:
+            f.write(json.dumps(message).encode() + b"\n")
+            f.flush()
+            return json.loads(f.readline())
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 client")
+    argparser.add_argument("day", nargs="?", help="day to solve")
+    argparser.add_argument(
+        "--part",
+        "-p",
+        default=0,
+        type=int,
+        choices=[1, 2],
+        help="which part to run, by default all"
+    )
+    argparser.add_argument(
+        "--infile",
+        "-i",
+        type=Path,
+        help="path to input file, the server uses the day's own input by default"
+    )
+    argparser.add_argument(
+        "--send-input",
+        action="store_true",
+        help="send the contents of the input file instead of its path"
+    )
+    argparser.add_argument(
+        "--socket",
+        type=Path,
+        default=default_socket_path(),
+        help=f"path of the server socket, defaults to {SOCKET_ENV} or the server default"
+    )
+    argparser.add_argument("--json", action="store_true", help="print the raw response")
+    command = argparser.add_mutually_exclusive_group()
+    command.add_argument("--ping", action="store_true", help="check that the server is up")
+    command.add_argument("--shutdown", action="store_true", help="stop the server")
+    args = argparser.parse_args(argv)
+
+    if args.ping or args.shutdown:
+        message: dict[str, t.Any] = {"op": "ping" if args.ping else "shutdown"}
+    elif args.day is None:
+        argparser.error("a day is needed to solve")
+    else:
+        message = {"op": "solve", "day": args.day, "part": args.part}
+        if args.infile and args.send_input:
+            message["input"] = args.infile.read_text()
+        elif args.infile:
+            # the server may run from another directory
+            message["path"] = str(args.infile.absolute())
+
+    try:
+        response = request(args.socket, message)
+    except (FileNotFoundError, ConnectionRefusedError) as e:
+        print(f"cannot reach server at {args.socket}: {e}", file=sys.stderr)
+        return 1
+
+    if args.json or "parts" not in response:
+        print(json.dumps(response))
+        return 0 if response.get("error") is None else 1
+    failed = response["error"] is not None
+    if failed:
+        print(f"error: {response["error"]}", file=sys.stderr)
+    for part, result in response["parts"].items():
+        if result["error"] is not None:
+            print(f"Part {part}: error: {result["error"]}")
+            failed = True
+        else:
+            print(f"Part {part}: {result["answer"]}")
+        print(f"  ({result["elapsed"] * 1000:.1f} ms)", file=sys.stderr)
+    if response["problem_cached"]:
+        print("(parsed problem was cached)", file=sys.stderr)
+    return 1 if failed else 0
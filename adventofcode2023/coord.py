@@ -0,0 +1,69 @@
+"""
+Coordinates shared by the days that move around a map or through space.
+
+Points are named tuples, which are much cheaper to build, hash and compare
+than dataclasses. Positions on a Grid are packed into a single int instead,
+their flat index, so stepping in a direction is adding the offset the grid
+precomputes for it.
+
+Directions are an IntEnum in clockwise order, so they hash and compare like
+the small ints they are and can index tables such as Grid.offsets.
+"""
+
+from enum import IntEnum
+import typing as t
+
+
+class Direction(IntEnum):
+    UP = 0, 0, -1, "^"
+    RIGHT = 1, 1, 0, ">"
+    DOWN = 2, 0, 1, "v"
+    LEFT = 3, -1, 0, "<"
+
+    dx: int
+    dy: int
+    symbol: str
+
+    def __new__(cls, value: int, dx: int, dy: int, symbol: str) -> "Direction":
+        member = int.__new__(cls, value)
+        member._value_ = value
+        member.dx = dx
+        member.dy = dy
+        member.symbol = symbol
+        return member
+
+    def offset(self, stride: int) -> int:
+        """distance between flat indices one step apart in this direction"""
+        return self.dy * stride + self.dx
+
+    def reverse(self) -> "Direction":
+        return DIRECTIONS[self ^ 2]
+
+    def turn_right(self) -> "Direction":
+        return DIRECTIONS[(self + 1) & 3]
+
+    def turn_left(self) -> "Direction":
+        return DIRECTIONS[(self - 1) & 3]
+
+
+DIRECTIONS: tuple[Direction, ...] = tuple(Direction)
+
+
+class Point(t.NamedTuple):
+    x: int
+    y: int
+
+    def __add__(self, other: "Point") -> "Point":
+        return Point(self.x + other.x, self.y + other.y)
+
+    def step(self, direction: Direction, distance: int = 1) -> "Point":
+        return Point(self.x + direction.dx * distance, self.y + direction.dy * distance)
+
+
+class Point3(t.NamedTuple):
+    x: int
+    y: int
+    z: int
+
+    def __add__(self, other: "Point3") -> "Point3":
+        return Point3(self.x + other.x, self.y + other.y, self.z + other.z)
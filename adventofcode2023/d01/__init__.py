@@ -1,8 +1,11 @@
+from collections import deque
+import typing as t
+
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
-VERBOSE_DIGITS: dict[str, int] = {
+WORDS: dict[str, int] = {
     "zero": 0,
     "one": 1,
     "two": 2,
@@ -13,39 +16,109 @@ VERBOSE_DIGITS: dict[str, int] = {
     "seven": 7,
     "eight": 8,
     "nine": 9
-} | {str(d): d for d in range(10)}
+}
+
+DIGITS: dict[str, int] = {str(d): d for d in range(10)}
+VERBOSE_DIGITS = WORDS | DIGITS
+
+# what a scanner finds at the end of every line
+LINE_END = 10
+
+
+class DigitScanner(object):
+    """
+    Aho-Corasick automaton finding the first and last digit word on every
+    line in a single pass over the bytes, with the failure links compiled into
+    a full transition table so every byte costs one lookup. Words may overlap,
+    in "eightwo" both eight and two are found.
+    """
+    def __init__(self, words: dict[str, int]):
+        goto: list[dict[int, int]] = [{}]
+        found = [-1]
+        for word, value in words.items():
+            state = 0
+            for b in word.encode():
+                if b not in goto[state]:
+                    goto[state][b] = len(goto)
+                    goto.append({})
+                    found.append(-1)
+                state = goto[state][b]
+            found[state] = value
+        # a state's transitions fall back on those of the longest proper
+        # suffix that is also in the trie, which is shallower so breadth first
+        # order always has its row ready
+        delta = [[0] * 256 for _ in goto]
+        delta[0] = [goto[0].get(b, 0) for b in range(256)]
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while len(queue) >= 1:
+            state = queue.popleft()
+            row = delta[state] = delta[fail[state]].copy()
+            for b, child in goto[state].items():
+                fail[child] = delta[fail[state]][b]
+                if found[child] == -1:
+                    found[child] = found[fail[child]]
+                row[b] = child
+                queue.append(child)
+        # every newline leads to an extra state that only marks the line end
+        line_end = len(delta)
+        delta.append(delta[0].copy())
+        found.append(LINE_END)
+        for row in delta:
+            row[ord("\n")] = line_end
+        self.delta = delta
+        self.found = found
+    
+    def scan(self, data: bytes) -> t.Generator[int]:
+        """
+        The calibration value of every line in data that has a digit on it,
+        without splitting data into lines
+        """
+        delta, found = self.delta, self.found
+        state = 0
+        first = last = -1
+        for b in data:
+            state = delta[state][b]
+            d = found[state]
+            if d < 0:
+                continue
+            if d == LINE_END:
+                if first >= 0:
+                    yield first * 10 + last
+                first = -1
+            elif first < 0:
+                first = last = d
+            else:
+                last = d
+        if first >= 0:
+            yield first * 10 + last
 
-VD_KEYS = set(VERBOSE_DIGITS.keys())
-VD_REVERSED = {k[::-1] for k in VD_KEYS}
+
+P1_SCANNER = DigitScanner(DIGITS)
+P2_SCANNER = DigitScanner(VERBOSE_DIGITS)
 
 
 class Problem01(Problem):
-    def __init__(self, vandalized: list[str]):
-        self.vandalized: list[str] = vandalized
+    def __init__(self, vandalized: t.Iterable[bytes]):
+        # chunks of whole lines, the whole input at once unless it is streamed
+        self.vandalized: t.Iterable[bytes] = vandalized
     
     @classmethod
     def from_str(cls, input: str) -> "Problem01":
-        return Problem01(input.splitlines())
+        return Problem01([input.encode()])
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Problem01":
+        return Problem01([data])
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem01":
+        return Problem01(line.encode() for line in lines)
 
 
 class Solution01(Solution):
     def p1(self, problem: Problem01) -> int:
-        return sum((p1_indiv(v) for v in problem.vandalized))
+        return sum(v for chunk in problem.vandalized for v in P1_SCANNER.scan(chunk))
     
     def p2(self, problem: Problem01) -> int:
-        return sum((p2_indiv(v) for v in problem.vandalized))
-
-
-def p1_indiv(vandalized: str) -> int:
-    first = int(next(c for c in vandalized if c.isdigit()))
-    last = int(next(c for c in vandalized[::-1] if c.isdigit()))
-    return first * 10 + last
-
-
-def p2_indiv(vandalized: str) -> int:
-    vand_rev = vandalized[::-1]
-    idx = lambda t: t[1]
-    # find first appearance of substring in string
-    first = min(((k, i) for k in VD_KEYS if (i := vandalized.find(k)) != -1), key=idx)
-    last = min(((r[::-1], i) for r in VD_REVERSED if (i := vand_rev.find(r)) != -1), key=idx)
-    return VERBOSE_DIGITS[first[0]] * 10 + VERBOSE_DIGITS[last[0]]
\ No newline at end of file
+        return sum(v for chunk in problem.vandalized for v in P2_SCANNER.scan(chunk))
\ No newline at end of file
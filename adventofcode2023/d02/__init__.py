@@ -1,77 +1,104 @@
-from dataclasses import dataclass
-import re
+from array import array
+import typing as t
 
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
-RED_RE = re.compile(r"(?P<n>\d+) red")
-GREEN_RE = re.compile(r"(?P<n>\d+) green")
-BLUE_RE = re.compile(r"(?P<n>\d+) blue")
-GAME_RE = re.compile(r"Game (?P<id>\d+)")
+GAME = b"Game"
+RED, GREEN, BLUE = b"rgb"
 
 
-@dataclass
-class Pick(object):
-    red: int = 0
-    green: int = 0
-    blue: int = 0
-    
-    @classmethod
-    def from_str(cls, input: str) -> "Pick":
-        red = RED_RE.search(input)
-        red = int(red.group("n")) if red else 0
-        green = GREEN_RE.search(input)
-        green = int(green.group("n")) if green else 0
-        blue = BLUE_RE.search(input)
-        blue = int(blue.group("n")) if blue else 0
-        return Pick(red=red, green=green, blue=blue)
-    
-    def is_ok(self, context: tuple[int, int, int]) -> bool:
-        return self.red <= context[0] and self.green <= context[1] and self.blue <= context[2]
+def tokenize_games(data: bytes) -> t.Generator[tuple[int, int, int, int]]:
+    """
+    The id and the most red, green and blue cubes shown of every game in
+    whole lines of games, in one pass over their words, which are either the
+    start of a game, its id, or a count followed by a color
+    """
+    words = iter(data.split())
+    id = red = green = blue = -1
+    for word in words:
+        if word == GAME:
+            if id >= 0:
+                yield id, red, green, blue
+            id = int(next(words)[:-1])
+            red = green = blue = 0
+            continue
+        n = int(word)
+        color = next(words)[0]
+        if color == RED:
+            red = max(red, n)
+        elif color == GREEN:
+            green = max(green, n)
+        else:
+            blue = max(blue, n)
+    if id >= 0:
+        yield id, red, green, blue
 
 
-@dataclass
-class Game(object):
-    id: int
-    picks: list[Pick]
+class Problem02(Problem):
+    """
+    Only the most cubes of each color shown in a game matter to either part,
+    so games are kept as columns of their ids and those maxima. Streamed
+    games are not stored at all, they are tokenized as they are solved, and
+    can only be solved once.
+    """
+    def __init__(
+        self,
+        context: tuple[int, int, int] = (12, 13, 14),
+        stream: t.Iterator[tuple[int, int, int, int]] | None = None
+    ):
+        self.ids = array("I")
+        self.red = array("I")
+        self.green = array("I")
+        self.blue = array("I")
+        self.context: tuple[int, int, int] = context
+        self.stream = stream
     
-    @classmethod
-    def from_str(cls, input: str) -> "Game":
-        id_picks = input.split(":")
-        id = int(GAME_RE.match(id_picks[0]).group("id"))
-        picks = [Pick.from_str(p) for p in id_picks[1].split(";")]
-        return Game(id=id, picks=picks)
+    def add_games(self, data: bytes):
+        for id, red, green, blue in tokenize_games(data):
+            self.ids.append(id)
+            self.red.append(red)
+            self.green.append(green)
+            self.blue.append(blue)
     
-    def min_context(self) -> tuple[int, int, int]:
-        red = max(pick.red for pick in self.picks)
-        green = max(pick.green for pick in self.picks)
-        blue = max(pick.blue for pick in self.picks)
-        return red, green, blue
+    def games(self) -> t.Iterable[tuple[int, int, int, int]]:
+        if self.stream is not None:
+            return self.stream
+        return zip(self.ids, self.red, self.green, self.blue)
     
-    def min_context_power(self) -> int:
-        red, green, blue = self.min_context()
-        return red * green * blue
-
-
-class Problem02(Problem):
-    def __init__(self, games: list[Game], context: tuple[int, int, int] = (12, 13, 14)):
-        self.games: list[Game] = games
-        self.context: tuple[int, int, int] = context
+    def possible_id_sums(self, contexts: t.Iterable[tuple[int, int, int]]) -> list[int]:
+        """
+        Sum of the ids of the games possible with each of the given contexts,
+        all in one pass over the games
+        """
+        contexts = list(contexts)
+        sums = [0] * len(contexts)
+        for id, r, g, b in self.games():
+            for k, (red, green, blue) in enumerate(contexts):
+                if r <= red and g <= green and b <= blue:
+                    sums[k] += id
+        return sums
     
     @classmethod
     def from_str(cls, input: str) -> "Problem02":
-        games = [Game.from_str(l) for l in input.splitlines()]
-        return Problem02(games=games)
+        return cls.from_bytes(input.encode())
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Problem02":
+        problem = Problem02()
+        problem.add_games(data)
+        return problem
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem02":
+        games = (game for line in lines for game in tokenize_games(line.encode()))
+        return Problem02(stream=games)
 
 
 class Solution02(Solution):
     def p1(self, problem: Problem02) -> int:
-        return sum(p1_indiv(game, problem.context) for game in problem.games)
+        return problem.possible_id_sums([problem.context])[0]
     
     def p2(self, problem: Problem02) -> int:
-        return sum(game.min_context_power() for game in problem.games)
-
-
-def p1_indiv(game: Game, context: tuple[int, int, int]) -> int:
-    return game.id if all(pick.is_ok(context) for pick in game.picks) else 0
\ No newline at end of file
+        return sum(r * g * b for _, r, g, b in problem.games())
\ No newline at end of file
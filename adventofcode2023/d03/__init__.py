@@ -1,100 +1,74 @@
+from array import array
+import re
 import typing as t
 
 
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
-from adventofcode2023.solution import Solution
+from adventofcode2023.solution import Solution, derived
+
+
+NUMBER_RE = re.compile(rb"[0-9]+")
+SYMBOL_RE = re.compile(rb"[^0-9.]")
+STAR = b"*"[0]
 
 
 class Problem03(Problem):
-    def __init__(self, schematic: list[str]):
+    def __init__(self, schematic: Grid):
         self.schematic = schematic
-        self.height = len(schematic)
-        self.width = len(schematic[0])
+        self.height = schematic.height
+        self.width = schematic.width
     
     @classmethod
     def from_str(cls, input: str) -> "Problem03":
-        return Problem03(schematic=input.splitlines())
-    
-    def get_symbols(self) -> t.Generator[tuple[int, int]]:
-        for y in range(self.height):
-            for x in range(self.width):
-                cell = self.schematic[y][x]
-                if not cell.isdigit() and cell != ".":
-                    yield x, y
+        # padding with "." ends numbers at the edges without bounds checks
+        return Problem03(schematic=Grid.from_str(input, fill=b"."))
     
-    def get_adjacent_cells_of(self, x: int, y: int) -> t.Generator[tuple[int, int]]:
-        def inner() -> t.Generator[tuple[int, int]]:
-            yield x - 1, y - 1
-            yield x, y - 1
-            yield x + 1, y - 1
-            yield x - 1, y
-            yield x + 1, y
-            yield x - 1, y + 1
-            yield x, y + 1
-            yield x + 1, y + 1
-        return ((x, y) for x, y in inner() if self.coordinates_exist(x, y))
+    def get_symbols(self) -> t.Generator[int]:
+        # the padding is all "." so only cells on the map can match
+        return (m.start() for m in SYMBOL_RE.finditer(self.schematic.cells))
     
-    def coordinates_exist(self, x: int, y: int) -> bool:
-        return 0 <= x < self.width and 0 <= y < self.height
+    def label_numbers(self) -> tuple[array, list[int]]:
+        """
+        Label every cell with the id of the number written over it, 0 if
+        there is none, along with the value of each number by id
+        """
+        cells = self.schematic.cells
+        labels = array("I", [0]) * len(cells)
+        values = [0]
+        for m in NUMBER_RE.finditer(cells):
+            start, end = m.span()
+            labels[start:end] = array("I", [len(values)]) * (end - start)
+            values.append(int(m.group()))
+        return labels, values
 
 
 class Solution03(Solution):
-    def __init__(self):
-        self.visited: set[tuple[int, int]] = set()
-    
-    def get_leftmost_digit(
-        self,
-        problem: Problem03,
-        x: int,
-        y: int,
-        ignore_visited: bool = True
-    ) -> tuple[int, int] | None:
-        if not problem.schematic[y][x].isdigit():
-            return None
-        while x >= 0:
-            if not problem.schematic[y][x].isdigit():
-                if (x + 1, y) in self.visited and ignore_visited:
-                    return None
-                else:
-                    return (x + 1, y)
-            x -= 1
-        return 0, y
-    
-    def visit_number(self, problem: Problem03, x: int, y: int) -> int:
-        number = 0
-        while problem.coordinates_exist(x, y) and (cell := problem.schematic[y][x]).isdigit():
-            number = number * 10 + int(cell)
-            self.visited.add((x, y))
-            x += 1
-        return number
+    @derived
+    def scan(self, problem: Problem03) -> tuple[int, int]:
+        """
+        Sum of part numbers and sum of gear ratios, in one pass over the
+        symbols, each looking up the ids of the numbers around it
+        """
+        labels, values = problem.label_numbers()
+        cells = problem.schematic.cells
+        neighbors = problem.schematic.neighbors8
+        counted = bytearray(len(values))
+        parts = gears = 0
+        for i in problem.get_symbols():
+            ids = {labels[i + offset] for offset in neighbors}
+            ids.discard(0)
+            for id in ids:
+                if not counted[id]:
+                    counted[id] = 1
+                    parts += values[id]
+            if cells[i] == STAR and len(ids) == 2:
+                a, b = ids
+                gears += values[a] * values[b]
+        return parts, gears
     
     def p1(self, problem: Problem03) -> int:
-        total = 0
-        for x, y in problem.get_symbols():
-            for ax, ay in problem.get_adjacent_cells_of(x, y):
-                val = self.get_leftmost_digit(problem, ax, ay, True)
-                if not val:
-                    continue
-                lx, ly = val
-                number = self.visit_number(problem, lx, ly)
-                total += number
-        return total
+        return self.scan(problem)[0]
     
     def p2(self, problem: Problem03) -> int:
-        total = 0
-        for x, y in problem.get_symbols():
-            self.visited.clear()
-            if problem.schematic[y][x] != "*":
-                continue
-            adjacents: list[int] = []
-            for ax, ay in problem.get_adjacent_cells_of(x, y):
-                val = self.get_leftmost_digit(problem, ax, ay, True)
-                if not val:
-                    continue
-                lx, ly = val
-                number = self.visit_number(problem, lx, ly)
-                adjacents.append(number)
-            if len(adjacents) != 2:
-                continue
-            total += adjacents[0] * adjacents[1]
-        return total
\ No newline at end of file
+        return self.scan(problem)[1]
\ No newline at end of file
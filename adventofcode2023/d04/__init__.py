@@ -1,35 +1,47 @@
-from collections import Counter
+from collections import deque
 from dataclasses import dataclass
+import typing as t
 
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
+def bitmask(numbers: t.Iterable[int]) -> int:
+    mask = 0
+    for n in numbers:
+        mask |= 1 << n
+    return mask
+
+
 @dataclass
 class Card(object):
-    winning: set[int]
-    given: set[int]
+    # bit n is set for each number n on the card
+    winning: int
+    given: int
     
-    def get_winning_numbers(self) -> set[int]:
-        return self.winning & self.given
+    def get_match_count(self) -> int:
+        return (self.winning & self.given).bit_count()
     
     def get_points(self) -> int:
-        return (1 << len(self.get_winning_numbers())) >> 1
+        return (1 << self.get_match_count()) >> 1
+    
+    @classmethod
+    def from_str(cls, line: str) -> "Card":
+        winning, given = line[line.find(":") + 1:].split("|")
+        return Card(bitmask(map(int, winning.split())), bitmask(map(int, given.split())))
 
 
 class Problem04(Problem):
-    def __init__(self, cards: list[Card]):
+    def __init__(self, cards: t.Iterable[Card]):
         self.cards = cards
     
     @classmethod
     def from_str(cls, input: str) -> "Problem04":
-        cards = []
-        for line in input.splitlines():
-            winning, given = line[line.find(":"):].split("|")
-            winning = {int(i) for i in winning.split(" ") if i.isdigit()}
-            given = {int(i) for i in given.split(" ") if i.isdigit()}
-            cards.append(Card(winning, given))
-        return Problem04(cards)
+        return Problem04([Card.from_str(line) for line in input.splitlines()])
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem04":
+        return Problem04(Card.from_str(line) for line in lines)
 
 
 class Solution04(Solution):
@@ -37,13 +49,23 @@ class Solution04(Solution):
         return sum(card.get_points() for card in problem.cards)
     
     def p2(self, problem: Problem04) -> int:
-        n_cards = len(problem.cards)
-        counter = Counter(range(n_cards)) # get one of each card
-        for i, card in enumerate(problem.cards):
-            points = len(card.get_winning_numbers())
-            copies = counter[i]
-            window = range(i+1, min(i+1+points, n_cards))
-            # get extra cards based on the number of copies of the current card you have
-            extra = Counter({k: v * copies for k, v in Counter(window).items()})
-            counter += extra
-        return sum(counter.values())
\ No newline at end of file
+        total = 0
+        # extra copies of the current card from all cards won so far
+        extra = 0
+        # how extra changes from one card to the next, starting with the next
+        # card, only as long as the most matches on a single card so cards can
+        # be streamed
+        changes: deque[int] = deque()
+        for card in problem.cards:
+            copies = 1 + extra
+            total += copies
+            matches = card.get_match_count()
+            if matches >= 1:
+                # every copy wins one copy each of the next matches cards
+                while len(changes) <= matches:
+                    changes.append(0)
+                changes[0] += copies
+                changes[matches] -= copies
+            extra += changes.popleft() if changes else 0
+        # copies won past the last card do not exist and are never counted
+        return total
\ No newline at end of file
@@ -1,47 +1,86 @@
+from bisect import bisect_right
 from dataclasses import dataclass
+import math
 import re
+import typing as t
 
-from adventofcode2023.problem import Problem
-from adventofcode2023.solution import Solution
+from adventofcode2023.problem import Problem, blocks, ints
+from adventofcode2023.solution import Solution, derived
 
 
 MAP_HEADER_RE = re.compile(r"^.* map:$")
 
 
-def subtract_range_from_range(a: tuple[int, int], b: tuple[int, int]) -> list[tuple[int, int]]:
+def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
     """
-    Subtract range b from range a, leaving a list of remaining ranges
+    Merge overlapping and touching half open ranges, sorting them first
     """
     result: list[tuple[int, int]] = []
-    if b[0] > a[0]:
-        result.append((a[0], min(b[0], a[1])))
-    if b[1] < a[1]:
-        result.append((max(b[1], a[0]), a[1]))
-    return result
-
-
-def merge_ranges(ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-    result = sorted(ranges)
-    i = 0
-    while i < len(result) - 1:
-        a = result[i]
-        b = result[i+1]
-        # disjoint
-        if a[1] < b[0] or a[0] > b[1]:
-            i += 1
-        else: # merge both ranges and replace them
-            c = min(a[0], b[0]), max(a[1], b[1])
-            result[i:i+2] = [c]
+    for start, end in sorted(ranges):
+        if result and start <= result[-1][1]:
+            if end > result[-1][1]:
+                result[-1] = result[-1][0], end
+        else:
+            result.append((start, end))
     return result
 
 
 @dataclass
-class ConversionResult(object):
-    changed: list[tuple[int, int]]
-    unchanged: list[tuple[int, int]]
-    
-    def combine(self) -> list[tuple[int, int]]:
-        return merge_ranges(self.changed + self.unchanged)
+class PiecewiseOffset(object):
+    """
+    A map from non-negative ints to ints that adds offsets[k] to every value
+    from starts[k] up to starts[k + 1], or on to infinity for the last piece.
+    starts is sorted and begins at 0, so the piece of a value is found with a
+    binary search.
+    """
+    starts: list[int]
+    offsets: list[int]
+    
+    def __call__(self, src: int) -> int:
+        return src + self.offsets[bisect_right(self.starts, src) - 1]
+    
+    def end(self, k: int) -> float:
+        return self.starts[k + 1] if k + 1 < len(self.starts) else math.inf
+    
+    def map_values(self, srcs: t.Iterable[int]) -> list[int]:
+        """every src mapped in O(log m) each, for m pieces"""
+        starts, offsets = self.starts, self.offsets
+        return [src + offsets[bisect_right(starts, src) - 1] for src in srcs]
+    
+    def map_ranges(self, src_ranges: t.Iterable[tuple[int, int]]) -> list[tuple[int, int]]:
+        """
+        Half open ranges of everything the src ranges map to, merged. Each
+        range costs O(log m) to find its first piece plus one step for every
+        piece it overlaps.
+        """
+        result: list[tuple[int, int]] = []
+        for start, end in src_ranges:
+            k = bisect_right(self.starts, start) - 1
+            while k < len(self.starts) and self.starts[k] < end:
+                offset = self.offsets[k]
+                result.append((max(start, self.starts[k]) + offset, min(end, self.end(k)) + offset))
+                k += 1
+        return merge_ranges(result)
+    
+    def then(self, other: "PiecewiseOffset") -> "PiecewiseOffset":
+        """
+        The map applying self and then other, splitting each piece of self
+        where its image crosses from one piece of other into the next
+        """
+        starts: list[int] = []
+        offsets: list[int] = []
+        for k, (start, offset) in enumerate(zip(self.starts, self.offsets)):
+            end = self.end(k)
+            j = bisect_right(other.starts, start + offset) - 1
+            while j < len(other.starts) and other.starts[j] - offset < end:
+                piece_start = max(start, other.starts[j] - offset)
+                piece_offset = offset + other.offsets[j]
+                # pieces that end up with the same offset are one piece
+                if not offsets or offsets[-1] != piece_offset:
+                    starts.append(piece_start)
+                    offsets.append(piece_offset)
+                j += 1
+        return PiecewiseOffset(starts, offsets)
 
 
 @dataclass
@@ -58,28 +97,6 @@ class MappingRange(object):
     def diff(self) -> int:
         return self.dest_start - self.src_start
     
-    def contains_src(self, src: int) -> bool:
-        return 0 <= (src - self.src_start) < self.length
-    
-    def convert_src(self, src: int) -> int:
-        if self.contains_src(src):
-            return src + self.dest_start - self.src_start
-        else:
-            return src
-    
-    def contained_src_range(self, src_range: tuple[int, int]) -> tuple[int, int]:
-        start = max(src_range[0], self.src_start)
-        end = max(min(src_range[1], self.src_end), start)
-        return start, end
-    
-    def convert_src_range(self, src_range: tuple[int, int]) -> ConversionResult:
-        contained_range = self.contained_src_range(src_range)
-        if contained_range[0] >= contained_range[1]:
-            return ConversionResult(changed=[], unchanged=[src_range])
-        unchanged = subtract_range_from_range(src_range, contained_range)
-        changed = contained_range[0] + self.diff, contained_range[1] + self.diff
-        return ConversionResult(unchanged=unchanged, changed=[changed])
-    
     @classmethod
     def from_str(cls, line: str) -> "MappingRange":
         splat = line.split(" ")
@@ -95,32 +112,24 @@ class MappingRange(object):
 class MappingCollection(object):
     ranges: list[MappingRange]
     
-    def find_containing_ranges(self, src: int) -> list[MappingRange]:
-        return [r for r in self.ranges if r.contains_src(src)]
-    
-    def convert_src(self, src: int) -> int:
-        containing_ranges = self.find_containing_ranges(src)
-        if not containing_ranges:
-            return src
-        elif len(containing_ranges) == 1:
-            return containing_ranges[0].convert_src(src)
-        else:
-            raise ValueError("multiple ranges contain the same src")
-    
-    def convert_src_ranges(self, src_ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        conversion_result = ConversionResult(unchanged=src_ranges, changed=[])
-        for mapping_range in self.ranges:
-            changed = [c for c in conversion_result.changed] # add already changed ranges
-            unchanged = []
-            for src_range in conversion_result.unchanged:
-                cr = mapping_range.convert_src_range(src_range)
-                unchanged.extend(cr.unchanged)
-                changed.extend(cr.changed)
-            conversion_result = ConversionResult(
-                changed=merge_ranges(changed),
-                unchanged=merge_ranges(unchanged)
-            )
-        return conversion_result.combine()
+    def to_piecewise(self) -> PiecewiseOffset:
+        """
+        The ranges as pieces, with pieces that keep values as they are in
+        the gaps between them
+        """
+        starts: list[int] = [0]
+        offsets: list[int] = [0]
+        for r in sorted(self.ranges, key=lambda r: r.src_start):
+            if r.src_start < starts[-1]:
+                raise ValueError("multiple ranges contain the same src")
+            if r.src_start == starts[-1]:
+                offsets[-1] = r.diff
+            else:
+                starts.append(r.src_start)
+                offsets.append(r.diff)
+            starts.append(r.src_end)
+            offsets.append(0)
+        return PiecewiseOffset(starts, offsets)
     
     @classmethod
     def from_str(self, lines: list[str]) -> "MappingCollection":
@@ -141,17 +150,12 @@ class MappingCollection(object):
 class ChainedMappings(object):
     mapping_collections: list[MappingCollection]
     
-    def convert_src(self, src: int) -> int:
-        dest = src
+    def compose(self) -> PiecewiseOffset:
+        """all the mappings one after the other as a single map"""
+        composed = PiecewiseOffset([0], [0])
         for collection in self.mapping_collections:
-            dest = collection.convert_src(dest)
-        return dest
-    
-    def convert_src_ranges(self, src_ranges: list[tuple[int, int]]) -> list[tuple[int, int]]:
-        dest_ranges = src_ranges
-        for collection in self.mapping_collections:
-            dest_ranges = collection.convert_src_ranges(dest_ranges)
-        return dest_ranges
+            composed = composed.then(collection.to_piecewise())
+        return composed
 
 
 class Problem05(Problem):
@@ -167,11 +171,28 @@ class Problem05(Problem):
         map_header_indices = [i for i, line in enumerate(lines) if MAP_HEADER_RE.match(line)]
         mapping_collections = [MappingCollection.from_str(lines[i:]) for i in map_header_indices]
         return Problem05(seeds, ChainedMappings(mapping_collections))
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Problem05":
+        # maps are separated by blank lines and their headers have no digits,
+        # so the numbers of a map are all of its ranges back to back
+        seeds, *maps = blocks(data)
+        mapping_collections = []
+        for block in maps:
+            numbers = ints(block)
+            mapping_collections.append(MappingCollection([
+                MappingRange(*numbers[i:i+3]) for i in range(0, len(numbers), 3)
+            ]))
+        return Problem05(ints(seeds), ChainedMappings(mapping_collections))
 
 
 class Solution05(Solution):
+    @derived
+    def almanac(self, problem: Problem05) -> PiecewiseOffset:
+        return problem.chained_mappings.compose()
+    
     def p1(self, problem: Problem05) -> int:
-        return min(problem.chained_mappings.convert_src(seed) for seed in problem.seeds)
+        return min(self.almanac(problem).map_values(problem.seeds))
     
     def p2(self, problem: Problem05) -> int:
-        return problem.chained_mappings.convert_src_ranges(problem.seed_ranges)[0][0]
\ No newline at end of file
+        return self.almanac(problem).map_ranges(problem.seed_ranges)[0][0]
\ No newline at end of file
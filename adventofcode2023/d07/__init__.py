@@ -124,13 +124,15 @@ class Problem07(Problem):
         return Problem07(hands)
     
 
+def total_winnings(hands: list[Hand]) -> int:
+    ranked = sorted(hands)
+    return sum((i + 1) * hand.bid for i, hand in enumerate(ranked))
+
+
 class Solution07(Solution):
     def p1(self, problem: Problem07) -> int:
-        ranked = sorted(problem.hands)
-        winnings = sum((i + 1) * hand.bid for i, hand in enumerate(ranked))
-        return winnings
+        return total_winnings(problem.hands)
     
     def p2(self, problem: Problem07) -> int:
-        for hand in problem.hands:
-            hand.wildcard_joker = True
-        return self.p1(problem)
\ No newline at end of file
+        # copy the hands so that part 1 still sees normal jokers afterwards
+        return total_winnings([Hand(h.representation, h.bid, True) for h in problem.hands])
\ No newline at end of file
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from functools import partial
 import math
 import typing as t
 
@@ -33,14 +34,21 @@ class Problem08(Problem):
         return Problem08(instructions, nodes)
 
 
+def is_zzz(name: str) -> bool:
+    return name == "ZZZ"
+
+
+def ends_with_z(name: str) -> bool:
+    return name.endswith("Z")
+
+
 class Solution08(Solution):
     def p1(
         self,
         problem: Problem08,
         starting_node: str = "AAA",
-        matcher: t.Callable[[str], bool] | None = None
+        matcher: t.Callable[[str], bool] = is_zzz
     ) -> int:
-        matcher = (lambda s: s == "ZZZ") if matcher is None else matcher
         steps = 1
         current_node = problem.nodes[starting_node]
         while True:
@@ -57,9 +65,11 @@ class Solution08(Solution):
     
     def p2(self, problem: Problem08) -> int:
         starting_nodes = [name for name in problem.nodes.keys() if name.endswith("A")]
-        steps_required = [
-            self.p1(problem, start, lambda s: s.endswith("Z"))
-            for start in starting_nodes
-        ]
+        # the walks are independent, and with a process pool the problem and
+        # matcher are pickled along with each chunk of starts
+        steps_required = self.parallel_map(
+            partial(self.p1, problem, matcher=ends_with_z),
+            starting_nodes
+        )
         # assumes no substring of instructions repeats the entire thing
         return math.lcm(*steps_required)
\ No newline at end of file
@@ -1,3 +1,5 @@
+import typing as t
+
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
@@ -18,14 +20,16 @@ def get_nested_diffs(history: list[int]) -> list[list[int]]:
 
 
 class Problem09(Problem):
-    def __init__(self, histories: list[list[int]]):
+    def __init__(self, histories: t.Iterable[list[int]]):
         self.histories = histories
     
     @classmethod
     def from_str(cls, input: str) -> "Problem09":
-        lines = input.splitlines()
-        histories = [[int(val) for val in line.split(" ")] for line in lines]
-        return Problem09(histories)
+        return Problem09(list(cls.from_lines(input.splitlines()).histories))
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem09":
+        return Problem09([int(val) for val in line.split(" ")] for line in lines)
 
 
 class Solution09(Solution):
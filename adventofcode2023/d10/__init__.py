@@ -3,8 +3,9 @@ from enum import Enum
 import math
 import typing as t
 
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
-from adventofcode2023.solution import Solution
+from adventofcode2023.solution import Solution, derived
 
 
 @dataclass
@@ -93,35 +94,42 @@ class Pipe(PipeDataMixin, Enum):
         return self.visual in {"L", "J", "7", "F"}
 
 
+PIPES: dict[int, Pipe] = {ord(pipe.visual): pipe for pipe in Pipe}
+
+
 class Problem10(Problem):
-    def __init__(self, grid: list[list[Pipe]]):
-        self.height = len(grid)
-        self.width = len(grid[0])
+    def __init__(self, grid: Grid):
+        self.height = grid.height
+        self.width = grid.width
         self.grid = grid
-        for y, line in enumerate(grid):
-            for x, pipe in enumerate(line):
-                if pipe == Pipe.Start:
-                    self.s_coord = x, y
+        self.s_coord = grid.coords(grid.cells.find(b"S"))
     
     @classmethod
     def from_str(cls, input: str) -> "Problem10":
-        grid = [[Pipe.from_str(s) for s in line] for line in input.splitlines()]
+        # ground around the edges connects to nothing, so no bounds checks are needed
+        grid = Grid.from_str(input, fill=b".")
+        if unrecognized := grid.cells.translate(None, bytes(PIPES)):
+            raise ValueError(f"unrecognized pipe: {chr(unrecognized[0])}")
         return Problem10(grid)
+    
+    def pipe_at(self, x: int, y: int) -> Pipe:
+        return PIPES[self.grid[x, y]]
 
 
 class Solution10(Solution):
+    @derived
     def get_history(self, problem: Problem10) -> list[tuple[int, int]]:
         sx, sy = problem.s_coord
         x, y = None, None
         
         # check which of the pipes neighbouring start is connected to start
-        if sy >= 1 and problem.grid[sy-1][sx].south:
+        if problem.pipe_at(sx, sy - 1).south:
             x, y = sx, sy - 1
-        if sy+1 < problem.height and problem.grid[sy+1][sx].north:
+        if problem.pipe_at(sx, sy + 1).north:
             x, y = sx, sy + 1
-        if sx+1 < problem.width and problem.grid[sy][sx+1].west:
+        if problem.pipe_at(sx + 1, sy).west:
             x, y = sx + 1, sy
-        if sx >= 1 and problem.grid[sy][sx-1].east:
+        if problem.pipe_at(sx - 1, sy).east:
             x, y = sx - 1, sy
         
         if x is None or y is None:
@@ -130,11 +138,11 @@ class Solution10(Solution):
         history: list[tuple[int, int]] = [(sx, sy)]
         
         while True:
-            pipe = problem.grid[y][x]
+            pipe = problem.pipe_at(x, y)
             px, py = history[-1]
             # do not visit previous
             n = next(filter(lambda n: n != (px, py), pipe.neighbors_of(x, y)))
-            next_pipe = problem.grid[n[1]][n[0]]
+            next_pipe = problem.pipe_at(*n)
             if next_pipe == Pipe.Ground:
                 raise ValueError("wtf")
             history.append((x, y))
@@ -157,9 +165,10 @@ class Solution10(Solution):
         if topology == 0:
             raise ValueError("expected a loop!")
         topology = 1 if topology > 0 else -1 if topology < 0 else 0
-        visited: list[list[bool]] = [[False] * problem.width for _ in range(problem.height)]
+        grid = problem.grid
+        visited = grid.mask()
         for x, y in history:
-            visited[y][x] = True
+            visited[grid.index(x, y)] = True
         nest_size = 0
         
         # hx, hy are the coordinates to the current pipe
@@ -186,32 +195,25 @@ class Solution10(Solution):
         # mark the 4 ground cells in the top right
         for (hx, hy), (dx, dy), (pdx, pdy) in zip(history[1:], directions[1:], directions):
             dx, dy = side_of_direction((dx, dy), topology)
-            dfs: list[tuple[int, int]] = []
+            dfs: list[int] = []
             # get side of the path that is "inside"
-            x, y = hx + dx, hy + dy
-            if not visited[y][x]:
-                dfs.append((x, y))
-                visited[y][x] = True
+            i = grid.index(hx + dx, hy + dy)
+            if not visited[i]:
+                dfs.append(i)
+                visited[i] = True
             pdx, pdy = side_of_direction((pdx, pdy), topology)
-            x, y = hx + pdx, hy + pdy
-            if problem.grid[hy][hx].is_corner() and not visited[y][x]:
-                dfs.append((x, y))
-                visited[y][x] = True
+            i = grid.index(hx + pdx, hy + pdy)
+            if problem.pipe_at(hx, hy).is_corner() and not visited[i]:
+                dfs.append(i)
+                visited[i] = True
+            # the border is marked as visited, so the fill never leaves the grid
             while len(dfs) >= 1:
-                x, y = dfs.pop()
+                i = dfs.pop()
                 nest_size += 1
-                if y >= 1 and not visited[y-1][x]:
-                    dfs.append((x, y-1))
-                    visited[y-1][x] = True
-                if y+1 < problem.height and not visited[y+1][x]:
-                    dfs.append((x, y+1))
-                    visited[y+1][x] = True
-                if x+1 < problem.width and not visited[y][x+1]:
-                    dfs.append((x+1, y))
-                    visited[y][x+1] = True
-                if x >= 1 and not visited[y][x-1]:
-                    dfs.append((x-1, y))
-                    visited[y][x-1] = True
+                for offset in grid.neighbors4:
+                    if not visited[n := i + offset]:
+                        dfs.append(n)
+                        visited[n] = True
         
         # for row in visited:
             # print("".join("I" if v else "." for v in row))
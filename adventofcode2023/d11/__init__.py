@@ -1,3 +1,4 @@
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
@@ -10,11 +11,8 @@ class Problem11(Problem):
     
     @classmethod
     def from_str(cls, input: str) -> "Problem11":
-        points: list[tuple[int, int]] = []
-        for y, line in enumerate(input.splitlines()):
-            for x, cell in enumerate(line):
-                if cell == "#":
-                    points.append((x, y))
+        grid = Grid.from_str(input, pad=0)
+        points = [grid.coords(i) for i in grid.find_all(b"#")]
         width = max(points, key=lambda p: p[0])[0] + 1
         height = max(points, key=lambda p: p[1])[1] + 1
         return Problem11(points, width, height)
@@ -23,6 +21,9 @@ class Problem11(Problem):
 class Solution11(Solution):
     def p1(self, problem: Problem11, expansion_factor: int = 2) -> int:
         expansion_factor -= 1 # for part 2
+        if self.backend == "numpy":
+            from adventofcode2023.d11.arrays import distance_sum
+            return distance_sum(problem.points, problem.width, problem.height, expansion_factor)
         empty_columns = sorted(set(range(problem.width)) - {x for x, _ in problem.points})
         empty_rows = sorted(set(range(problem.height)) - {y for _, y in problem.points})
         expanded_points = problem.points.copy()
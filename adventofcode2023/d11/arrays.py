@@ -0,0 +1,26 @@
+import numpy as np
+
+
+def expand(coords: np.ndarray, size: int, expansion_factor: int) -> np.ndarray:
+    occupied = np.zeros(size, dtype=bool)
+    occupied[coords] = True
+    # empty rows or columns before each coordinate
+    empty_before = np.cumsum(~occupied)
+    return coords + empty_before[coords] * expansion_factor
+
+
+def pairwise_distance_sum(coords: np.ndarray) -> int:
+    # once sorted, the i-th coordinate is subtracted by every later one and
+    # added to every earlier one
+    coords = np.sort(coords)
+    n = len(coords)
+    weights = 2 * np.arange(n, dtype=np.int64) - (n - 1)
+    return int(np.dot(coords, weights))
+
+
+def distance_sum(points: list[tuple[int, int]], width: int, height: int, expansion_factor: int) -> int:
+    xs, ys = np.array(points, dtype=np.int64).reshape(-1, 2).T
+    return (
+        pairwise_distance_sum(expand(xs, width, expansion_factor))
+        + pairwise_distance_sum(expand(ys, height, expansion_factor))
+    )
@@ -1,41 +1,50 @@
 from dataclasses import dataclass
 from functools import cache
+import typing as t
 
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
-@cache
-def record_combos(row: str, sizes: tuple[int, ...]) -> int:
-    if len(row) == 0:
-        return int(len(sizes) == 0)
-    row_size = len(row)
-    match row[0]:
-        case ".":
-            i = 0
-            while i < row_size:
-                if row[i] == ".":
-                    i += 1
-                else:
-                    break
-            return record_combos(row[i:], sizes)
-        case "?":
-            # sum of number of combinations starting with '.' and
-            # those starting with '#'
-            return record_combos(row[1:], sizes) + record_combos("#" + row[1:], sizes)
-        case "#":
-            if len(sizes) == 0 or row_size < sizes[0]:
-                return 0
-            # check if prefix of the row can contain a stretch of damaged
-            # springs whose length equals sizes[0]
-            if all(c == "#" or c == "?" for c in row[:sizes[0]]):
-                # implies prefix has length greater than first stretch
-                if row_size > sizes[0] and row[sizes[0]] == "#":
+def memoized_record_combos() -> t.Callable[[str, tuple[int, ...]], int]:
+    """
+    A fresh memo for every record: arrangements are rarely shared between
+    records, and records solved in parallel threads then never clear or fill
+    each other's memo.
+    """
+    @cache
+    def record_combos(row: str, sizes: tuple[int, ...]) -> int:
+        if len(row) == 0:
+            return int(len(sizes) == 0)
+        row_size = len(row)
+        match row[0]:
+            case ".":
+                i = 0
+                while i < row_size:
+                    if row[i] == ".":
+                        i += 1
+                    else:
+                        break
+                return record_combos(row[i:], sizes)
+            case "?":
+                # sum of number of combinations starting with '.' and
+                # those starting with '#'
+                return record_combos(row[1:], sizes) + record_combos("#" + row[1:], sizes)
+            case "#":
+                if len(sizes) == 0 or row_size < sizes[0]:
                     return 0
+                # check if prefix of the row can contain a stretch of damaged
+                # springs whose length equals sizes[0]
+                if all(c == "#" or c == "?" for c in row[:sizes[0]]):
+                    # implies prefix has length greater than first stretch
+                    if row_size > sizes[0] and row[sizes[0]] == "#":
+                        return 0
+                    else:
+                        return record_combos(row[sizes[0]+1:], sizes[1:])
                 else:
-                    return record_combos(row[sizes[0]+1:], sizes[1:])
-            else:
-                return 0
+                    return 0
+    
+    return record_combos
 
 
 @dataclass
@@ -49,25 +58,50 @@ class Record(object):
         sizes = [int(s) for s in sizes.split(",")]
         return Record(row, sizes)
     
-    def combos(self) -> int:
-        return record_combos(self.row, tuple(self.sizes))
+    def unfold(self, unfolding: int) -> "Record":
+        return Record("?".join([self.row]*unfolding), self.sizes*unfolding)
+    
+    def combos(self) -> tuple[int, int, int]:
+        """
+        Number of arrangements, along with the memo hits and misses it took
+        to count them.
+        """
+        # the memo is dropped along with record_combos, which keeps memory
+        # flat no matter how many records there are
+        record_combos = memoized_record_combos()
+        combos = record_combos(self.row, tuple(self.sizes))
+        info = record_combos.cache_info()
+        return combos, info.hits, info.misses
 
 
 class Problem12(Problem):
-    def __init__(self, records: list[Record]):
+    def __init__(self, records: t.Iterable[Record]):
         self.records = records
     
     @classmethod
     def from_str(cls, input: str) -> "Problem12":
         return Problem12([Record.from_str(line) for line in input.splitlines()])
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem12":
+        return Problem12(Record.from_str(line) for line in lines)
 
 
 class Solution12(Solution):
+    def total(self, counts: t.Iterable[tuple[int, int, int]]) -> int:
+        total = hits = misses = 0
+        for combos, h, m in counts:
+            total += combos
+            hits += h
+            misses += m
+        self.metrics.add("memo_hits", hits)
+        self.metrics.add("memo_misses", misses)
+        return total
+    
     def p1(self, problem: Problem12) -> int:
-        return sum(record.combos() for record in problem.records)
+        # records may be streamed, so they are counted one at a time
+        return self.total(record.combos() for record in problem.records)
     
     def p2(self, problem: Problem12, unfolding: int = 5) -> int:
-        return sum(
-            Record("?".join([record.row]*unfolding), record.sizes*unfolding).combos()
-            for record in problem.records
-        )
\ No newline at end of file
+        records = (record.unfold(unfolding) for record in problem.records)
+        return self.total(self.parallel_map(Record.combos, records))
\ No newline at end of file
@@ -1,48 +1,48 @@
-from functools import reduce
+from functools import partial, reduce
 
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
-def column_at(pattern: list[list[bool]], x: int) -> list[bool]:
-    return [row[x] for row in pattern]
+# rows and columns become bitmasks, with a bit set for every rock
+BITS = bytes.maketrans(b"#.", b"10")
 
 
-def transpose(pattern: list[list[bool]]) -> list[list[bool]]:
-    return [column_at(pattern, x) for x in range(len(pattern[0]))]
+def line_masks(lines: list[bytes]) -> list[int]:
+    return [int(line.translate(BITS), 2) for line in lines]
 
 
-def diff_count(a: list[bool], b: list[bool]) -> int:
-    return sum(int(a ^ b) for a, b in zip(a, b))
+def diff_count(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
 
 
-def diff_total(pattern: list[list[bool]], y: int) -> int:
+def diff_total(lines: list[int], y: int) -> int:
     i, j = y, y + 1
-    height = len(pattern)
+    height = len(lines)
     diff_total = 0
     while i >= 0 and j < height:
-        diff_total += diff_count(pattern[i], pattern[j])
+        diff_total += diff_count(lines[i], lines[j])
         i -= 1
         j += 1
     return diff_total
 
 
-def check_symmetry(pattern: list[list[bool]], y: int, diff: int = 0) -> bool:
-    return diff_total(pattern, y) == diff
+def check_symmetry(lines: list[int], y: int, diff: int = 0) -> bool:
+    return diff_total(lines, y) == diff
 
 
-def get_symmetry(pattern: list[list[bool]], diff: int = 0) -> tuple[int, int]:
-    height = len(pattern)
-    width = len(pattern[0])
-    transposed = transpose(pattern)
+def get_symmetry(pattern: Grid, diff: int = 0) -> tuple[int, int]:
+    rows = line_masks(pattern.rows())
+    columns = line_masks(pattern.columns())
     res_x = 0
-    for x in range(width - 1):
-        if check_symmetry(transposed, x, diff):
+    for x in range(pattern.width - 1):
+        if check_symmetry(columns, x, diff):
             res_x = x + 1
             break
     res_y = 0
-    for y in range(height - 1):
-        if check_symmetry(pattern, y, diff):
+    for y in range(pattern.height - 1):
+        if check_symmetry(rows, y, diff):
             res_y = y + 1
             break
     return res_x, res_y
@@ -53,30 +53,36 @@ def tuple_sum(a: tuple[int, ...], b: tuple[int, ...]) -> tuple[int, ...]:
 
 
 class Problem13(Problem):
-    def __init__(self, patterns: list[list[list[bool]]]):
+    def __init__(self, patterns: list[Grid]):
         self.patterns = patterns
     
     @classmethod
     def from_str(cls, input: str) -> "Problem13":
-        patterns: list[list[list[bool]]] = []
-        pattern: list[list[bool]] = []
+        patterns: list[Grid] = []
+        pattern: list[str] = []
         for line in input.splitlines():
             if len(line) == 0:
-                patterns.append(pattern)
+                patterns.append(Grid.from_lines(pattern, pad=0))
                 pattern = []
             else:
-                pattern.append([c == "#" for c in line])
+                pattern.append(line)
         else:
             if len(pattern) >= 1:
-                patterns.append(pattern)
+                patterns.append(Grid.from_lines(pattern, pad=0))
         return Problem13(patterns)
 
 
 class Solution13(Solution):
-    def p1(self, problem: Problem13) -> int:
-        x, y = reduce(tuple_sum, map(get_symmetry, problem.patterns))
+    def summarize(self, problem: Problem13, diff: int = 0) -> int:
+        if self.backend == "numpy":
+            from adventofcode2023.d13.arrays import get_symmetry as symmetry
+        else:
+            symmetry = get_symmetry
+        x, y = reduce(tuple_sum, self.parallel_map(partial(symmetry, diff=diff), problem.patterns))
         return x + y * 100
     
+    def p1(self, problem: Problem13) -> int:
+        return self.summarize(problem)
+    
     def p2(self, problem: Problem13) -> int:
-        x, y = reduce(tuple_sum, map(lambda p: get_symmetry(p, 1), problem.patterns))
-        return x + y * 100
\ No newline at end of file
+        return self.summarize(problem, 1)
\ No newline at end of file
@@ -0,0 +1,29 @@
+import numpy as np
+
+from adventofcode2023.grid import Grid
+
+
+ROCK = ord("#")
+
+
+def fold_totals(lines: np.ndarray) -> np.ndarray:
+    """
+    Number of mismatched cells when folding between line y and y + 1, for
+    every y.
+    """
+    n = len(lines)
+    mismatches = (lines[:, None, :] != lines[None, :, :]).sum(axis=2)
+    # the fold between y and y + 1 pairs up lines i < j with i + j = 2y + 1
+    i, j = np.triu_indices(n, k=1)
+    totals = np.bincount(i + j, weights=mismatches[i, j], minlength=2 * n)
+    return totals[1:2 * n - 2:2]
+
+
+def first_fold(lines: np.ndarray, diff: int) -> int:
+    folds = np.flatnonzero(fold_totals(lines) == diff)
+    return int(folds[0]) + 1 if len(folds) >= 1 else 0
+
+
+def get_symmetry(pattern: Grid, diff: int = 0) -> tuple[int, int]:
+    rocks = np.frombuffer(pattern.cells, dtype=np.uint8).reshape(pattern.height, pattern.width) == ROCK
+    return first_fold(rocks.T, diff), first_fold(rocks, diff)
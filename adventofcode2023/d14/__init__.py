@@ -1,74 +1,60 @@
 from dataclasses import dataclass
-from enum import Enum
+import typing as t
 
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
-class Rock(Enum):
-    EMPTY = "."
-    ROUND = "O"
-    CUBE = "#"
+EMPTY = b"."
+ROUND = b"O"
+CUBE = b"#"
 
 
-def tilt_left(row: list[Rock]) -> list[Rock]:
-    new_row = []
-    round_counter = 0
-    prev_cube = -1
-    
-    def insert_rocks(i: int):
-        empty_counter = i - prev_cube - 1 - round_counter
-        assert empty_counter >= 0
-        new_row.extend([Rock.ROUND] * round_counter + [Rock.EMPTY] * empty_counter + [Rock.CUBE])
-    
-    for i, rock in enumerate(row):
-        match rock:
-            case Rock.ROUND: round_counter += 1
-            case Rock.CUBE:
-                insert_rocks(i)
-                prev_cube = i
-                round_counter = 0
-    else:
-        insert_rocks(len(row))
-        new_row.pop() # remove last cube
-    return new_row
+def tilt_left(row: bytes) -> bytes:
+    # round rocks roll to the start of each run between cube rocks
+    return CUBE.join(
+        ROUND * (n := run.count(ROUND)) + EMPTY * (len(run) - n)
+        for run in row.split(CUBE)
+    )
+
 
+def tilt_right(row: bytes) -> bytes:
+    return tilt_left(row[::-1])[::-1]
 
-def load_left(row: list[Rock], length: int = None) -> int:
+
+def load_left(row: bytes, length: int = None) -> int:
     length = length or len(row)
-    return sum((length - x) if row[x] == Rock.ROUND else 0 for x in range(length))
+    return sum((length - x) if row[x] == ROUND[0] else 0 for x in range(length))
 
 
 @dataclass
 class Platform(object):
-    rocks: list[list[Rock]]
+    rocks: Grid
     
-    def clone_empty_and_cube(self) -> "Platform":
-        rocks = [[Rock.EMPTY if c == Rock.EMPTY else Rock.CUBE for c in row] for row in self.rocks]
+    def tilt_rows(self, tilt: t.Callable[[bytes], bytes]) -> "Platform":
+        rocks = self.rocks.copy()
+        for y, row in enumerate(self.rocks.rows()):
+            rocks.set_row(y, tilt(row))
         return Platform(rocks)
     
-    def transpose(self) -> "Platform":
-        height = len(self.rocks)
-        width = len(self.rocks[0])
-        return Platform([[self.rocks[y][x] for y in range(height)] for x in range(width)])
-    
-    def reverse_horizontally(self) -> "Platform":
-        width = len(self.rocks[0])
-        return Platform([[row[-x-1] for x in range(width)] for row in self.rocks])
+    def tilt_columns(self, tilt: t.Callable[[bytes], bytes]) -> "Platform":
+        rocks = self.rocks.copy()
+        for x, column in enumerate(self.rocks.columns()):
+            rocks.set_column(x, tilt(column))
+        return Platform(rocks)
     
     def tilt_west(self) -> "Platform":
-        return Platform([tilt_left(row) for row in self.rocks])
+        return self.tilt_rows(tilt_left)
     
     def tilt_north(self) -> "Platform":
-        return self.transpose().tilt_west().transpose()
+        return self.tilt_columns(tilt_left)
     
     def tilt_east(self) -> "Platform":
-        return self.reverse_horizontally().tilt_west().reverse_horizontally()
+        return self.tilt_rows(tilt_right)
     
     def tilt_south(self) -> "Platform":
-        return self.transpose().reverse_horizontally()\
-            .tilt_west()\
-            .reverse_horizontally().transpose()
+        return self.tilt_columns(tilt_right)
     
     def tilt_cycle(self) -> "Platform":
         return self.tilt_north().tilt_west().tilt_south().tilt_east()
@@ -91,15 +77,14 @@ class Platform(object):
         
     
     def load_north(self) -> int:
-        height = len(self.rocks)
-        width = len(self.rocks[0])
-        return sum(load_left([row[x] for row in self.rocks], height) for x in range(width))
+        height = self.rocks.height
+        return sum(load_left(column, height) for column in self.rocks.columns())
     
     def __hash__(self):
-        return hash(str(self))
+        return hash(bytes(self.rocks.cells))
     
     def __str__(self) -> str:
-        return "\n".join("".join(rock.value for rock in row) for row in self.rocks)
+        return str(self.rocks)
 
 
 class Problem14(Problem):
@@ -108,13 +93,21 @@ class Problem14(Problem):
     
     @classmethod
     def from_str(cls, input: str) -> "Problem14":
-        platform = [[Rock(c) for c in row] for row in input.splitlines()]
-        return Problem14(Platform(platform))
+        rocks = Grid.from_str(input, pad=0)
+        if unrecognized := rocks.cells.translate(None, EMPTY + ROUND + CUBE):
+            raise ValueError(f"{chr(unrecognized[0])!r} is not a valid Rock")
+        return Problem14(Platform(rocks))
 
 
 class Solution14(Solution):
     def p1(self, problem: Problem14) -> int:
+        if self.backend == "numpy":
+            from adventofcode2023.d14.arrays import tilted_north_load
+            return tilted_north_load(problem.platform.rocks)
         return problem.platform.tilt_north().load_north()
     
     def p2(self, problem: Problem14) -> int:
+        if self.backend == "numpy":
+            from adventofcode2023.d14.arrays import cycled_north_load
+            return cycled_north_load(problem.platform.rocks)
         return problem.platform.tilt_cycles().load_north()
\ No newline at end of file
@@ -0,0 +1,65 @@
+import numpy as np
+
+from adventofcode2023.grid import Grid
+
+
+EMPTY = ord(".")
+ROUND = ord("O")
+CUBE = ord("#")
+
+
+def tilt_left(rocks: np.ndarray) -> np.ndarray:
+    """
+    Roll every round rock to the start of its run between cube rocks, all
+    rows at once.
+    """
+    height, width = rocks.shape
+    cells = rocks.ravel()
+    cube = cells == CUBE
+    # runs start at every row, cube rock, and cell after a cube rock
+    starts = cube.copy()
+    starts[1:] |= cube[:-1]
+    starts[::width] = True
+    run = np.cumsum(starts) - 1
+    indices = np.arange(len(cells))
+    offset = indices - np.maximum.accumulate(np.where(starts, indices, 0))
+    rounds = np.bincount(run, weights=cells == ROUND, minlength=run[-1] + 1)
+    tilted = np.where(offset < rounds[run], ROUND, EMPTY).astype(np.uint8)
+    tilted[cube] = CUBE
+    return tilted.reshape(height, width)
+
+
+def tilt_cycle(rocks: np.ndarray) -> np.ndarray:
+    rocks = tilt_left(np.ascontiguousarray(rocks.T)).T # north
+    rocks = tilt_left(np.ascontiguousarray(rocks)) # west
+    rocks = tilt_left(np.ascontiguousarray(rocks.T[:, ::-1]))[:, ::-1].T # south
+    return tilt_left(np.ascontiguousarray(rocks[:, ::-1]))[:, ::-1] # east
+
+
+def load_north(rocks: np.ndarray) -> int:
+    height = rocks.shape[0]
+    return int(((rocks == ROUND).sum(axis=1) * np.arange(height, 0, -1)).sum())
+
+
+def to_array(grid: Grid) -> np.ndarray:
+    return np.frombuffer(grid.cells, dtype=np.uint8).reshape(grid.height, grid.width)
+
+
+def tilted_north_load(grid: Grid) -> int:
+    return load_north(tilt_left(np.ascontiguousarray(to_array(grid).T)).T)
+
+
+def cycled_north_load(grid: Grid, n: int = 1000000000) -> int:
+    visited: dict[bytes, int] = {}
+    history: list[np.ndarray] = []
+    rocks = to_array(grid)
+    for i in range(n):
+        key = rocks.tobytes()
+        if (j := visited.get(key)) is not None:
+            # same as Platform.tilt_cycles, the platform n cycles in is the
+            # one as far into the loop as n is
+            return load_north(history[j + (n - i) % (i - j)])
+        visited[key] = i
+        history.append(rocks)
+        rocks = tilt_cycle(rocks)
+    return load_north(rocks)
@@ -1,40 +1,12 @@
-from dataclasses import dataclass
 from enum import Enum
-import operator
-import typing as t
+from functools import partial
 
+from adventofcode2023.coord import Direction, Point
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
 
 
-@dataclass(unsafe_hash=True)
-class Vector(object):
-    x: int
-    y: int
-    
-    def splat(self) -> tuple[int, int]:
-        return self.x, self.y
-    
-    def apply_ortho(self, func: t.Callable[[int, int], int], other: "Vector") -> "Vector":
-        return Vector(func(self.x, other.x), func(self.y, other.y))
-    
-    def __add__(self, other: "Vector") -> "Vector":
-        return self.apply_ortho(operator.add, other)
-    
-    def __sub__(self, other: "Vector") -> "Vector":
-        return self.apply_ortho(operator.sub, other)
-    
-    def __matmul__(self, other: "Vector") -> int:
-        return self.x * other.x + self.y * other.y
-
-
-class Direction(Vector, Enum):
-    UP = 0, -1
-    DOWN = 0, 1
-    LEFT = -1, 0
-    RIGHT = 1, 0
-
-
 class Tile(Enum):
     EMPTY = "."
     FRONT_MIRROR = "/"
@@ -71,104 +43,78 @@ PASSTHROUGH: dict[tuple[Tile, Direction], list[Direction]] = (
 )
 
 
-@dataclass
-class TileState(object):
-    tile: Tile
-    up: int = 0
-    down: int = 0
-    left: int = 0
-    right: int = 0
-
-    def reset(self) -> "TileState":
-        self.up = 0
-        self.down = 0
-        self.left = 0
-        self.right = 0
-        return self
-    
-    def visited(self, direction: Direction) -> bool:
-        match direction:
-            case Direction.UP: return self.up >= 1
-            case Direction.DOWN: return self.down >= 1
-            case Direction.LEFT: return self.left >= 1
-            case Direction.RIGHT: return self.right >= 1
-    
-    def visited_any(self) -> bool:
-        return (self.up + self.down + self.left + self.right) >= 1
-    
-    def visit(self, direction: Direction) -> bool:
-        match direction:
-            case Direction.UP: self.up += 1
-            case Direction.DOWN: self.down += 1
-            case Direction.LEFT: self.left += 1
-            case Direction.RIGHT: self.right += 1
-
-
-@dataclass
-class StatefulLayout(object):
-    m: list[list[TileState]]
-    
-    @classmethod
-    def from_layout(cls, layout: list[list[Tile]]) -> "StatefulLayout":
-        return StatefulLayout([[TileState(tile) for tile in row] for row in layout])
-    
-    def reset(self) -> "StatefulLayout":
-        for row in self.m:
-            for tile in row:
-                tile.reset()
-    
-    def count_visited(self) -> int:
-        return sum(sum(int(t.visited_any()) for t in row) for row in self.m)
+TILES: dict[int, Tile] = {ord(tile.value): tile for tile in Tile}
+# directions light leaves each tile byte in, indexed by the direction it came in
+LIGHT: dict[int, tuple[list[Direction], ...]] = {
+    byte: tuple(tile.passthrough_light(d) for d in Direction) for byte, tile in TILES.items()
+}
 
 
 class Problem16(Problem):
-    def __init__(self, layout: list[list[Tile]]):
+    def __init__(self, layout: Grid):
         self.layout = layout
-        self.height = len(layout)
-        self.width = len(layout)
+        self.height = layout.height
+        self.width = layout.width
     
     @classmethod
     def from_str(cls, input: str) -> "Problem16":
-        layout = [[Tile(c) for c in line] for line in input.splitlines()]
+        layout = Grid.from_str(input)
+        if unrecognized := layout.cells.translate(None, bytes(TILES) + b"\0"):
+            raise ValueError(f"{chr(unrecognized[0])!r} is not a valid Tile")
         return Problem16(layout)
 
 
+def energize(layout: Grid, initial_point: Point, initial_direction: Direction) -> tuple[int, int]:
+    """
+    Number of tiles energized by a beam entering at initial_point, and the
+    number of beam steps traced to find out.
+    """
+    cells = layout.cells
+    offsets = layout.offsets
+    # a bit per direction a beam has gone through each cell in
+    visited = bytearray(len(cells))
+    # beams are packed as index << 2 | direction
+    dfs: list[int] = [layout.index(*initial_point) << 2 | initial_direction]
+    traced = 0
+    while len(dfs) >= 1:
+        beam = dfs.pop()
+        traced += 1
+        i = beam >> 2
+        bit = 1 << (beam & 3)
+        if visited[i] & bit:
+            continue
+        visited[i] |= bit
+        for d in LIGHT[cells[i]][beam & 3]:
+            n = i + offsets[d]
+            # beams leave the layout at the border
+            if cells[n] == layout.fill:
+                continue
+            dfs.append(n << 2 | d)
+    return len(visited) - visited.count(0), traced
+
+
 class Solution16(Solution):
     def p1(
         self,
         problem: Problem16,
-        initial_vector: Vector = Vector(0, 0),
+        initial_point: Point = Point(0, 0),
         initial_direction: Direction = Direction.RIGHT
     ) -> int:
-        tiles = StatefulLayout.from_layout(problem.layout)
-        dfs: list[tuple[Vector, Direction]] = [(initial_vector, initial_direction)]
-        while len(dfs) >= 1:
-            vector, direction = dfs.pop()
-            x, y = vector.splat()
-            tile = tiles.m[y][x]
-            if tile.visited(direction):
-                continue
-            tile.visit(direction)
-            directions = tile.tile.passthrough_light(direction)
-            for d in directions:
-                nx, ny = x + d.x, y + d.y
-                if nx < 0 or nx >= problem.width or ny < 0 or ny >= problem.height:
-                    continue
-                dfs.append((Vector(nx, ny), d))
-        return tiles.count_visited()
+        energized, traced = energize(problem.layout, initial_point, initial_direction)
+        self.metrics.add("beams_traced", traced)
+        self.metrics.add("starts_traced")
+        return energized
     
     def p2(self, problem: Problem16) -> int:
-        e = max(self.p1(problem, Vector(x, 0), Direction.DOWN) for x in range(problem.width))
-        e = max(e, *(
-            self.p1(problem, Vector(x, problem.height - 1), Direction.UP)
-            for x in range(problem.width)
-        ))
-        e = max(e, *(
-            self.p1(problem, Vector(0, y), Direction.RIGHT)
-            for y in range(problem.height)
-        ))
-        e = max(e, *(
-            self.p1(problem, Vector(problem.width - 1, y), Direction.LEFT)
-            for y in range(problem.height)
-        ))
-        return e
\ No newline at end of file
+        width, height = problem.width, problem.height
+        starts = (
+            [(Point(x, 0), Direction.DOWN) for x in range(width)]
+            + [(Point(x, height - 1), Direction.UP) for x in range(width)]
+            + [(Point(0, y), Direction.RIGHT) for y in range(height)]
+            + [(Point(width - 1, y), Direction.LEFT) for y in range(height)]
+        )
+        points, directions = zip(*starts)
+        results = list(self.parallel_map(partial(energize, problem.layout), points, directions))
+        self.metrics.add("beams_traced", sum(traced for _, traced in results))
+        self.metrics.add("starts_traced", len(results))
+        return max(energized for energized, _ in results)
\ No newline at end of file
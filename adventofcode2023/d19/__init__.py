@@ -1,7 +1,7 @@
 from dataclasses import dataclass
 import typing as t
 
-from adventofcode2023.problem import Problem
+from adventofcode2023.problem import Problem, blocks, ints
 from adventofcode2023.solution import Solution
 
 
@@ -14,6 +14,15 @@ class Part(object):
     
     def sum(self) -> int:
         return self.x + self.m + self.a + self.s
+    
+    @classmethod
+    def from_str(cls, line: str) -> "Part":
+        fields = line[1:-1].split(",")
+        x = int(fields[0][2:])
+        m = int(fields[1][2:])
+        a = int(fields[2][2:])
+        s = int(fields[3][2:])
+        return Part(x, m, a, s)
 
 
 @dataclass
@@ -134,6 +143,14 @@ class Workflow(object):
             + "}"
         )
     
+    @classmethod
+    def from_str(cls, line: str) -> "Workflow":
+        name, raw_conditions = line.split("{")
+        raw_conditions = raw_conditions[:-1].split(",")
+        conditions = [Condition.from_str(raw) for raw in raw_conditions[:-1]]
+        otherwise = raw_conditions[-1]
+        return Workflow(name, conditions, otherwise)
+    
     def run(self, part: Part) -> str:
         for condition in self.conditions:
             if condition.check(part):
@@ -182,32 +199,41 @@ class Series(object):
 
 
 class Problem19(Problem):
-    def __init__(self, series: Series, parts: list[Part]):
+    def __init__(self, series: Series, parts: t.Iterable[Part]):
         self.series = series
         self.parts = parts
     
     @classmethod
     def from_str(cls, input: str) -> "Problem19":
-        lines = iter(input.splitlines())
+        problem = cls.from_lines(input.splitlines())
+        problem.parts = list(problem.parts)
+        return problem
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem19":
+        """
+        Workflows are read eagerly, parts are only read as part 1 consumes them
+        """
+        lines = iter(lines)
         workflows = []
         for line in lines:
             if line == "":
                 break
-            name, raw_conditions = line.split("{")
-            raw_conditions = raw_conditions[:-1].split(",")
-            conditions = [Condition.from_str(raw) for raw in raw_conditions[:-1]]
-            otherwise = raw_conditions[-1]
-            workflows.append(Workflow(name, conditions, otherwise))
+            workflows.append(Workflow.from_str(line))
         series = Series.from_iter(workflows)
-        parts = []
-        for line in lines:
-            fields = line[1:-1].split(",")
-            x = int(fields[0][2:])
-            m = int(fields[1][2:])
-            a = int(fields[2][2:])
-            s = int(fields[3][2:])
-            parts.append(Part(x, m, a, s))
-        return Problem19(series, parts)
+        return Problem19(series, (Part.from_str(line) for line in lines))
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Problem19":
+        """
+        There are far more parts than workflows, so only the workflows are
+        decoded, the ratings of the parts are read in bulk
+        """
+        workflows, parts = blocks(data, maxsplit=1)
+        lines = workflows.decode().splitlines()
+        series = Series.from_iter(Workflow.from_str(line) for line in lines)
+        n = ints(parts)
+        return Problem19(series, [Part(*n[i:i+4]) for i in range(0, len(n), 4)])
 
 
 class Solution19(Solution):
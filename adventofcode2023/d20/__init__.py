@@ -139,6 +139,7 @@ class Manager(object):
     configuration: Configuration
     pulses: list[Pulse] = dataclasses.field(default_factory=list)
     frontier_index: int = 0
+    processed: int = 0
     
     def press_button(self):
         self.pulses.append(Pulse("button", False, "broadcaster"))
@@ -150,6 +151,7 @@ class Manager(object):
         pulses = self.configuration.modules[pulse.destination].receive_and_send_across(pulse)
         self.pulses.extend(pulses)
         self.frontier_index += 1
+        self.processed += 1
         return True
     
     def get_pulse_report(self) -> tuple[int, int]:
@@ -183,6 +185,7 @@ class Solution20(Solution):
             while manager.run_once():
                 pass
         # print("\n".join(str(p) for p in manager.pulses))
+        self.metrics.add("pulses_processed", manager.processed)
         low, high = manager.get_pulse_report()
         return low * high
     
@@ -206,4 +209,6 @@ class Solution20(Solution):
                     fc_inputs.remove(pulse.source)
             manager.pulses = []
             manager.frontier_index = 0
+        self.metrics.add("button_presses", p)
+        self.metrics.add("pulses_processed", manager.processed)
         return math.lcm(*fc_inputs_first_seen.values())
\ No newline at end of file
@@ -1,70 +1,50 @@
-from dataclasses import dataclass
-from enum import Enum
-
+from adventofcode2023.coord import Point
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
-from adventofcode2023.solution import Solution
-
-
-@dataclass(unsafe_hash=True)
-class Vector(object):
-    x: int
-    y: int
-    
-    def __add__(self, other: "Vector") -> "Vector":
-        return Vector(self.x + other.x, self.y + other.y)
+from adventofcode2023.solution import Solution, derived
 
 
-@dataclass(unsafe_hash=True)
-class DirectionMixin(Vector):
-    s: str
-
-
-class Direction(DirectionMixin, Enum):
-    UP = 0, -1, "^"
-    DOWN = 0, 1, "v"
-    LEFT = -1, 0, "<"
-    RIGHT = 1, 0, ">"
+PLOT = ord(".")
 
 
 class Problem21(Problem):
-    def __init__(self, garden: list[str]):
-        self.height = len(garden)
-        self.width = len(garden[0])
+    def __init__(self, garden: Grid):
+        self.height = garden.height
+        self.width = garden.width
         start = 0, 0
-        for y in range(self.height):
-            for x in range(self.width):
-                if garden[y][x] == "S":
-                    start = x, y
+        if (i := garden.cells.find(b"S")) != -1:
+            start = garden.coords(i)
         x, y = start
-        garden[y] = garden[y][:x] + "." + garden[y][x+1:]
+        garden[x, y] = PLOT
         self.garden = garden
-        self.start = Vector(x, y)
+        self.start = Point(x, y)
     
     @classmethod
     def from_str(cls, input: str) -> "Problem21":
-        return Problem21(input.splitlines())
-    
-    def is_valid_coord(self, v: Vector) -> bool:
-        x, y = v.x, v.y
-        return 0 <= x < self.width and 0 <= y < self.height
+        # rocks all around keep every walk inside the garden
+        return Problem21(Grid.from_str(input, fill=b"#"))
 
 
 class Solution21(Solution):
-    def visit(self, problem: Problem21, max_steps: int | None = None) -> dict[Vector, int]:
+    @derived
+    def visit(self, problem: Problem21, max_steps: int | None = None) -> dict[int, int]:
         max_steps = max_steps or max(problem.height, problem.width)
-        visits: dict[Vector, int] = {problem.start: 0}
-        frontier: set[Vector] = {problem.start}
+        garden = problem.garden
+        cells = garden.cells
+        start = garden.index(*problem.start)
+        if self.backend == "numpy":
+            from adventofcode2023.d21.arrays import visit
+            return visit(garden, start, max_steps)
+        # steps to each plot, keyed by its flat index into the garden
+        visits: dict[int, int] = {start: 0}
+        frontier: set[int] = {start}
         i = 1
         while i <= max_steps and len(frontier) >= 1:
-            new_frontier = set[Vector]()
+            new_frontier = set[int]()
             for v in frontier:
-                for d in Direction:
+                for d in garden.neighbors4:
                     n = v + d
-                    if (
-                        problem.is_valid_coord(n)
-                        and n not in visits
-                        and problem.garden[n.y][n.x] == "."
-                    ):
+                    if n not in visits and cells[n] == PLOT:
                         new_frontier.add(n)
             frontier = new_frontier
             visits |= {v: i for v in new_frontier}
@@ -72,7 +52,13 @@ class Solution21(Solution):
         return visits
     
     def p1(self, problem: Problem21, steps: int = 64) -> int:
-        return len(list(v for v in self.visit(problem, steps).values() if v % 2 == steps % 2))
+        # distances up to steps are the same as in the full search part 2 needs,
+        # so share that search if part 2 is next and it goes far enough
+        if self.solving_both and steps <= max(problem.height, problem.width):
+            visited = self.visit(problem)
+        else:
+            visited = self.visit(problem, steps)
+        return len(list(v for v in visited.values() if v <= steps and v % 2 == steps % 2))
     
     # https://github.com/villuna/aoc23/wiki/A-Geometric-solution-to-advent-of-code-2023,-day-21
     # 26501365 = 65 + (202300 * 131) where n = 202300
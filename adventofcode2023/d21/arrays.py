@@ -0,0 +1,29 @@
+import numpy as np
+
+from adventofcode2023.grid import Grid
+
+
+PLOT = ord(".")
+
+
+def visit(garden: Grid, start: int, max_steps: int) -> dict[int, int]:
+    """
+    Same as Solution21.visit, growing the whole frontier a step at a time over
+    the flat cells. Rocks all around the garden stop a shift from wrapping
+    around onto plots.
+    """
+    plots = np.frombuffer(garden.cells, dtype=np.uint8) == PLOT
+    steps = np.full(len(plots), -1, dtype=np.int64)
+    steps[start] = 0
+    frontier = np.zeros(len(plots), dtype=bool)
+    frontier[start] = True
+    i = 1
+    while i <= max_steps and frontier.any():
+        reached = np.zeros_like(frontier)
+        for d in garden.neighbors4:
+            reached |= np.roll(frontier, d)
+        frontier = reached & plots & (steps < 0)
+        steps[frontier] = i
+        i += 1
+    visited = np.flatnonzero(steps >= 0)
+    return dict(zip(visited.tolist(), steps[visited].tolist()))
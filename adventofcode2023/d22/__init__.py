@@ -3,7 +3,7 @@ from functools import cache
 import typing as t
 
 from adventofcode2023.problem import Problem
-from adventofcode2023.solution import Solution
+from adventofcode2023.solution import Solution, derived
 
 
 @dataclass(unsafe_hash=True)
@@ -120,15 +120,13 @@ class Problem22(Problem):
 
 
 class Solution22(Solution):
-    def __init__(self):
-        super().__init__()
-        self.tetris: Tetris | None = None
-    
+    @derived
     def tetrify(self, problem: Problem22) -> Tetris:
-        if self.tetris is None:
-            self.tetris = problem.tetris
-            self.tetris.stabilize()
-        return self.tetris
+        # bricks are replaced rather than mutated when they fall, so a shallow
+        # copy leaves the problem itself untouched
+        tetris = Tetris(problem.tetris.bricks.copy())
+        tetris.stabilize()
+        return tetris
     
     def p1(self, problem: Problem22) -> int:
         tetris = self.tetrify(problem)
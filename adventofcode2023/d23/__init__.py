@@ -2,32 +2,10 @@ from dataclasses import dataclass, field
 from enum import Enum
 import typing as t
 
+from adventofcode2023.coord import Direction
+from adventofcode2023.grid import Grid
 from adventofcode2023.problem import Problem
-from adventofcode2023.solution import Solution
-
-
-@dataclass(unsafe_hash=True)
-class Vector(object):
-    x: int
-    y: int
-    
-    def __add__(self, other: "Vector") -> "Vector":
-        return Vector(self.x + other.x, self.y + other.y)
-
-
-@dataclass(unsafe_hash=True)
-class DirectionMixin(Vector):
-    s: str
-
-
-class Direction(DirectionMixin, Enum):
-    UP = 0, -1, "^"
-    DOWN = 0, 1, "v"
-    LEFT = -1, 0, "<"
-    RIGHT = 1, 0, ">"
-    
-    def to_tile(self) -> "Tile":
-        return Tile(self.s)
+from adventofcode2023.solution import Solution, derived
 
 
 class Tile(Enum):
@@ -52,80 +30,90 @@ class Tile(Enum):
             case _: return Tile.PATH
 
 
+TILES: dict[int, Tile] = {ord(tile.value): tile for tile in Tile}
+FOREST = ord(Tile.FOREST.value)
+# turns every slope into a path for part 2
+TO_P2 = bytes.maketrans(
+    bytes(ord(tile.value) for tile in Tile),
+    bytes(ord(tile.to_p2().value) for tile in Tile)
+)
+
+
 @dataclass
 class Park(object):
-    tiles: list[list[Tile]]
+    # forest all around, so walks never leave the park, and positions are
+    # flat indices into tiles
+    tiles: Grid
     height: int = field(init=False)
     width: int = field(init=False)
-    junctions: set[Vector] = field(init=False)
-    neighbors_cache: dict[Vector, list[Vector]] = field(init=False, default_factory=dict)
-    neighboring_junctions_cache: dict[Vector, dict[Vector, set[Vector]]] = field(
+    # only depends on where the forest is, so it can be passed on to a park
+    # with the same forest instead of scanning again
+    junctions: set[int] | None = None
+    neighbors_cache: dict[int, list[int]] = field(init=False, default_factory=dict)
+    neighboring_junctions_cache: dict[int, dict[int, set[int]]] = field(
         init=False,
         default_factory=dict
     )
     
     def __post_init__(self):
-        self.height = len(self.tiles)
-        self.width = len(self.tiles[0])
+        self.height = self.tiles.height
+        self.width = self.tiles.width
         
-        self.junctions = set[Vector]()
-        for y in range(self.height):
-            for x in range(self.width):
-                if self.tiles[y][x] == Tile.FOREST:
-                    continue
-                v = Vector(x, y)
-                ways = sum(self.is_valid_tile(v + d) for d in Direction)
-                if ways != 2:
-                    self.junctions.add(v)
+        if self.junctions is not None:
+            return
+        self.junctions = set[int]()
+        for v in self.iter_valid_tiles():
+            ways = sum(self.is_valid_tile(v + d) for d in self.tiles.neighbors4)
+            if ways != 2:
+                self.junctions.add(v)
     
     @property
-    def start(self) -> Vector:
-        return Vector(1, 0)
+    def start(self) -> int:
+        return self.tiles.index(1, 0)
     
     @property
-    def end(self) -> Vector:
-        return Vector(self.width - 2, self.height - 1)
+    def end(self) -> int:
+        return self.tiles.index(self.width - 2, self.height - 1)
     
     @classmethod
     def from_str(cls, input: str) -> "Park":
-        return Park([[Tile(c) for c in line] for line in input.splitlines()])
+        tiles = Grid.from_str(input, fill=b"#")
+        if unrecognized := tiles.cells.translate(None, bytes(TILES)):
+            raise ValueError(f"{chr(unrecognized[0])!r} is not a valid Tile")
+        return Park(tiles)
     
     def to_p2(self) -> "Park":
-        return Park([[t.to_p2() for t in row] for row in self.tiles])
+        tiles = self.tiles
+        p2_tiles = Grid(tiles.width, tiles.height, tiles.cells.translate(TO_P2), tiles.pad, tiles.fill)
+        return Park(p2_tiles, self.junctions)
     
-    def is_valid_coord(self, v: Vector) -> bool:
-        return 0 <= v.x < self.width and 0 <= v.y < self.height
+    def is_valid_tile(self, v: int) -> bool:
+        return self.tiles.cells[v] != FOREST
     
-    def is_valid_tile(self, v: Vector) -> bool:
-        return self.is_valid_coord(v) and self.tiles[v.y][v.x] != Tile.FOREST
+    def iter_valid_tiles(self) -> t.Generator[int]:
+        return (v for v in self.tiles.indices() if self.is_valid_tile(v))
     
-    def iter_valid_coords(self) -> t.Generator[Vector]:
-        return (Vector(x, y) for x in range(self.width) for y in range(self.height))
-    
-    def iter_valid_tiles(self) -> t.Generator[Vector]:
-        return (v for v in self.iter_valid_coords() if self.is_valid_tile(v))
-    
-    def neighbors_of(self, v: Vector) -> list[Vector]:
+    def neighbors_of(self, v: int) -> list[int]:
         if v in self.neighbors_cache:
             return self.neighbors_cache[v]
-        match self.tiles[v.y][v.x]:
+        match TILES[self.tiles.cells[v]]:
             case Tile.FOREST: ns = []
-            case Tile.PATH: ns = [w for d in Direction if self.is_valid_tile(w := v + d)]
+            case Tile.PATH: ns = [w for d in self.tiles.neighbors4 if self.is_valid_tile(w := v + d)]
             case tile:
                 d = tile.to_slope()
                 assert d is not None
-                w = v + d
+                w = v + self.tiles.offsets[d]
                 ns = [w] if self.is_valid_tile(w) else []
         self.neighbors_cache[v] = ns
         return ns
     
-    def neighbors_of_excluding(self, v: Vector, exclude: set[Vector]) -> list[Vector]:
+    def neighbors_of_excluding(self, v: int, exclude: set[int]) -> list[int]:
         return [v for v in self.neighbors_of(v) if v not in exclude]
     
-    def neighboring_junctions_of(self, v: Vector) -> dict[Vector, set[Vector]]:
+    def neighboring_junctions_of(self, v: int) -> dict[int, set[int]]:
         if v in self.neighboring_junctions_cache:
             return self.neighboring_junctions_cache[v]
-        result = dict[Vector, set[Vector]]()
+        result = dict[int, set[int]]()
         hikes = [Hike(self, {v}, n) for n in self.neighbors_of(v)]
         while len(hikes) >= 1:
             hike = hikes.pop(0)
@@ -146,8 +134,8 @@ class Park(object):
 @dataclass
 class Hike(object):
     park: Park
-    visited: set[Vector]
-    current: Vector
+    visited: set[int]
+    current: int
     
     def __len__(self) -> int:
         return len(self.visited)
@@ -181,9 +169,9 @@ class Hike(object):
 
 @dataclass
 class JunctionHike(object):
-    graph: dict[Vector, dict[Vector, int]] = field(repr=False)
-    visited: set[Vector]
-    current: Vector
+    graph: dict[int, dict[int, int]] = field(repr=False)
+    visited: set[int]
+    current: int
     distance: int = 0
     
     def __hash__(self) -> int:
@@ -216,26 +204,33 @@ class Problem23(Problem):
 
 
 class Solution23(Solution):
+    @derived
+    def park_p2(self, problem: Problem23) -> Park:
+        return problem.park.to_p2()
+    
     def solve(self, park: Park) -> int:
         # adjacency matrix between different junctions, dead ends, start and end points
-        junction_graph = dict[Vector, dict[Vector, int]]()
+        junction_graph = dict[int, dict[int, int]]()
         for v in park.junctions:
             junction_graph[v] = {}
             for n, s in park.neighboring_junctions_of(v).items():
                 junction_graph[v][n] = len(s)
         starting_hike = JunctionHike(junction_graph, set(), park.start, 0)
         longest: int = 0
+        expanded: int = 0
         stack: list[JunctionHike] = [starting_hike]
         while len(stack) >= 1:
             hike = stack.pop()
+            expanded += 1
             if hike.current == park.end:
                 longest = max(longest, hike.distance)
             for n in hike.next_hikes():
                 stack.append(n)
+        self.metrics.add("hikes_expanded", expanded)
         return longest
     
     def p1(self, problem: Problem23) -> int:
         return self.solve(problem.park)
     
     def p2(self, problem: Problem23) -> int:
-        return self.solve(problem.park.to_p2())
\ No newline at end of file
+        return self.solve(self.park_p2(problem))
\ No newline at end of file
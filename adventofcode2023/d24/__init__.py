@@ -3,31 +3,22 @@ from pathlib import Path
 import subprocess
 import typing as t
 
-from adventofcode2023.problem import Problem
+from adventofcode2023.coord import Point3
+from adventofcode2023.problem import Problem, ints
 from adventofcode2023.solution import Solution
 
 
-@dataclass(unsafe_hash=True)
-class Vector(object):
-    x: int
-    y: int
-    z: int
-    
-    def __add__(self, other: "Vector") -> "Vector":
-        return Vector(self.x + other.x, self.y + other.y, self.z + other.z)
-
-
 @dataclass(unsafe_hash=True)
 class Hailstone(object):
-    p: Vector
-    v: Vector
+    p: Point3
+    v: Point3
     
     @classmethod
     def from_str(cls, input: str) -> "Hailstone":
         splat = input.split("@")
         px, py, pz = tuple(int(s) for s in splat[0].split(", "))
         vx, vy, vz = tuple(int(s) for s in splat[1].split(", "))
-        return Hailstone(Vector(px, py, pz), Vector(vx, vy, vz))
+        return Hailstone(Point3(px, py, pz), Point3(vx, vy, vz))
     
     def __str__(self):
         p, v = self.p, self.v
@@ -54,6 +45,13 @@ class Problem24(Problem):
     @classmethod
     def from_str(cls, input: str) -> "Problem24":
         return Problem24([Hailstone.from_str(line) for line in input.splitlines()])
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Problem24":
+        n = ints(data, signed=True)
+        return Problem24([
+            Hailstone(Point3(*n[i:i+3]), Point3(*n[i+3:i+6])) for i in range(0, len(n), 6)
+        ])
 
 
 def find_intersection_xy_time(
@@ -116,6 +114,9 @@ class Solution24(Solution):
     def p1(self, problem: Problem24) -> int:
         min_coord: int = 200000000000000
         max_coord: int = 400000000000000
+        if self.backend == "numpy":
+            from adventofcode2023.d24.arrays import count_crossings
+            return count_crossings(problem.hailstones, min_coord, max_coord)
         h: int = 0
         hn = len(problem.hailstones)
         for ai in range(hn):
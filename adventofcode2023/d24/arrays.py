@@ -0,0 +1,32 @@
+import numpy as np
+
+from adventofcode2023.d24 import Hailstone
+
+
+def count_crossings(hailstones: list[Hailstone], min_coord: int, max_coord: int) -> int:
+    """
+    Same as Solution24.p1, intersecting each hailstone with all later ones at
+    once. The arithmetic is done in the same order on the same doubles, so
+    borderline crossings come out the same.
+    """
+    px = np.array([h.p.x for h in hailstones], dtype=np.float64)
+    py = np.array([h.p.y for h in hailstones], dtype=np.float64)
+    vx = np.array([h.v.x for h in hailstones], dtype=np.float64)
+    vy = np.array([h.v.y for h in hailstones], dtype=np.float64)
+    m = vy / vx
+    c = py - m * px
+    crossings = 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        for a in range(len(hailstones) - 1):
+            b = slice(a + 1, None)
+            x = (c[b] - c[a]) / (m[a] - m[b])
+            y = m[a] * (x - px[a]) + py[a]
+            a_time = (x - px[a]) / vx[a]
+            b_time = (x - px[b]) / vx[b]
+            crossings += int(np.count_nonzero(
+                (m[a] != m[b]) # not parallel
+                & (a_time >= 0.0) & (b_time >= 0.0)
+                & (min_coord <= x) & (x <= max_coord)
+                & (min_coord <= y) & (y <= max_coord)
+            ))
+    return crossings
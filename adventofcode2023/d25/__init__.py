@@ -56,14 +56,20 @@ class Problem25(Problem):
 
 
 class Solution25(Solution):
+    # Karger's algorithm picks edges at random, seeded so that every run tries
+    # the same contractions and takes as long
+    seed: int = 0
+    
     def p1(self, problem: Problem25):
+        rng = random.Random(self.seed)
         while True:
+            self.metrics.add("karger_trials")
             graph = problem.copy_graph()
             # number of primordial nodes contained in this node
             counts = {n: 1 for n in graph.keys()}
             while len(graph) > 2:
-                a = random.choice(list(graph.keys()))
-                b = random.choice(list(graph[a]))
+                a = rng.choice(list(graph.keys()))
+                b = rng.choice(list(graph[a]))
                 new_node = f"{a}/{b}"
                 counts[new_node] = counts.get(a, 0) + counts.get(b, 0)
                 combine_dests(graph, a, b, new_node)
@@ -1,47 +1,48 @@
+from collections.abc import Iterator, Mapping
 from dataclasses import dataclass
+import importlib
 import re
 
 from adventofcode2023.problem import Problem
 from adventofcode2023.solution import Solution
-from adventofcode2023 import (
-    d01, d02, d03, d04, d05, d06, d07, d08, d09, d10, d11, d12, d13, d14, d15, d16, d17, d18, d19,
-    d20, d21, d22, d23, d24, d25
-)
 
 
 @dataclass
 class Day(object):
+    number: int
     problem_class: type[Problem]
     solution_class: type[Solution]
 
 
-DAYS: dict[int, Day] = {
-    1: Day(d01.Problem01, d01.Solution01),
-    2: Day(d02.Problem02, d02.Solution02),
-    3: Day(d03.Problem03, d03.Solution03),
-    4: Day(d04.Problem04, d04.Solution04),
-    5: Day(d05.Problem05, d05.Solution05),
-    6: Day(d06.Problem06, d06.Solution06),
-    7: Day(d07.Problem07, d07.Solution07),
-    8: Day(d08.Problem08, d08.Solution08),
-    9: Day(d09.Problem09, d09.Solution09),
-    10: Day(d10.Problem10, d10.Solution10),
-    11: Day(d11.Problem11, d11.Solution11),
-    12: Day(d12.Problem12, d12.Solution12),
-    13: Day(d13.Problem13, d13.Solution13),
-    14: Day(d14.Problem14, d14.Solution14),
-    15: Day(d15.Problem15, d15.Solution15),
-    16: Day(d16.Problem16, d16.Solution16),
-    17: Day(d17.Problem17, d17.Solution17),
-    18: Day(d18.Problem18, d18.Solution18),
-    19: Day(d19.Problem19, d19.Solution19),
-    20: Day(d20.Problem20, d20.Solution20),
-    21: Day(d21.Problem21, d21.Solution21),
-    22: Day(d22.Problem22, d22.Solution22),
-    23: Day(d23.Problem23, d23.Solution23),
-    24: Day(d24.Problem24, d24.Solution24),
-    25: Day(d25.Problem25, d25.Solution25)
-}
+# day modules are only imported when they are first looked up so that running
+# a single day does not pay for importing the other 24
+DAY_MODULES: dict[int, str] = {n: f"adventofcode2023.d{n:02}" for n in range(1, 26)}
+
+
+def load_day(n: int) -> Day:
+    m = importlib.import_module(DAY_MODULES[n])
+    return Day(n, getattr(m, f"Problem{n:02}"), getattr(m, f"Solution{n:02}"))
+
+
+class LazyDays(Mapping[int, Day]):
+    def __init__(self):
+        self.loaded: dict[int, Day] = {}
+
+    def __getitem__(self, n: int) -> Day:
+        if (day := self.loaded.get(n)) is None:
+            if n not in DAY_MODULES:
+                raise KeyError(n)
+            day = self.loaded[n] = load_day(n)
+        return day
+
+    def __iter__(self) -> Iterator[int]:
+        return iter(DAY_MODULES)
+
+    def __len__(self) -> int:
+        return len(DAY_MODULES)
+
+
+DAYS: LazyDays = LazyDays()
 
 DAY_SEARCHER_RE = re.compile(
     pattern=r"d?(?P<n>0*[012]?\d)",
@@ -49,7 +50,7 @@ DAY_SEARCHER_RE = re.compile(
 )
 
 def search_day(search: str) -> Day:
-    m = DAY_SEARCHER_RE.match(search)
-    n = m.group("n")
-    n = int(n)
-    return DAYS[n]
\ No newline at end of file
+    m = DAY_SEARCHER_RE.fullmatch(search)
+    if m is None or (n := int(m.group("n"))) not in DAY_MODULES:
+        raise ValueError(f"no such day: {search}")
+    return DAYS[n]
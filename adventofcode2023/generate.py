@@ -0,0 +1,661 @@
+"""
+Generate valid inputs for each day at a chosen size, to see how solvers scale
+past the size of the real inputs.
+
+What size means depends on the day, usually the number of lines or the side
+of the grid, see the docstring of each generator. TYPICAL_SIZES holds sizes
+close to the real inputs. Inputs keep the structure that solutions rely on,
+like a single loop through the start in day 10, counters feeding rx in day 20
+or a single three edge cut in day 25, so both parts have a well defined answer.
+Day 21 part 2 only means something for a 131 wide garden, like the real one.
+"""
+
+import argparse
+import math
+import random
+import string
+import sys
+import typing as t
+
+from adventofcode2023.day import search_day
+
+
+Generator = t.Callable[[int, random.Random], str]
+
+GENERATORS: dict[int, Generator] = {}
+
+TYPICAL_SIZES: dict[int, int] = {
+    1: 1000, 2: 100, 3: 140, 4: 200, 5: 30, 6: 4, 7: 1000, 8: 750, 9: 200, 10: 140,
+    11: 140, 12: 20, 13: 100, 14: 100, 15: 4000, 16: 110, 17: 141, 18: 660, 19: 600,
+    20: 4, 21: 131, 22: 1500, 23: 141, 24: 300, 25: 1500
+}
+
+VERBOSE_DIGITS = ["one", "two", "three", "four", "five", "six", "seven", "eight", "nine"]
+
+
+def generator(day: int) -> t.Callable[[Generator], Generator]:
+    def register(func: Generator) -> Generator:
+        GENERATORS[day] = func
+        return func
+    return register
+
+
+def generate(day: int, size: int, seed: int = 0) -> str:
+    if day not in GENERATORS:
+        raise ValueError(f"no generator for day {day}")
+    return GENERATORS[day](size, random.Random(seed))
+
+
+def unique_names(rng: random.Random, count: int, length: int, exclude: t.Container[str] = ()) -> list[str]:
+    names: set[str] = set()
+    if count > 26 ** length // 2:
+        raise ValueError(f"cannot make {count} distinct names of length {length}")
+    while len(names) < count:
+        name = "".join(rng.choices(string.ascii_lowercase, k=length))
+        if name not in exclude:
+            names.add(name)
+    return rng.sample(sorted(names), count)
+
+
+def random_tree(width: int, height: int, rng: random.Random) -> set[tuple[int, int]]:
+    """
+    Cells of a width * height grid doubled in size, holding a random spanning
+    tree of the grid: nodes at even coordinates and the edges between them.
+    """
+    cells = {(0, 0)}
+    seen = {(0, 0)}
+    frontier = [((0, 0), (1, 0)), ((0, 0), (0, 1))]
+    while len(frontier) >= 1:
+        i = rng.randrange(len(frontier))
+        frontier[i], frontier[-1] = frontier[-1], frontier[i]
+        (ax, ay), (bx, by) = frontier.pop()
+        if not (0 <= bx < width and 0 <= by < height) or (bx, by) in seen:
+            continue
+        seen.add((bx, by))
+        cells.add((2 * bx, 2 * by))
+        cells.add((ax + bx, ay + by))
+        for dx, dy in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            frontier.append(((bx, by), (bx + dx, by + dy)))
+    return cells
+
+
+def tree_outline(width: int, height: int, rng: random.Random) -> list[tuple[int, int]]:
+    """
+    Corners of a random simple rectilinear polygon, in clockwise order with
+    the y axis pointing down.
+
+    The polygon is the outline of a tree shaped polyomino, which has no holes
+    and never touches itself.
+    """
+    cells = random_tree(width, height, rng)
+    successor: dict[tuple[int, int], tuple[int, int]] = {}
+    for x, y in cells:
+        if (x, y - 1) not in cells:
+            successor[(x, y)] = (x + 1, y)
+        if (x + 1, y) not in cells:
+            successor[(x + 1, y)] = (x + 1, y + 1)
+        if (x, y + 1) not in cells:
+            successor[(x + 1, y + 1)] = (x, y + 1)
+        if (x - 1, y) not in cells:
+            successor[(x, y + 1)] = (x, y)
+    start = min(successor)
+    corners: list[tuple[int, int]] = []
+    v = start
+    while True:
+        prev_v = v
+        v = successor[v]
+        after = successor[v]
+        # keep only the points where the outline turns
+        if (prev_v[0] == v[0]) != (v[0] == after[0]):
+            corners.append(v)
+        if v == start:
+            break
+    return corners
+
+
+def stretch(corners: list[tuple[int, int]], rng: random.Random, max_span: int) -> list[tuple[int, int]]:
+    """
+    Stretch every row and column between corners to between 1 and max_span
+    units, which keeps a simple polygon simple.
+    """
+    def spans(coordinates: set[int]) -> dict[int, int]:
+        result: dict[int, int] = {}
+        position = 0
+        for c in sorted(coordinates):
+            result[c] = position
+            position += rng.randint(1, max_span)
+        return result
+    xs = spans({x for x, _ in corners})
+    ys = spans({y for _, y in corners})
+    return [(xs[x], ys[y]) for x, y in corners]
+
+
+def sign(n: int) -> int:
+    return (n > 0) - (n < 0)
+
+
+@generator(1)
+def generate01(size: int, rng: random.Random) -> str:
+    """size lines of calibration values, each with at least one digit"""
+    lines = []
+    for _ in range(size):
+        tokens = [str(rng.randint(1, 9))]
+        for _ in range(rng.randint(1, 8)):
+            match rng.randrange(3):
+                case 0: tokens.append(str(rng.randint(1, 9)))
+                case 1: tokens.append(rng.choice(VERBOSE_DIGITS))
+                case _: tokens.append("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 5))))
+        rng.shuffle(tokens)
+        lines.append("".join(tokens))
+    return "\n".join(lines) + "\n"
+
+
+@generator(2)
+def generate02(size: int, rng: random.Random) -> str:
+    """size games"""
+    lines = []
+    for game in range(1, size + 1):
+        draws = []
+        for _ in range(rng.randint(1, 6)):
+            colors = rng.sample(["red", "green", "blue"], rng.randint(1, 3))
+            draws.append(", ".join(f"{rng.randint(1, 20)} {color}" for color in colors))
+        lines.append(f"Game {game}: {"; ".join(draws)}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(3)
+def generate03(size: int, rng: random.Random) -> str:
+    """size * size schematic"""
+    rows = []
+    for _ in range(size):
+        row = ""
+        while len(row) < size:
+            r = rng.random()
+            if r < 0.15:
+                row += str(rng.randint(1, 999)) + "."
+            elif r < 0.2:
+                row += rng.choice("*#+$/@%=&-")
+            else:
+                row += "."
+        rows.append(row[:size])
+    return "\n".join(rows) + "\n"
+
+
+@generator(4)
+def generate04(size: int, rng: random.Random) -> str:
+    """size cards of 10 winning numbers and 25 numbers"""
+    lines = []
+    for card in range(1, size + 1):
+        # few matches on average so that copies do not grow exponentially
+        matches = rng.choices(range(11), weights=[60, 15, 8, 5, 3, 3, 2, 1, 1, 1, 1])[0]
+        winning = rng.sample(range(1, 100), 10)
+        others = [n for n in range(1, 100) if n not in winning]
+        numbers = rng.sample(winning, matches) + rng.sample(others, 25 - matches)
+        rng.shuffle(numbers)
+        lines.append(
+            f"Card {card:>3}: {" ".join(f"{n:>2}" for n in winning)}"
+            f" | {" ".join(f"{n:>2}" for n in numbers)}"
+        )
+    return "\n".join(lines) + "\n"
+
+
+@generator(5)
+def generate05(size: int, rng: random.Random) -> str:
+    """seven maps of size ranges each, with about size / 3 seed ranges"""
+    limit = 2 ** 32
+    pairs = max(1, size // 3)
+    seeds = []
+    for _ in range(pairs):
+        length = rng.randint(1, limit // (4 * pairs))
+        seeds += [rng.randrange(limit - length), length]
+    sections = [f"seeds: {" ".join(map(str, seeds))}"]
+    names = ["seed", "soil", "fertilizer", "water", "light", "temperature", "humidity", "location"]
+    for src, dest in zip(names, names[1:]):
+        # disjoint source ranges, with gaps between some of them
+        bounds = sorted(rng.sample(range(limit), 2 * size))
+        lines = [f"{src}-to-{dest} map:"]
+        for start, end in zip(bounds[0::2], bounds[1::2]):
+            length = end - start
+            lines.append(f"{rng.randrange(limit - length)} {start} {length}")
+        sections.append("\n".join(lines))
+    return "\n\n".join(sections) + "\n"
+
+
+@generator(6)
+def generate06(size: int, rng: random.Random) -> str:
+    """size races that can all be won"""
+    times = [rng.randint(10, 99) for _ in range(size)]
+    records = [rng.randint(1, time * time // 4 - 1) for time in times]
+    width = max(len(str(n)) for n in times + records) + 2
+    return (
+        "Time:    " + "".join(f"{n:>{width}}" for n in times) + "\n"
+        + "Distance:" + "".join(f"{n:>{width}}" for n in records) + "\n"
+    )
+
+
+@generator(7)
+def generate07(size: int, rng: random.Random) -> str:
+    """size hands"""
+    lines = []
+    for _ in range(size):
+        hand = "".join(rng.choices("23456789TJQKA", k=5))
+        lines.append(f"{hand} {rng.randint(1, 1000)}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(8)
+def generate08(size: int, rng: random.Random) -> str:
+    """
+    about size nodes in six cycles, each starting at a node ending in A that
+    leads to a node ending in Z at the same distance as the length of its cycle
+    """
+    ghosts = 6
+    length = max(1, size // ghosts)
+    letters = string.ascii_uppercase
+    middles = [
+        a + b + c for a in letters for b in letters for c in letters if c not in "AZ"
+    ]
+    if length * ghosts > len(middles):
+        raise ValueError(f"at most {len(middles)} nodes fit in three letter names")
+    middles = rng.sample(middles, length * ghosts)
+    prefixes = [name.upper() for name in unique_names(rng, ghosts - 1, 2, {"aa", "zz"})]
+    starts = ["AAA"] + [prefix + "A" for prefix in prefixes]
+    ends = ["ZZZ"] + [prefix + "Z" for prefix in prefixes]
+    nodes: list[tuple[str, str]] = []
+    for g in range(ghosts):
+        cycle = middles[g * length:(g + 1) * length]
+        cycle_len = rng.randint(max(1, length // 2), length)
+        path = cycle[:cycle_len - 1] + [ends[g]]
+        # both ways lead to the same node, so the path does not depend on the
+        # instructions and the end is reached again a whole cycle later
+        nodes.append((starts[g], path[0]))
+        for a, b in zip(path, path[1:] + path[:1]):
+            nodes.append((a, b))
+        # decoys that are never reached
+        for a in cycle[cycle_len - 1:]:
+            nodes.append((a, rng.choice(path)))
+    rng.shuffle(nodes)
+    instructions = "".join(rng.choices("LR", k=rng.randint(50, 300)))
+    lines = [f"{a} = ({b}, {b})" for a, b in nodes]
+    return instructions + "\n\n" + "\n".join(lines) + "\n"
+
+
+@generator(9)
+def generate09(size: int, rng: random.Random) -> str:
+    """size histories of 21 values from polynomials of degree up to 8"""
+    lines = []
+    for _ in range(size):
+        coefficients = [rng.randint(-9, 9) for _ in range(rng.randint(1, 9))]
+        values = [sum(c * x ** k for k, c in enumerate(coefficients)) for x in range(21)]
+        lines.append(" ".join(map(str, values)))
+    return "\n".join(lines) + "\n"
+
+
+@generator(10)
+def generate10(size: int, rng: random.Random) -> str:
+    """about size * size tiles with a single loop through S among junk pipes"""
+    coarse = max(2, size // 5)
+    corners = stretch(tree_outline(coarse, coarse, rng), rng, 4)
+    loop: list[tuple[int, int]] = []
+    for (ax, ay), (bx, by) in zip(corners, corners[1:] + corners[:1]):
+        dx, dy = sign(bx - ax), sign(by - ay)
+        for i in range(abs(bx - ax) + abs(by - ay)):
+            loop.append((ax + dx * i + 1, ay + dy * i + 1))
+    width = max(x for x, _ in loop) + 2
+    height = max(y for _, y in loop) + 2
+    grid = [rng.choices("|-LJ7F.", k=width) for _ in range(height)]
+    pipes = {
+        frozenset("NS"): "|", frozenset("EW"): "-", frozenset("NE"): "L",
+        frozenset("NW"): "J", frozenset("SW"): "7", frozenset("SE"): "F"
+    }
+    towards = {(0, -1): "N", (0, 1): "S", (1, 0): "E", (-1, 0): "W"}
+    for i, (x, y) in enumerate(loop):
+        px, py = loop[i - 1]
+        nx, ny = loop[(i + 1) % len(loop)]
+        grid[y][x] = pipes[frozenset((towards[(px - x, py - y)], towards[(nx - x, ny - y)]))]
+    on_loop = set(loop)
+    sx, sy = rng.choice(loop)
+    grid[sy][sx] = "S"
+    # junk next to the start must not look connected to it
+    for dx, dy in towards:
+        if (sx + dx, sy + dy) not in on_loop:
+            grid[sy + dy][sx + dx] = "."
+    return "\n".join("".join(row) for row in grid) + "\n"
+
+
+@generator(11)
+def generate11(size: int, rng: random.Random) -> str:
+    """size * size image"""
+    empty_rows = set(rng.sample(range(size), size // 10))
+    empty_columns = set(rng.sample(range(size), size // 10))
+    rows = []
+    for y in range(size):
+        rows.append("".join(
+            "#" if y not in empty_rows and x not in empty_columns and rng.random() < 0.025 else "."
+            for x in range(size)
+        ))
+    return "\n".join(rows) + "\n"
+
+
+@generator(12)
+def generate12(size: int, rng: random.Random) -> str:
+    """1000 records of size springs, each with at least one arrangement"""
+    lines = []
+    for _ in range(1000):
+        springs = ""
+        groups: list[int] = []
+        while True:
+            springs += "." * rng.randint(0 if not springs else 1, 3)
+            group = rng.randint(1, 6)
+            if len(springs) + group > size:
+                break
+            springs += "#" * group
+            groups.append(group)
+        springs = springs.ljust(size, ".")
+        if not groups:
+            springs = "#" + springs[1:]
+            groups = [1]
+        row = "".join("?" if rng.random() < 0.45 else c for c in springs)
+        lines.append(f"{row} {",".join(map(str, groups))}")
+    return "\n".join(lines) + "\n"
+
+
+def mirror_diffs(pattern: list[list[bool]]) -> list[int]:
+    """mismatches across every horizontal then every vertical mirror line"""
+    def diffs(rows: list[list[bool]]) -> list[int]:
+        result = []
+        for y in range(len(rows) - 1):
+            n = min(y + 1, len(rows) - y - 1)
+            result.append(sum(
+                a != b
+                for i in range(n)
+                for a, b in zip(rows[y - i], rows[y + 1 + i])
+            ))
+        return result
+    return diffs(pattern) + diffs([list(c) for c in zip(*pattern)])
+
+
+@generator(13)
+def generate13(size: int, rng: random.Random) -> str:
+    """
+    size patterns, each with exactly one mirror and exactly one line that
+    becomes a mirror when fixing a single smudge
+    """
+    patterns = []
+    while len(patterns) < size:
+        width, height = rng.randint(5, 17), rng.randint(7, 17)
+        pattern = [[rng.random() < 0.5 for _ in range(width)] for _ in range(height)]
+        # mirror the columns around b, then the rows around an off centre a
+        b = rng.randrange(width - 1)
+        for i in range(min(b + 1, width - b - 1)):
+            for row in pattern:
+                row[b + 1 + i] = row[b - i]
+        a = rng.randrange(height - 1)
+        n = min(a + 1, height - a - 1)
+        if n * 2 == height:
+            continue
+        for i in range(n):
+            pattern[a + 1 + i] = pattern[a - i].copy()
+        # a smudge on a row outside the mirrored rows only breaks the columns
+        m = min(b + 1, width - b - 1)
+        y = rng.choice([y for y in range(height) if not a - n < y <= a + n])
+        x = rng.randint(b - m + 1, b + m)
+        pattern[y][x] = not pattern[y][x]
+        diffs = mirror_diffs(pattern)
+        if diffs.count(0) != 1 or diffs.count(1) != 1:
+            continue
+        if rng.random() < 0.5:
+            pattern = [list(c) for c in zip(*pattern)]
+        patterns.append("\n".join("".join("#" if c else "." for c in row) for row in pattern))
+    return "\n\n".join(patterns) + "\n"
+
+
+@generator(14)
+def generate14(size: int, rng: random.Random) -> str:
+    """size * size platform"""
+    rows = ["".join(rng.choices("O#.", weights=[20, 10, 70], k=size)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+@generator(15)
+def generate15(size: int, rng: random.Random) -> str:
+    """size steps over about size / 8 labels"""
+    labels = [
+        "".join(rng.choices(string.ascii_lowercase, k=rng.randint(2, 6)))
+        for _ in range(max(1, size // 8))
+    ]
+    steps = [
+        rng.choice(labels) + (f"={rng.randint(1, 9)}" if rng.random() < 0.6 else "-")
+        for _ in range(size)
+    ]
+    return ",".join(steps)
+
+
+@generator(16)
+def generate16(size: int, rng: random.Random) -> str:
+    """size * size contraption"""
+    rows = [
+        "".join(rng.choices(".|-/\\", weights=[92, 2, 2, 2, 2], k=size))
+        for _ in range(size)
+    ]
+    return "\n".join(rows) + "\n"
+
+
+@generator(17)
+def generate17(size: int, rng: random.Random) -> str:
+    """size * size city blocks"""
+    rows = ["".join(rng.choices("123456789", k=size)) for _ in range(size)]
+    return "\n".join(rows) + "\n"
+
+
+@generator(18)
+def generate18(size: int, rng: random.Random) -> str:
+    """
+    about size instructions, where the distances in the colours trace the
+    same outline stretched differently
+    """
+    coarse = max(2, math.isqrt(size // 2))
+    outline = tree_outline(coarse, coarse, rng)
+    corners = stretch(outline, rng, 12)
+    colour_corners = stretch(outline, rng, 0xFFFFF // (2 * coarse))
+    directions = {(1, 0): ("R", 0), (0, 1): ("D", 1), (-1, 0): ("L", 2), (0, -1): ("U", 3)}
+    lines = []
+    pairs = zip(
+        zip(corners, corners[1:] + corners[:1]),
+        zip(colour_corners, colour_corners[1:] + colour_corners[:1])
+    )
+    for ((ax, ay), (bx, by)), ((cx, cy), (dx, dy)) in pairs:
+        name, digit = directions[(sign(bx - ax), sign(by - ay))]
+        distance = abs(bx - ax) + abs(by - ay)
+        colour_distance = abs(dx - cx) + abs(dy - cy)
+        lines.append(f"{name} {distance} (#{colour_distance:05x}{digit})")
+    return "\n".join(lines) + "\n"
+
+
+@generator(19)
+def generate19(size: int, rng: random.Random) -> str:
+    """size workflows that never loop and size parts"""
+    names = ["in"] + unique_names(rng, size - 1, 3, {"in"})
+    workflows = []
+    for i, name in enumerate(names):
+        # only send parts to later workflows so that every part ends up accepted or rejected
+        later = names[i + 1:]
+        def destination() -> str:
+            if not later or rng.random() < 0.3:
+                return rng.choice("AR")
+            return rng.choice(later)
+        conditions = [
+            f"{rng.choice("xmas")}{rng.choice("<>")}{rng.randint(1, 4000)}:{destination()}"
+            for _ in range(rng.randint(1, 4))
+        ]
+        workflows.append(f"{name}{{{",".join(conditions + [destination()])}}}")
+    parts = [
+        "{" + ",".join(f"{c}={rng.randint(1, 4000)}" for c in "xmas") + "}"
+        for _ in range(size)
+    ]
+    return "\n".join(workflows) + "\n\n" + "\n".join(parts) + "\n"
+
+
+@generator(20)
+def generate20(size: int, rng: random.Random) -> str:
+    """
+    size twelve bit counters, each resetting at its own number of presses and
+    sending a high pulse towards rx when it does
+    """
+    bits = 12
+    names = iter(unique_names(rng, size * (bits + 2) + 1, 2 if size <= 16 else 3, {"rx"}))
+    final = next(names)
+    periods = rng.sample(range(2 ** (bits - 1) + 1, 2 ** bits, 2), size)
+    lines = []
+    starts = []
+    for period in periods:
+        flipflops = [next(names) for _ in range(bits)]
+        conjunction, inverter = next(names), next(names)
+        starts.append(flipflops[0])
+        for i, flipflop in enumerate(flipflops):
+            destinations = flipflops[i + 1:i + 2]
+            if period >> i & 1:
+                destinations.append(conjunction)
+            lines.append(f"%{flipflop} -> {", ".join(destinations)}")
+        resets = [f for i, f in enumerate(flipflops) if not period >> i & 1 or i == 0]
+        lines.append(f"&{conjunction} -> {", ".join(resets + [inverter])}")
+        lines.append(f"&{inverter} -> {final}")
+    lines.append(f"&{final} -> rx")
+    lines.append(f"broadcaster -> {", ".join(starts)}")
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+@generator(21)
+def generate21(size: int, rng: random.Random) -> str:
+    """size * size garden, size made odd, with S in the middle of clear lines"""
+    size |= 1
+    middle = size // 2
+    rows = []
+    for y in range(size):
+        row = [
+            "." if x in (0, middle, size - 1) or y in (0, middle, size - 1) or rng.random() >= 0.15 else "#"
+            for x in range(size)
+        ]
+        rows.append(row)
+    rows[middle][middle] = "S"
+    return "\n".join("".join(row) for row in rows) + "\n"
+
+
+@generator(22)
+def generate22(size: int, rng: random.Random) -> str:
+    """size bricks over a 10 * 10 area"""
+    occupied: set[tuple[int, int, int]] = set()
+    top = size // 3 + 10
+    lines = []
+    while len(lines) < size:
+        axis = rng.randrange(3)
+        length = rng.randint(1, 4)
+        low = [rng.randrange(10), rng.randrange(10), rng.randint(1, top)]
+        high = low.copy()
+        high[axis] += length - 1
+        if high[0] >= 10 or high[1] >= 10:
+            continue
+        cubes = {
+            (x, y, z)
+            for x in range(low[0], high[0] + 1)
+            for y in range(low[1], high[1] + 1)
+            for z in range(low[2], high[2] + 1)
+        }
+        if cubes & occupied:
+            continue
+        occupied |= cubes
+        lines.append(f"{",".join(map(str, low))}~{",".join(map(str, high))}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(23)
+def generate23(size: int, rng: random.Random) -> str:
+    """
+    about size * size trails joining a grid of junctions that stays about as
+    big as the real one, the trails get longer as size grows
+    """
+    low, high = max(4, size // 7), max(4, size // 4)
+    def spacings(first: int) -> list[int]:
+        result = [first]
+        while result[-1] + low <= size - 2:
+            result.append(result[-1] + rng.randint(low, high))
+        if len(result) > 2 and result[-1] > size - 2:
+            result.pop()
+        return result
+    xs, ys = spacings(1), spacings(rng.randint(low, high))
+    width, height = xs[-1] + 2, ys[-1] + 2
+    tiles = [["#"] * width for _ in range(height)]
+    for y in range(ys[0] + 1):
+        tiles[y][xs[0]] = "."
+    for y in range(ys[-1], height):
+        tiles[y][xs[-1]] = "."
+    for j, y in enumerate(ys):
+        for i, x in enumerate(xs):
+            tiles[y][x] = "."
+            # keep the top row and the last column so the end can be reached
+            if i + 1 < len(xs) and (j == 0 or rng.random() >= 0.15):
+                for cx in range(x + 1, xs[i + 1]):
+                    tiles[y][cx] = "."
+                tiles[y][x + 1] = tiles[y][xs[i + 1] - 1] = ">"
+            if j + 1 < len(ys) and (i == len(xs) - 1 or rng.random() >= 0.15):
+                for cy in range(y + 1, ys[j + 1]):
+                    tiles[cy][x] = "."
+                tiles[y + 1][x] = tiles[ys[j + 1] - 1][x] = "v"
+    return "\n".join("".join(row) for row in tiles) + "\n"
+
+
+@generator(24)
+def generate24(size: int, rng: random.Random) -> str:
+    """size hailstones that a single rock thrown the right way would all hit"""
+    rock = [rng.randint(2 * 10 ** 14, 4 * 10 ** 14) for _ in range(3)]
+    rock_velocity = [rng.randint(-250, 250) for _ in range(3)]
+    times = rng.sample(range(10 ** 9, 10 ** 12), size)
+    lines = []
+    for time in times:
+        # like the real input, no hailstone stands still along any axis
+        velocity = [rng.choice([-1, 1]) * rng.randint(1, 300) for _ in range(3)]
+        position = [p + (rv - v) * time for p, rv, v in zip(rock, rock_velocity, velocity)]
+        lines.append(f"{", ".join(map(str, position))} @ {", ".join(map(str, velocity))}")
+    return "\n".join(lines) + "\n"
+
+
+@generator(25)
+def generate25(size: int, rng: random.Random) -> str:
+    """size components in two well connected groups joined by three wires"""
+    names = unique_names(rng, size, 3)
+    split = rng.randint(size * 2 // 5, size * 3 // 5)
+    edges: set[tuple[str, str]] = set()
+    for group in (names[:split], names[split:]):
+        for name in group:
+            for other in rng.sample(group, min(4, len(group) - 1) + 1):
+                if other != name:
+                    edges.add((name, other) if name < other else (other, name))
+    for a, b in zip(rng.sample(names[:split], 3), rng.sample(names[split:], 3)):
+        edges.add((a, b))
+    wires: dict[str, list[str]] = {}
+    for a, b in edges:
+        if rng.random() < 0.5:
+            a, b = b, a
+        wires.setdefault(a, []).append(b)
+    lines = [f"{a}: {" ".join(bs)}" for a, bs in wires.items()]
+    rng.shuffle(lines)
+    return "\n".join(lines) + "\n"
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 generate")
+    argparser.add_argument("day", help="day to generate an input for")
+    argparser.add_argument(
+        "--size",
+        "-n",
+        type=int,
+        help="size of the input, what it counts depends on the day, by default about the real size"
+    )
+    argparser.add_argument("--seed", "-s", default=0, type=int, help="random seed")
+    args = argparser.parse_args(argv)
+
+    day = search_day(args.day).number
+    size = args.size if args.size is not None else TYPICAL_SIZES[day]
+    sys.stdout.write(generate(day, size, args.seed))
+    return 0
@@ -0,0 +1,140 @@
+"""
+A rectangular grid of byte sized cells, for the days whose input is a map.
+
+Cells are stored row by row in a single bytearray with a border of padding
+cells around the map, so a cell is either addressed by (x, y) or by its flat
+index into cells. Moving to a neighbor is adding an offset to a flat index,
+and thanks to the border every neighbor of a cell on the map is a valid
+index: walks only have to look for the fill value instead of checking bounds.
+"""
+
+import typing as t
+
+from adventofcode2023.coord import Direction
+
+
+class Grid(object):
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        cells: bytearray | None = None,
+        pad: int = 1,
+        fill: int = 0
+    ):
+        self.width = width
+        self.height = height
+        self.pad = pad
+        self.fill = fill
+        self.stride = width + 2 * pad
+        size = self.stride * (height + 2 * pad)
+        self.cells = bytearray([fill]) * size if cells is None else cells
+        if len(self.cells) != size:
+            raise ValueError(f"expected {size} cells, got {len(self.cells)}")
+        # flat index offsets to each neighbor
+        self.up = -self.stride
+        self.down = self.stride
+        self.left = -1
+        self.right = 1
+        self.neighbors4 = (self.up, self.down, self.left, self.right)
+        self.neighbors8 = (
+            self.up + self.left, self.up, self.up + self.right,
+            self.left, self.right,
+            self.down + self.left, self.down, self.down + self.right
+        )
+        # indexed by Direction
+        self.offsets = tuple(d.offset(self.stride) for d in Direction)
+
+    @classmethod
+    def from_lines(cls, lines: t.Sequence[str], pad: int = 1, fill: bytes = b"\0") -> "Grid":
+        width = len(lines[0])
+        border = fill * ((width + 2 * pad) * pad)
+        side = fill * pad
+        cells = bytearray(border)
+        for line in lines:
+            if len(line) != width:
+                raise ValueError(f"expected rows of width {width}, got {len(line)}")
+            cells += side
+            cells += line.encode()
+            cells += side
+        cells += border
+        return cls(width, len(lines), cells, pad, fill[0])
+
+    @classmethod
+    def from_str(cls, input: str, pad: int = 1, fill: bytes = b"\0") -> "Grid":
+        return cls.from_lines(input.splitlines(), pad, fill)
+
+    def copy(self) -> "Grid":
+        return Grid(self.width, self.height, self.cells.copy(), self.pad, self.fill)
+
+    def index(self, x: int, y: int) -> int:
+        return (y + self.pad) * self.stride + x + self.pad
+
+    def coords(self, i: int) -> tuple[int, int]:
+        y, x = divmod(i, self.stride)
+        return x - self.pad, y - self.pad
+
+    def contains(self, x: int, y: int) -> bool:
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def __getitem__(self, xy: tuple[int, int]) -> int:
+        return self.cells[self.index(*xy)]
+
+    def __setitem__(self, xy: tuple[int, int], value: int):
+        self.cells[self.index(*xy)] = value
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return (self.width, self.height, self.cells) == (other.width, other.height, other.cells)
+
+    def __str__(self) -> str:
+        return "\n".join(row.decode() for row in self.rows())
+
+    def indices(self) -> t.Generator[int]:
+        """flat indices of all cells on the map, row by row"""
+        for y in range(self.height):
+            start = self.index(0, y)
+            yield from range(start, start + self.width)
+
+    def find_all(self, value: bytes) -> t.Generator[int]:
+        """flat indices of all cells on the map holding value"""
+        if value[0] == self.fill:
+            raise ValueError("cannot search for the fill value")
+        i = self.cells.find(value)
+        while i != -1:
+            yield i
+            i = self.cells.find(value, i + 1)
+
+    def mask(self) -> bytearray:
+        """
+        Zeroed bytes like cells, except for ones on the border, to mark
+        visited cells without bounds checks.
+        """
+        mask = bytearray([1]) * len(self.cells)
+        for y in range(self.height):
+            start = self.index(0, y)
+            mask[start:start + self.width] = bytes(self.width)
+        return mask
+
+    def row(self, y: int) -> bytes:
+        start = self.index(0, y)
+        return bytes(self.cells[start:start + self.width])
+
+    def column(self, x: int) -> bytes:
+        start = self.index(x, 0)
+        return bytes(self.cells[start:start + self.stride * self.height:self.stride])
+
+    def rows(self) -> list[bytes]:
+        return [self.row(y) for y in range(self.height)]
+
+    def columns(self) -> list[bytes]:
+        return [self.column(x) for x in range(self.width)]
+
+    def set_row(self, y: int, row: bytes):
+        start = self.index(0, y)
+        self.cells[start:start + self.width] = row
+
+    def set_column(self, x: int, column: bytes):
+        start = self.index(x, 0)
+        self.cells[start:start + self.stride * self.height:self.stride] = column
@@ -0,0 +1,82 @@
+"""
+Spread independent calls of a solution over several workers.
+
+On free-threaded builds the workers are threads of this process, otherwise
+the GIL would serialize them, so they are processes instead. Functions and
+arguments given to a process pool have to be picklable, so solutions map
+module level functions or partials of them, and counters collected in worker
+processes are lost: mapped functions return their counts along with their
+results and the solution adds them up. By default everything runs serially in
+the calling thread, see Solution.parallel_map.
+"""
+
+import argparse
+import os
+import sys
+import typing as t
+
+# concurrent.futures takes a while to import, and only runs with more than
+# one worker need it
+if t.TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+
+def gil_disabled() -> bool:
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+# pools live as long as the process so that starting workers is only paid once
+EXECUTORS: dict[tuple[type["Executor"], int], "Executor"] = {}
+
+
+def executor(workers: int) -> "Executor":
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+    kind = ThreadPoolExecutor if gil_disabled() else ProcessPoolExecutor
+    if (pool := EXECUTORS.get((kind, workers))) is None:
+        pool = EXECUTORS[kind, workers] = kind(max_workers=workers)
+    return pool
+
+
+def parallel_map[T](
+    workers: int,
+    func: t.Callable[..., T],
+    *iterables: t.Iterable[t.Any]
+) -> t.Iterator[T]:
+    """
+    Like map, in a pool of workers unless there is only one, in which case
+    func is called right here, lazily, so that streamed inputs stay streamed.
+    A pool needs all of the arguments up front to split them into chunks.
+    """
+    if workers <= 1:
+        return map(func, *iterables)
+    args = [list(it) for it in iterables]
+    n = min(map(len, args), default=0)
+    if n <= 1:
+        return map(func, *args)
+    # fewer, bigger tasks cut down on pickling for process pools, and thread
+    # pools ignore the chunk size
+    chunksize = max(1, n // (workers * 4))
+    return executor(workers).map(func, *args, chunksize=chunksize)
+
+
+def use_workers(workers: int) -> int:
+    """
+    Let every solution use this many workers, 0 for one per cpu, returning
+    the number actually used.
+    """
+    from adventofcode2023.solution import Solution
+    workers = workers or os.process_cpu_count() or 1
+    Solution.workers = workers
+    return workers
+
+
+def add_workers_argument(argparser: argparse.ArgumentParser, note: str = ""):
+    argparser.add_argument(
+        "--workers",
+        default=1,
+        type=int,
+        help="workers for parts that solve independent pieces in parallel"
+        ", threads on free-threaded builds and processes otherwise, 0 for one per cpu"
+        ", by default everything runs serially" + note
+    )
@@ -0,0 +1,97 @@
+"""
+Measure parsing throughput, decoding and parsing text against parsing bytes.
+
+Every run does the whole job of parsing a raw input: from_str is timed
+together with decoding the bytes it is given, from_bytes on the bytes as they
+are read from disk. Days that do not override from_bytes just decode and call
+from_str, so both ways take about as long for them. Throughput is in MiB of
+input per second, and a generated input of a given size can be used instead
+of input.txt to get inputs big enough to time reliably.
+"""
+
+import argparse
+from dataclasses import dataclass
+from pathlib import Path
+
+from adventofcode2023.bench import StepResult, measure
+from adventofcode2023.day import DAYS, Day, search_day
+from adventofcode2023.generate import generate
+from adventofcode2023.problem import Problem
+
+
+@dataclass
+class ParseResult(object):
+    day: int
+    size: int
+    text: StepResult
+    data: StepResult
+
+    @property
+    def overridden(self) -> bool:
+        return DAYS[self.day].problem_class.from_bytes.__func__ is not Problem.from_bytes.__func__
+
+    def throughput(self, step: StepResult) -> float:
+        """MiB of input parsed per second"""
+        return self.size / 2 ** 20 / step.median
+
+    def __str__(self) -> str:
+        prefix = f"{self.day:>3} {self.size / 1024:>10.1f}"
+        if (error := self.text.error or self.data.error) is not None:
+            return f"{prefix} {error}"
+        return (
+            f"{prefix}"
+            f" {self.text.median * 1000:>10.2f} {self.throughput(self.text):>8.1f}"
+            f" {self.data.median * 1000:>10.2f} {self.throughput(self.data):>8.1f}"
+            f" {self.text.median / self.data.median:>7.2f}x"
+            + ("" if self.overridden else "  (decodes)")
+        )
+
+
+HEADER = (
+    f"{"day":>3} {"input KiB":>10}"
+    f" {"str ms":>10} {"MiB/s":>8}"
+    f" {"bytes ms":>10} {"MiB/s":>8}"
+    f" {"speedup":>8}"
+)
+
+
+def parse_day(day: Day, data: bytes, repeat: int = 5, warmup: int = 1) -> ParseResult:
+    cls = day.problem_class
+    text = measure(lambda: data, lambda d: cls.from_str(d.decode()), repeat, warmup, memory=False)
+    parsed = measure(lambda: data, cls.from_bytes, repeat, warmup, memory=False)
+    return ParseResult(day.number, len(data), text, parsed)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 parse")
+    argparser.add_argument("days", nargs="*", help="days to parse, by default all")
+    argparser.add_argument("--repeat", "-r", default=5, type=int, help="timed runs per way of parsing")
+    argparser.add_argument("--warmup", "-w", default=1, type=int, help="untimed runs per way of parsing")
+    argparser.add_argument(
+        "--size",
+        type=int,
+        help="parse a generated input of this size instead of input.txt"
+    )
+    argparser.add_argument("--seed", default=0, type=int, help="seed for generated inputs")
+    argparser.add_argument(
+        "--infile",
+        "-i",
+        type=Path,
+        help="path to input file, only allowed when parsing a single day"
+    )
+    args = argparser.parse_args(argv)
+
+    days = [search_day(d) for d in args.days] if args.days else [DAYS[n] for n in DAYS]
+    if args.infile and len(days) != 1:
+        argparser.error("--infile needs exactly one day")
+    if args.infile and args.size:
+        argparser.error("--infile and --size are mutually exclusive")
+
+    print(HEADER)
+    for day in days:
+        if args.size:
+            data = generate(day.number, args.size, args.seed).encode()
+        else:
+            data = (args.infile or day.problem_class.default_input_file_path()).read_bytes()
+        print(parse_day(day, data, args.repeat, args.warmup), flush=True)
+    return 0
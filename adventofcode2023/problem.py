@@ -2,8 +2,58 @@ import importlib
 import io
 import os
 from pathlib import Path
+import re
+import typing as t
+
+
+# translation tables blanking out every byte that cannot be part of a number
+DIGITS = b"0123456789"
+NOT_DIGITS = bytes(b if b in DIGITS else 32 for b in range(256))
+NOT_SIGNED_DIGITS = bytes(b if b in DIGITS + b"-" else 32 for b in range(256))
+# inputs saved on windows end their lines with \r\n
+BLANK_LINE_RE = re.compile(rb"\r?\n\r?\n")
+
+
+def iter_lines(p: os.PathLike) -> t.Generator[str]:
+    """
+    Lazily read the lines of a file without their line endings
+    """
+    with Path(p).open("r") as f:
+        for line in f:
+            yield line.rstrip("\r\n")
+
+
+def ints(data: bytes, signed: bool = False) -> list[int]:
+    """
+    Every integer in data, in order. Everything else is blanked out in one
+    pass so the numbers can be split off and converted in bulk, much faster
+    than matching them with a regex. Only pass signed for inputs where every
+    dash is a minus sign.
+    """
+    table = NOT_SIGNED_DIGITS if signed else NOT_DIGITS
+    return list(map(int, data.translate(table).split()))
+
+
+def blocks(data: bytes, maxsplit: int = 0) -> list[bytes]:
+    """
+    data split on blank lines, whichever line endings it uses
+    """
+    return BLANK_LINE_RE.split(data, maxsplit)
+
 
 class Problem(object):
+    # bump whenever the parsed representation changes so that cached
+    # problems from older versions are not loaded
+    version: int = 1
+    
+    @property
+    def derived(self) -> dict[t.Hashable, t.Any]:
+        """
+        Results that solutions derive from this problem and share between parts
+        """
+        # subclasses do not call super().__init__, so create this lazily
+        return self.__dict__.setdefault("_derived", {})
+    
     @classmethod
     def default_input_file_path(cls) -> Path:
         # https://stackoverflow.com/a/54142935
@@ -12,7 +62,7 @@ class Problem(object):
     
     @classmethod
     def from_path(cls, p: os.PathLike) -> "Problem":
-        return cls.from_file(Path(p).open("r"))
+        return cls.from_bytes(Path(p).read_bytes())
     
     @classmethod
     def from_file(cls, f: io.TextIOWrapper) -> "Problem":
@@ -20,4 +70,26 @@ class Problem(object):
     
     @classmethod
     def from_str(cls, input: str) -> "Problem":
-        raise NotImplemented
\ No newline at end of file
+        raise NotImplemented
+    
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "Problem":
+        """
+        Problems with a lot of numbers to parse override this to pull them
+        straight out of the raw input, without decoding it and going line by
+        line. Everything else just decodes it.
+        """
+        return cls.from_str(data.decode())
+    
+    @classmethod
+    def from_lines(cls, lines: t.Iterable[str]) -> "Problem":
+        """
+        Line-oriented problems override this to consume lines lazily, in which
+        case the problem can only be solved once. Everything else just joins
+        the lines back together.
+        """
+        return cls.from_str("\n".join(lines))
+    
+    @classmethod
+    def stream_path(cls, p: os.PathLike) -> "Problem":
+        return cls.from_lines(iter_lines(p))
\ No newline at end of file
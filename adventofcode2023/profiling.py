@@ -0,0 +1,211 @@
+"""
+Profile parsing and each part of a day separately.
+
+With profiling on, every step is run under cProfile, whose stats are dumped
+to a .pstats file, and then run again while a background thread samples the
+main thread's stack to build a .collapsed file that flamegraph tools can read.
+The two never run at once: cProfile records every thread, so it would mostly
+time the sampler waiting on the GIL. With memory tracing on, tracemalloc is
+running during the sampled run and the allocation sites live when traced
+memory peaked are reported.
+
+Each run of a part solves its own freshly parsed problem so that results
+derived in part 1, or in an earlier run, do not hide work.
+"""
+
+from collections import Counter
+import cProfile
+from dataclasses import dataclass, field
+from pathlib import Path
+import pstats
+import sys
+import threading
+import tracemalloc
+import types
+import typing as t
+
+from adventofcode2023.day import Day
+
+
+def frame_name(frame: types.FrameType) -> str:
+    code = frame.f_code
+    return f"{code.co_qualname} ({Path(code.co_filename).name}:{code.co_firstlineno})"
+
+
+class Sampler(object):
+    """
+    Periodically samples a thread from the background, recording its stack
+    below a given frame and, if tracemalloc is running, a snapshot whenever
+    traced memory reaches a new peak.
+    """
+
+    def __init__(
+        self,
+        root: types.FrameType,
+        stacks: bool = True,
+        memory: bool = False,
+        interval: float = 0.001
+    ):
+        self.root = root
+        self.thread_id = threading.get_ident()
+        self.stacks = stacks
+        self.memory = memory
+        self.interval = interval
+        self.counts: Counter[str] = Counter()
+        self.peak: int = 0
+        self.peak_snapshot: tracemalloc.Snapshot | None = None
+        self.stopped = threading.Event()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.switch_interval = sys.getswitchinterval()
+
+    def __enter__(self) -> "Sampler":
+        # the sampled thread holds the GIL for up to the switch interval at a
+        # time, which would otherwise limit how often stacks can be sampled
+        if self.stacks:
+            sys.setswitchinterval(self.interval)
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc: t.Any):
+        self.stopped.set()
+        self.thread.join()
+        if self.stacks:
+            sys.setswitchinterval(self.switch_interval)
+        if self.memory:
+            self.sample_memory()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            if self.stacks:
+                self.sample_stack()
+            if self.memory:
+                self.sample_memory()
+
+    def sample_stack(self):
+        frame = sys._current_frames().get(self.thread_id)
+        names: list[str] = []
+        while frame is not None and frame is not self.root:
+            names.append(frame_name(frame))
+            frame = frame.f_back
+        if frame is self.root and names:
+            self.counts[";".join(reversed(names))] += 1
+
+    def sample_memory(self):
+        current, _ = tracemalloc.get_traced_memory()
+        # snapshots are expensive, only take one when the peak grows noticeably
+        if current > self.peak * 1.1:
+            self.peak = current
+            self.peak_snapshot = tracemalloc.take_snapshot()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {count}\n" for stack, count in self.counts.most_common())
+
+
+@dataclass
+class StepProfile(object):
+    name: str
+    result: t.Any = None
+    stats: pstats.Stats | None = None
+    collapsed: str = ""
+    peak_memory: int | None = None
+    top_allocations: list[tracemalloc.Statistic] = field(default_factory=list)
+
+
+def profile_step(
+    name: str,
+    make: t.Callable[[], t.Callable[[], t.Any]],
+    profile: bool = True,
+    trace_memory: bool = False,
+    top: int = 10
+) -> StepProfile:
+    """
+    Profile the step that make sets up, once for every kind of measurement
+    that would skew the others.
+    """
+    step = StepProfile(name)
+    if profile:
+        func = make()
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            step.result = func()
+        finally:
+            profiler.disable()
+        step.stats = pstats.Stats(profiler)
+    if not profile and not trace_memory:
+        step.result = make()()
+        return step
+    func = make()
+    if trace_memory:
+        tracemalloc.start()
+    try:
+        with Sampler(sys._getframe(), stacks=profile, memory=trace_memory) as sampler:
+            step.result = func()
+        if trace_memory:
+            step.peak_memory = tracemalloc.get_traced_memory()[1]
+            if sampler.peak_snapshot is not None:
+                # leave out whatever the sampler itself allocated
+                snapshot = sampler.peak_snapshot.filter_traces([
+                    tracemalloc.Filter(False, module.__file__)
+                    for module in (tracemalloc, threading, sys.modules[__name__])
+                ])
+                step.top_allocations = snapshot.statistics("lineno")[:top]
+    finally:
+        if trace_memory:
+            tracemalloc.stop()
+    if profile:
+        step.collapsed = sampler.collapsed()
+    return step
+
+
+def write_step(step: StepProfile, prefix: Path):
+    if step.stats is not None:
+        step.stats.dump_stats(prefix.with_name(f"{prefix.name}.pstats"))
+        prefix.with_name(f"{prefix.name}.collapsed").write_text(step.collapsed)
+    if step.peak_memory is not None:
+        lines = [f"peak {step.peak_memory / 1024:.1f} KiB, live allocations at peak:"]
+        lines.extend(str(s) for s in step.top_allocations)
+        prefix.with_name(f"{prefix.name}.memory.txt").write_text("\n".join(lines) + "\n")
+
+
+def report_step(step: StepProfile, top: int = 10):
+    print(f"== {step.name}")
+    if step.stats is not None:
+        step.stats.sort_stats(pstats.SortKey.TIME).print_stats(top)
+    if step.peak_memory is not None:
+        print(f"peak traced memory: {step.peak_memory / 1024:.1f} KiB")
+        for s in step.top_allocations:
+            print(f"  {s}")
+
+
+def profile_day(
+    day: Day,
+    path: Path,
+    parts: list[int],
+    outdir: Path | None = None,
+    trace_memory: bool = False,
+    top: int = 10
+) -> dict[str, StepProfile]:
+    data = path.read_bytes()
+    parse = lambda: day.problem_class.from_bytes(data)
+
+    def part(n: int) -> t.Callable[[], t.Any]:
+        solution = day.solution_class()
+        run = solution.p1 if n == 1 else solution.p2
+        problem = parse()
+        return lambda: run(problem)
+
+    steps: dict[str, t.Callable[[], t.Callable[[], t.Any]]] = {"parse": lambda: parse}
+    for n in parts:
+        steps[f"p{n}"] = lambda n=n: part(n)
+    profiles: dict[str, StepProfile] = {}
+    for name, make in steps.items():
+        step = profile_step(name, make, outdir is not None, trace_memory, top)
+        profiles[name] = step
+        if outdir is not None:
+            outdir.mkdir(parents=True, exist_ok=True)
+            write_step(step, outdir / f"d{day.number:02}-{name}")
+        report_step(step, top)
+        if name != "parse":
+            print(f"Part {name[1:]}: {step.result}")
+    return profiles
@@ -0,0 +1,237 @@
+"""
+Catch performance regressions by benchmarking days against a stored baseline.
+
+The baseline is the JSON written by the bench mode, committed to the repo and
+refreshed with --update whenever a change is meant to make a day slower or
+faster. Steps are compared by their fastest run, which noise from the rest of
+the machine can only slow down, never speed up. A step regresses when it is
+slower than the baseline by more than the relative threshold, and also by more
+than an absolute slack so that steps taking a fraction of a millisecond do not
+fail the check. Even fastest runs drift by up to 1.7x between runs on a shared
+machine, so by default only steps taking twice as long regress. Timings are
+only comparable on the machine that recorded the baseline.
+
+Every run of a step gets a timeout, when recording as well as when checking.
+Steps that fail or time out are left out of the baseline, and only count as
+regressions when the baseline has a timing for them, so a step that never
+worked, like day 24 part 2 without sage, neither passes nor fails the check.
+Steps whose baseline was recorded without a timeout and is already over it
+are skipped.
+"""
+
+import argparse
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import sys
+import typing as t
+
+from adventofcode2023.backend import add_backend_argument, use_backend
+from adventofcode2023.bench import DayResult, StepResult, bench_day
+from adventofcode2023.day import DAYS, Day, search_day
+from adventofcode2023.runner import TaskTimeout
+
+
+DEFAULT_BASELINE = Path(__file__).parent / "baseline.json"
+STEPS = ("p1", "p2")
+# seconds each run of a step may take
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass
+class Comparison(object):
+    day: int
+    step: str
+    baseline: float | None
+    current: float | None
+    error: str | None = None
+    # why the step was not run at all
+    skipped: str | None = None
+
+    @property
+    def ratio(self) -> float | None:
+        if self.baseline is None or self.current is None or self.baseline == 0:
+            return None
+        return self.current / self.baseline
+
+    def regressed(self, threshold: float, slack: float) -> bool:
+        if self.skipped is not None:
+            return False
+        if self.error is not None:
+            return self.baseline is not None
+        if self.baseline is None or self.current is None:
+            return False
+        return (
+            self.current > self.baseline * (1 + threshold)
+            and self.current - self.baseline > slack
+        )
+
+    def status(self, threshold: float, slack: float) -> str:
+        if self.skipped is not None:
+            return f"skipped, {self.skipped}"
+        if self.error is not None:
+            known = " (not in baseline)" if self.baseline is None else ""
+            return f"error: {self.error}{known}"
+        if self.baseline is None:
+            return "new"
+        if self.regressed(threshold, slack):
+            return "SLOWER"
+        return "ok"
+
+
+def load_baseline(path: Path) -> dict[int, dict[str, t.Any]]:
+    """bench results keyed by day"""
+    return {entry["day"]: entry for entry in json.loads(path.read_text())}
+
+
+def save_baseline(path: Path, baseline: dict[int, dict[str, t.Any]]):
+    entries = [baseline[day] for day in sorted(baseline)]
+    path.write_text(json.dumps(entries, indent=2) + "\n")
+
+
+def compare(result: DayResult, baseline: dict[int, dict[str, t.Any]]) -> list[Comparison]:
+    comparisons = []
+    for step, current in result.steps.items():
+        stored = baseline.get(result.day, {}).get(step, {})
+        comparisons.append(Comparison(
+            result.day,
+            step,
+            stored.get("min"),
+            None if current.error is not None else current.min,
+            current.error
+        ))
+    return comparisons
+
+
+def bench_step(
+    day: Day,
+    data: bytes,
+    step: str,
+    repeat: int,
+    warmup: int,
+    timeout: float | None = None
+) -> StepResult:
+    """bench one step, giving up once any of its runs takes longer than timeout"""
+    result = bench_day(day, data, repeat, warmup, [step], memory=False, timeout=timeout).steps[step]
+    # measuring turns exceptions into errors, the timeout among them
+    if result.error is not None and result.error.startswith(TaskTimeout.__name__):
+        result.error = f"timed out after {timeout:g} s per run"
+    return result
+
+
+HEADER = f"{"day":>3} {"step":<5} {"base ms":>10} {"now ms":>10} {"ratio":>7}  status"
+
+
+def format_comparison(c: Comparison, threshold: float, slack: float) -> str:
+    base = "-" if c.baseline is None else f"{c.baseline * 1000:.2f}"
+    now = "-" if c.current is None else f"{c.current * 1000:.2f}"
+    ratio = "-" if c.ratio is None else f"{c.ratio:.2f}"
+    return f"{c.day:>3} {c.step:<5} {base:>10} {now:>10} {ratio:>7}  {c.status(threshold, slack)}"
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 regress")
+    argparser.add_argument("days", nargs="*", help="days to check, by default all")
+    argparser.add_argument(
+        "--baseline",
+        "-b",
+        type=Path,
+        default=DEFAULT_BASELINE,
+        help=f"baseline bench results, {DEFAULT_BASELINE.name} next to this module by default"
+    )
+    argparser.add_argument(
+        "--threshold",
+        "-t",
+        default=1.0,
+        type=float,
+        help="fraction slower than the fastest baseline run that counts as a regression"
+    )
+    argparser.add_argument(
+        "--slack",
+        default=5.0,
+        type=float,
+        help="milliseconds slower that are always tolerated, for steps too quick to time reliably"
+    )
+    argparser.add_argument("--repeat", "-r", default=5, type=int, help="timed runs per step")
+    argparser.add_argument("--warmup", "-w", default=1, type=int, help="untimed runs per step")
+    argparser.add_argument(
+        "--steps",
+        "-s",
+        default=",".join(STEPS),
+        help="comma separated steps to check, any of parse, p1, p2"
+    )
+    argparser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        help="seconds each run of a step may take, steps with a slower baseline median are skipped"
+        f", {DEFAULT_TIMEOUT:g} by default, 0 for none"
+    )
+    argparser.add_argument(
+        "--update",
+        action="store_true",
+        help="write the results to the baseline instead of checking them, keeping other days"
+        " and leaving out steps that fail or time out"
+    )
+    add_backend_argument(argparser)
+    args = argparser.parse_args(argv)
+    use_backend(args.backend)
+
+    steps = [s for s in args.steps.split(",") if s]
+    if unknown := [s for s in steps if s not in ("parse", *STEPS)]:
+        argparser.error(f"unknown steps: {", ".join(unknown)}")
+    days = [search_day(d) for d in args.days] if args.days else [DAYS[n] for n in DAYS]
+    if args.baseline.exists():
+        baseline = load_baseline(args.baseline)
+    elif args.update:
+        baseline = {}
+    else:
+        print(f"no baseline at {args.baseline}, record one with --update", file=sys.stderr)
+        return 1
+
+    slack = args.slack / 1000
+    timeout = args.timeout
+    comparisons: list[Comparison] = []
+    if not args.update:
+        print(HEADER)
+    for day in days:
+        data = day.problem_class.default_input_file_path().read_bytes()
+        stored = baseline.get(day.number, {})
+        result = DayResult(day.number)
+        skipped: dict[str, str] = {}
+        for step in steps:
+            median = stored.get(step, {}).get("median")
+            if timeout and not args.update and median is not None and median > timeout:
+                skipped[step] = f"baseline median {median:.1f} s is over the timeout"
+                continue
+            result.steps[step] = bench_step(day, data, step, args.repeat, args.warmup, timeout)
+        if args.update:
+            entry = baseline.get(day.number, {"day": day.number}) | result.to_dict()
+            for step, step_result in result.steps.items():
+                if step_result.error is not None:
+                    del entry[step]
+                    print(f"day {day.number} {step} not recorded: {step_result.error}", file=sys.stderr)
+            baseline[day.number] = entry
+            print(f"day {day.number} recorded", file=sys.stderr)
+            continue
+        # slow days take a while, so report each as soon as it is done
+        day_comparisons = compare(result, baseline) + [
+            Comparison(day.number, step, stored[step]["min"], None, skipped=reason)
+            for step, reason in skipped.items()
+        ]
+        for c in sorted(day_comparisons, key=lambda c: steps.index(c.step)):
+            comparisons.append(c)
+            print(format_comparison(c, args.threshold, slack), flush=True)
+
+    if args.update:
+        save_baseline(args.baseline, baseline)
+        return 0
+    regressed = [c for c in comparisons if c.regressed(args.threshold, slack)]
+    skipped_count = sum(c.skipped is not None for c in comparisons)
+    print(
+        f"{len(regressed)}/{len(comparisons)} steps regressed"
+        f" (more than {args.threshold:.0%} and {args.slack:g} ms slower)"
+        + (f", {skipped_count} skipped" if skipped_count else ""),
+        file=sys.stderr
+    )
+    return 1 if regressed else 0
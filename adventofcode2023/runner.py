@@ -0,0 +1,364 @@
+"""
+Solve every (day, part) pair concurrently, each within a time and memory
+budget.
+
+Results are printed in day order as soon as every earlier pair has finished.
+Every task runs in a process of its own, started by the Scheduler, so that
+one pathological input cannot stall the rest:
+
+- memory is capped with RLIMIT_AS, so allocating past the budget raises
+  MemoryError in the task instead of swapping the machine
+- once a task runs out of time it is sent SIGALRM, which raises TaskTimeout
+  wherever it is so it can report what it was doing, and if it has not
+  finished a grace period later it is killed
+"""
+
+import argparse
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+import multiprocessing
+from multiprocessing.connection import Connection, wait
+import os
+from pathlib import Path
+import resource
+import signal
+import sys
+import time
+import traceback
+import types
+import typing as t
+
+from adventofcode2023.backend import add_backend_argument, use_backend
+from adventofcode2023.cache import (
+    ProblemCache, add_cache_arguments, load_problem, problem_cache_from_args
+)
+from adventofcode2023.day import DAYS, search_day
+from adventofcode2023.solution import Metrics
+
+
+PACKAGE_DIR = Path(__file__).parent
+
+
+class TaskTimeout(Exception):
+    pass
+
+
+def where(frame: types.FrameType | None, depth: int = 3) -> str:
+    """
+    The innermost few calls of this package at frame, to tell where a task
+    was when it was stopped.
+    """
+    stack = [
+        f"{Path(s.filename).relative_to(PACKAGE_DIR)}:{s.lineno} in {s.name}"
+        for s in traceback.extract_stack(frame)
+        if Path(s.filename).is_relative_to(PACKAGE_DIR)
+    ]
+    return " <- ".join(reversed(stack[-depth:]))
+
+
+def raise_timeout(signum: int, frame: types.FrameType | None):
+    raise TaskTimeout(f"stopped at {where(frame)}")
+
+
+@contextmanager
+def time_limit(seconds: float | None) -> t.Iterator[None]:
+    """raise TaskTimeout in the block once it has run for seconds, if any"""
+    if not seconds:
+        yield
+        return
+    previous = signal.signal(signal.SIGALRM, raise_timeout)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def raised_at(e: BaseException) -> str:
+    tb = e.__traceback__
+    while tb is not None and tb.tb_next is not None:
+        tb = tb.tb_next
+    return where(None if tb is None else tb.tb_frame)
+
+
+def peak_rss() -> int:
+    """peak resident memory of this process in bytes"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+@dataclass
+class Budget(object):
+    seconds: float | None = None
+    # bytes of address space, which counts the interpreter and libraries too
+    memory: int | None = None
+    # seconds a task gets to report after being told to stop
+    grace: float = 2.0
+
+
+@dataclass
+class TaskResult(object):
+    day: int
+    part: int
+    answer: str | None = None
+    elapsed: float = 0.0
+    error: str | None = None
+    peak_memory: int | None = None
+    # counters the part had collected, kept when it fails to tell how far it got
+    counters: dict[str, int] = field(default_factory=dict)
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __str__(self) -> str:
+        outcome = self.answer if self.ok else f"error: {self.error}"
+        line = f"Day {self.day:>2} Part {self.part}: {outcome} ({self.elapsed * 1000:.1f} ms)"
+        if not self.ok and self.peak_memory is not None:
+            line += f"\n  peak memory {self.peak_memory / 2 ** 20:.1f} MiB"
+        if not self.ok and self.counters:
+            line += "\n  " + ", ".join(f"{k}={v}" for k, v in self.counters.items())
+        return line
+
+
+def run_task(day: int, part: int, cache: ProblemCache | None = None) -> TaskResult:
+    """
+    Solve one part of a day, stopping with the partial diagnostics gathered
+    so far if TaskTimeout or MemoryError interrupt it.
+    """
+    result = TaskResult(day, part)
+    solution = None
+    start = time.perf_counter()
+    try:
+        d = DAYS[day]
+        problem = load_problem(d, d.problem_class.default_input_file_path(), cache)
+        solution = d.solution_class()
+        solution.metrics = Metrics()
+        answer = solution.p1(problem) if part == 1 else solution.p2(problem)
+        result.answer = str(answer)
+    except TaskTimeout as e:
+        result.error = f"timed out, {e}"
+    except MemoryError as e:
+        result.error = f"over memory budget, stopped at {raised_at(e)}"
+    except Exception as e:
+        result.error = f"{type(e).__name__}: {e}"
+    finally:
+        result.elapsed = time.perf_counter() - start
+        result.peak_memory = peak_rss()
+        if solution is not None:
+            result.counters = solution.metrics.snapshot()
+    return result
+
+
+def run_budgeted(
+    conn: Connection,
+    budget: Budget,
+    initializer: t.Callable[..., t.Any] | None,
+    initargs: tuple,
+    func: t.Callable[..., t.Any],
+    args: tuple
+):
+    """Runs in the task's own process."""
+    if budget.memory is not None:
+        _, hard = resource.getrlimit(resource.RLIMIT_AS)
+        resource.setrlimit(resource.RLIMIT_AS, (budget.memory, hard))
+    signal.signal(signal.SIGALRM, raise_timeout)
+    if initializer is not None:
+        initializer(*initargs)
+    conn.send(func(*args))
+    conn.close()
+
+
+@dataclass
+class Running(object):
+    process: multiprocessing.process.BaseProcess
+    conn: Connection
+    start: float
+    signalled: bool = False
+
+
+class Scheduler(object):
+    """
+    Run calls in processes of their own, at most jobs at a time, each within
+    the budget. Calls should catch TaskTimeout and MemoryError to return what
+    they have, calls that do not return anything at all are handed to lost.
+    """
+    def __init__(
+        self,
+        jobs: int | None = None,
+        budget: Budget = Budget(),
+        initializer: t.Callable[..., t.Any] | None = None,
+        initargs: tuple = ()
+    ):
+        self.jobs = jobs or os.process_cpu_count() or 1
+        self.budget = budget
+        self.initializer = initializer
+        self.initargs = initargs
+        # forked tasks start right away with everything already imported
+        methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+    def start(self, func: t.Callable[..., t.Any], args: tuple) -> Running:
+        receiver, sender = self.context.Pipe(duplex=False)
+        process = self.context.Process(
+            target=run_budgeted,
+            args=(sender, self.budget, self.initializer, self.initargs, func, args),
+            daemon=True
+        )
+        process.start()
+        sender.close()
+        return Running(process, receiver, time.perf_counter())
+
+    def run[T](
+        self,
+        calls: list[tuple[t.Callable[..., T], tuple]],
+        lost: t.Callable[[int, str, float], T]
+    ) -> t.Generator[tuple[int, T]]:
+        """
+        Yield the index of each call with its result as they finish, in no
+        particular order. lost makes a result out of the reason a call did not
+        return one and how long it ran.
+        """
+        pending = deque(range(len(calls)))
+        running: dict[int, Running] = {}
+        while pending or running:
+            while pending and len(running) < self.jobs:
+                i = pending.popleft()
+                running[i] = self.start(*calls[i])
+            ready = wait([r.conn for r in running.values()], timeout=self.next_deadline(running))
+            now = time.perf_counter()
+            for i, r in list(running.items()):
+                elapsed = now - r.start
+                if r.conn in ready:
+                    try:
+                        result = r.conn.recv()
+                    except EOFError:
+                        r.process.join()
+                        result = lost(i, f"worker died with exit code {r.process.exitcode}", elapsed)
+                    self.stop(r)
+                    del running[i]
+                    yield i, result
+                elif self.budget.seconds is None:
+                    continue
+                elif elapsed >= self.budget.seconds + self.budget.grace:
+                    self.stop(r)
+                    del running[i]
+                    yield i, lost(i, f"killed after not stopping within {elapsed:.1f} s", elapsed)
+                elif elapsed >= self.budget.seconds and not r.signalled:
+                    os.kill(r.process.pid, signal.SIGALRM)
+                    r.signalled = True
+
+    def next_deadline(self, running: dict[int, Running]) -> float | None:
+        if self.budget.seconds is None:
+            return None
+        now = time.perf_counter()
+        deadlines = [
+            r.start + self.budget.seconds + (self.budget.grace if r.signalled else 0)
+            for r in running.values()
+        ]
+        return max(0.0, min(deadlines) - now)
+
+    def stop(self, r: Running):
+        r.conn.close()
+        if r.process.is_alive():
+            r.process.kill()
+        r.process.join()
+
+
+def run_all(
+    tasks: list[tuple[int, int]],
+    jobs: int | None = None,
+    budget: Budget = Budget(),
+    cache: ProblemCache | None = None,
+    on_result: t.Callable[[TaskResult], None] = print,
+    backend: str = "python"
+) -> list[TaskResult]:
+    """
+    Runs all tasks and calls on_result for each of them in the order that
+    they were given, returning the results in the same order.
+    """
+    results: list[TaskResult | None] = [None] * len(tasks)
+    printed = 0
+    # later days tend to be the slowest so start them first, the whole run
+    # then takes about as long as the slowest task
+    order = sorted(range(len(tasks)), key=lambda i: tasks[i], reverse=True)
+    scheduler = Scheduler(jobs, budget, use_backend, (backend,))
+    calls = [(run_task, (*tasks[i], cache)) for i in order]
+
+    def lost(i: int, reason: str, elapsed: float) -> TaskResult:
+        return TaskResult(*tasks[order[i]], elapsed=elapsed, error=reason)
+
+    for i, result in scheduler.run(calls, lost):
+        results[order[i]] = result
+        while printed < len(tasks) and (result := results[printed]) is not None:
+            on_result(result)
+            printed += 1
+    return results
+
+
+def add_budget_arguments(argparser: argparse.ArgumentParser, unit: str = "task"):
+    argparser.add_argument("--timeout", "-t", type=float, help=f"seconds allowed per {unit}")
+    argparser.add_argument(
+        "--memory",
+        type=float,
+        metavar="MIB",
+        help=f"MiB of address space allowed per {unit}, including the interpreter's"
+    )
+    argparser.add_argument(
+        "--grace",
+        default=2.0,
+        type=float,
+        help=f"seconds a {unit} out of time gets to report what it was doing before it is killed"
+    )
+
+
+def budget_from_args(args: argparse.Namespace) -> Budget:
+    memory = None if args.memory is None else int(args.memory * 2 ** 20)
+    return Budget(args.timeout, memory, args.grace)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 all")
+    argparser.add_argument("days", nargs="*", help="days to solve, by default all")
+    argparser.add_argument(
+        "--part",
+        "-p",
+        default=0,
+        type=int,
+        choices=[1, 2],
+        help="which part to run, by default all"
+    )
+    argparser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="number of tasks run at once, by default one per cpu"
+    )
+    add_budget_arguments(argparser)
+    add_backend_argument(argparser)
+    add_cache_arguments(argparser)
+    args = argparser.parse_args(argv)
+    backend = use_backend(args.backend)
+
+    days = [search_day(d).number for d in args.days] if args.days else list(DAYS)
+    parts = [1, 2] if args.part == 0 else [args.part]
+    tasks = [(day, part) for day in days for part in parts]
+
+    start = time.perf_counter()
+    results = run_all(
+        tasks, args.jobs, budget_from_args(args), problem_cache_from_args(args), backend=backend
+    )
+    wall = time.perf_counter() - start
+
+    cpu = sum(r.elapsed for r in results)
+    failed = [r for r in results if not r.ok]
+    slowest = max(results, key=lambda r: r.elapsed)
+    print(
+        f"{len(results) - len(failed)}/{len(results)} tasks ok"
+        f", wall {wall:.2f} s"
+        f", sum of tasks {cpu:.2f} s"
+        f", slowest day {slowest.day} part {slowest.part} ({slowest.elapsed:.2f} s)",
+        file=sys.stderr
+    )
+    return 1 if failed else 0
@@ -0,0 +1,229 @@
+"""
+Benchmark a day on generated inputs of growing size.
+
+Every size gets its own generated input, on which parsing and both parts are
+timed like in the bench mode. Runtime and peak memory are then plotted against
+size along with the growth exponent between successive sizes, which is about 1
+for a linear step and 2 for a quadratic one. Each run of a step has a
+timeout, and a step that runs past it is not tried again on bigger sizes.
+Table rows are printed as soon as their size is done, the plots at the end.
+"""
+
+import argparse
+from dataclasses import dataclass
+import json
+import math
+from pathlib import Path
+import typing as t
+
+from adventofcode2023.bench import STEPS, DayResult, StepResult, bench_day
+from adventofcode2023.day import Day, search_day
+from adventofcode2023.generate import TYPICAL_SIZES, generate
+from adventofcode2023.runner import TaskTimeout
+
+
+# seconds each run of a step may take
+DEFAULT_TIMEOUT = 30.0
+
+
+@dataclass
+class ScalePoint(object):
+    size: int
+    input_bytes: int
+    result: DayResult
+
+    def to_dict(self) -> dict[str, t.Any]:
+        return {"size": self.size, "input_bytes": self.input_bytes} | self.result.to_dict()
+
+
+def scale_day(
+    day: Day,
+    sizes: list[int],
+    seed: int = 0,
+    repeat: int = 3,
+    warmup: int = 0,
+    steps: t.Iterable[str] = STEPS,
+    memory: bool = True,
+    timeout: float | None = DEFAULT_TIMEOUT,
+    on_point: t.Callable[[ScalePoint], None] | None = None
+) -> list[ScalePoint]:
+    points: list[ScalePoint] = []
+    timed_out: set[str] = set()
+    for size in sizes:
+        data = generate(day.number, size, seed).encode()
+        result = DayResult(day.number)
+        for step in steps:
+            if step in timed_out:
+                result.steps[step] = StepResult(error="skipped, timed out on a smaller size")
+                continue
+            step_result = bench_day(day, data, repeat, warmup, [step], memory, timeout).steps[step]
+            # measuring turns exceptions into errors, the timeout among them
+            if step_result.error is not None and step_result.error.startswith(TaskTimeout.__name__):
+                step_result.error = f"timed out after {timeout:g} s per run"
+                timed_out.add(step)
+            result.steps[step] = step_result
+        point = ScalePoint(size, len(data), result)
+        points.append(point)
+        if on_point is not None:
+            on_point(point)
+    return points
+
+
+def growth(a: tuple[int, float], b: tuple[int, float]) -> float | None:
+    """
+    Exponent k such that value grows like size ** k between points a and b,
+    as (size, value) pairs.
+    """
+    (size_a, value_a), (size_b, value_b) = a, b
+    if size_a == size_b or value_a <= 0 or value_b <= 0:
+        return None
+    return math.log(value_b / value_a) / math.log(size_b / size_a)
+
+
+def series(points: list[ScalePoint], step: str, metric: str) -> list[tuple[int, float]]:
+    result = []
+    for point in points:
+        s = point.result.steps.get(step)
+        if s is None or s.error is not None:
+            continue
+        value = s.median if metric == "time" else s.peak_memory
+        if value is not None:
+            result.append((point.size, value))
+    return result
+
+
+HEADER = (
+    f"{"size":>8} {"input KiB":>10} {"step":<5} {"median ms":>10} {"k":>5} {"peak KiB":>10} {"k":>5}"
+)
+
+
+def format_rows(point: ScalePoint, previous: ScalePoint | None, steps: list[str]) -> list[str]:
+    """table rows of point, with growth since the previous size"""
+    lines = []
+    for name in steps:
+        step = point.result.steps[name]
+        prefix = f"{point.size:>8} {point.input_bytes / 1024:>10.1f} {name:<5}"
+        if step.error is not None:
+            lines.append(f"{prefix} {step.error}")
+            continue
+        time_k = memory_k = None
+        if previous is not None and (p := previous.result.steps.get(name)) is not None and p.error is None:
+            time_k = growth((previous.size, p.median), (point.size, step.median))
+            if p.peak_memory is not None and step.peak_memory is not None:
+                memory_k = growth((previous.size, p.peak_memory), (point.size, step.peak_memory))
+        peak = "-" if step.peak_memory is None else f"{step.peak_memory / 1024:.1f}"
+        lines.append(
+            f"{prefix} {step.median * 1000:>10.2f}"
+            f" {"-" if time_k is None else f"{time_k:.2f}":>5}"
+            f" {peak:>10}"
+            f" {"-" if memory_k is None else f"{memory_k:.2f}":>5}"
+        )
+    return lines
+
+
+def plot(values: list[tuple[int, float]], title: str, unit: str, width: int = 50) -> str:
+    """horizontal bar chart of values against size"""
+    lines = [title]
+    if not values:
+        return title + "\n  (no data)"
+    top = max(v for _, v in values) or 1
+    for size, value in values:
+        bar = "#" * max(1, round(value / top * width))
+        lines.append(f"{size:>8} | {bar} {value:.2f} {unit}")
+    return "\n".join(lines)
+
+
+def format_plots(points: list[ScalePoint], steps: list[str]) -> str:
+    charts = []
+    for step in steps:
+        time_values = [(size, value * 1000) for size, value in series(points, step, "time")]
+        charts.append(plot(time_values, f"{step} runtime", "ms"))
+        memory_values = [(size, value / 1024) for size, value in series(points, step, "memory")]
+        if memory_values:
+            charts.append(plot(memory_values, f"{step} peak memory", "KiB"))
+    return "\n\n".join(charts)
+
+
+def parse_numbers(s: str, kind: t.Callable[[str], t.Any]) -> list[t.Any]:
+    return [kind(n) for n in s.split(",") if n]
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 scale")
+    argparser.add_argument("day", help="day to benchmark")
+    argparser.add_argument(
+        "--sizes",
+        "-n",
+        help="comma separated input sizes, what they count depends on the day"
+    )
+    argparser.add_argument(
+        "--factors",
+        "-f",
+        default="0.25,0.5,1,2",
+        help="comma separated multiples of the real input size, used when no sizes are given"
+    )
+    argparser.add_argument("--seed", default=0, type=int, help="random seed for the generator")
+    argparser.add_argument("--repeat", "-r", default=3, type=int, help="timed runs per step")
+    argparser.add_argument("--warmup", "-w", default=0, type=int, help="untimed runs per step")
+    argparser.add_argument(
+        "--steps",
+        "-s",
+        default=",".join(STEPS),
+        help=f"comma separated steps to run, any of {", ".join(STEPS)}"
+    )
+    argparser.add_argument(
+        "--no-memory",
+        dest="memory",
+        action="store_false",
+        help="skip the extra traced run used to measure peak memory"
+    )
+    argparser.add_argument(
+        "--timeout",
+        "-t",
+        default=DEFAULT_TIMEOUT,
+        type=float,
+        help="seconds each run of a step may take, steps that time out are not run on bigger sizes"
+        f", {DEFAULT_TIMEOUT:g} by default, 0 for none"
+    )
+    argparser.add_argument(
+        "--json",
+        "-j",
+        type=Path,
+        help="also write the results as json to this path, - for stdout instead of the table"
+    )
+    args = argparser.parse_args(argv)
+
+    steps = [s for s in args.steps.split(",") if s]
+    if unknown := [s for s in steps if s not in STEPS]:
+        argparser.error(f"unknown steps: {", ".join(unknown)}")
+    day = search_day(args.day)
+    if args.sizes:
+        sizes = parse_numbers(args.sizes, int)
+    else:
+        typical = TYPICAL_SIZES[day.number]
+        sizes = sorted({max(1, round(typical * f)) for f in parse_numbers(args.factors, float)})
+
+    if str(args.json) == "-":
+        points = scale_day(
+            day, sizes, args.seed, args.repeat, args.warmup, steps, args.memory, args.timeout
+        )
+        print(json.dumps([p.to_dict() for p in points], indent=2))
+        return 0
+
+    # bigger sizes take a while, so print each row as soon as it is done
+    printed: list[ScalePoint] = []
+
+    def print_rows(point: ScalePoint):
+        for line in format_rows(point, printed[-1] if printed else None, steps):
+            print(line, flush=True)
+        printed.append(point)
+
+    print(HEADER, flush=True)
+    points = scale_day(
+        day, sizes, args.seed, args.repeat, args.warmup, steps, args.memory, args.timeout, print_rows
+    )
+    print()
+    print(format_plots(points, steps))
+    if args.json:
+        args.json.write_text(json.dumps([p.to_dict() for p in points], indent=2))
+    return 0
@@ -0,0 +1,260 @@
+"""
+Keep days loaded in a long lived process that solves requests sent over a
+Unix domain socket.
+
+Requests and responses are JSON objects, one per line, and a connection may
+send any number of requests. A solve request looks like
+
+    {"day": "1", "part": 0, "path": "/abs/input.txt"}
+
+with the input given either as a path readable by the server, as the text
+itself under "input", or left out for the day's own input. Part 0 solves both
+parts. The response holds the answer and time taken for each part:
+
+    {"day": 1, "parse_elapsed": 0.0004, "problem_cached": false,
+     "parts": {"1": {"answer": "55712", "elapsed": 0.003, "error": null}, ...},
+     "error": null}
+
+{"op": "ping"} is answered with {"ok": true} and {"op": "shutdown"} stops the
+server once running requests are done. Idle connections are closed for reading
+on shutdown, so clients that keep a connection open do not keep the server
+up. A socket left behind by a server that is gone is replaced, but not one
+another server is still listening on.
+
+Connections are served concurrently by a pool of threads. Parsed problems are
+kept in memory keyed by day and input digest, least recently used dropped
+first. Some solutions mutate the problem they are given, so each problem has
+a lock held while it is solved, which also lets derived results be shared
+between requests.
+"""
+
+import argparse
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+import json
+import os
+from pathlib import Path
+import socket
+import sys
+import threading
+import time
+import typing as t
+
+from adventofcode2023.batch import PartResult
+from adventofcode2023.cache import digest
+from adventofcode2023.day import DAYS, search_day
+from adventofcode2023.problem import Problem
+
+
+SOCKET_ENV = "AOC2023_SOCKET"
+DEFAULT_SOCKET = Path(
+    os.environ.get("XDG_RUNTIME_DIR", "/tmp")
+) / f"adventofcode2023-{os.getuid()}.sock"
+
+
+def default_socket_path() -> Path:
+    return Path(os.environ.get(SOCKET_ENV, DEFAULT_SOCKET))
+
+
+@dataclass
+class Entry(object):
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    problem: Problem | None = None
+
+
+class ProblemStore(object):
+    def __init__(self, max_problems: int = 64):
+        self.max_problems = max_problems
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[tuple[int, str], Entry] = OrderedDict()
+
+    def entry(self, day: int, data: bytes) -> Entry:
+        """
+        Entry for the input data of day, which is empty until whoever holds
+        its lock first parses the problem.
+        """
+        key = day, digest(data)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                entry = self.entries[key] = Entry()
+                while len(self.entries) > self.max_problems:
+                    self.entries.popitem(last=False)
+            else:
+                self.entries.move_to_end(key)
+            return entry
+
+
+@dataclass
+class SolveResponse(object):
+    day: int | None = None
+    parse_elapsed: float = 0.0
+    problem_cached: bool = False
+    parts: dict[int, PartResult] = field(default_factory=dict)
+    error: str | None = None
+
+
+def solve_request(request: dict[str, t.Any], store: ProblemStore) -> SolveResponse:
+    response = SolveResponse()
+    try:
+        day = search_day(str(request["day"]))
+        response.day = day.number
+        part = int(request.get("part", 0))
+        if part not in (0, 1, 2):
+            raise ValueError(f"no part {part}")
+        if "input" in request:
+            data = request["input"].encode()
+        else:
+            data = Path(request.get("path") or day.problem_class.default_input_file_path()).read_bytes()
+        entry = store.entry(day.number, data)
+        with entry.lock:
+            if entry.problem is None:
+                start = time.perf_counter()
+                entry.problem = day.problem_class.from_bytes(data)
+                response.parse_elapsed = time.perf_counter() - start
+            else:
+                response.problem_cached = True
+            solution = day.solution_class()
+            for p in [1, 2] if part == 0 else [part]:
+                result = response.parts[p] = PartResult()
+                start = time.perf_counter()
+                try:
+                    answer = solution.p1(entry.problem) if p == 1 else solution.p2(entry.problem)
+                    result.answer = str(answer)
+                except Exception as e:
+                    result.error = f"{type(e).__name__}: {e}"
+                finally:
+                    result.elapsed = time.perf_counter() - start
+    except Exception as e:
+        response.error = f"{type(e).__name__}: {e}"
+    return response
+
+
+class SolverServer(object):
+    def __init__(self, path: Path, workers: int | None = None, max_problems: int = 64):
+        self.path = path
+        self.store = ProblemStore(max_problems)
+        self.executor = ThreadPoolExecutor(max_workers=workers)
+        self.stopped = threading.Event()
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        # open connections, closed for reading on shutdown to end idle ones
+        self.connections: set[socket.socket] = set()
+        self.connections_lock = threading.Lock()
+
+    def remove_stale_socket(self):
+        """
+        Unlink a socket left at path by a server that is gone, raising
+        FileExistsError if a server is still listening on it.
+        """
+        if not self.path.exists():
+            return
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                self.path.unlink(missing_ok=True)
+                return
+        raise FileExistsError(f"a server is already listening on {self.path}")
+
+    def serve_forever(self):
+        self.remove_stale_socket()
+        self.sock.bind(str(self.path))
+        self.sock.listen()
+        # wake up now and then to notice a shutdown request
+        self.sock.settimeout(0.5)
+        try:
+            while not self.stopped.is_set():
+                try:
+                    conn, _ = self.sock.accept()
+                except TimeoutError:
+                    continue
+                conn.settimeout(None)
+                with self.connections_lock:
+                    self.connections.add(conn)
+                self.executor.submit(self.handle_connection, conn)
+        finally:
+            self.sock.close()
+            self.path.unlink(missing_ok=True)
+            # handlers waiting for a request read the end of it and return,
+            # those solving one still write their reply
+            with self.connections_lock:
+                for conn in self.connections:
+                    try:
+                        conn.shutdown(socket.SHUT_RD)
+                    except OSError:
+                        pass
+            self.executor.shutdown(wait=True, cancel_futures=True)
+
+    def handle_connection(self, conn: socket.socket):
+        try:
+            self.serve_connection(conn)
+        finally:
+            with self.connections_lock:
+                self.connections.discard(conn)
+
+    def serve_connection(self, conn: socket.socket):
+        with conn, conn.makefile("rb") as reader, conn.makefile("wb") as writer:
+            for line in reader:
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    reply = self.handle_request(request)
+                except json.JSONDecodeError as e:
+                    reply = {"error": f"invalid request: {e}"}
+                writer.write(json.dumps(reply).encode() + b"\n")
+                writer.flush()
+                if self.stopped.is_set():
+                    break
+
+    def handle_request(self, request: dict[str, t.Any]) -> dict[str, t.Any]:
+        match request.get("op", "solve"):
+            case "solve": return asdict(solve_request(request, self.store))
+            case "ping": return {"ok": True}
+            case "shutdown":
+                self.stopped.set()
+                return {"ok": True}
+            case op: return {"error": f"unknown op {op}"}
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023 serve")
+    argparser.add_argument(
+        "--socket",
+        type=Path,
+        default=default_socket_path(),
+        help=f"path of the socket to listen on, defaults to {SOCKET_ENV} or {DEFAULT_SOCKET}"
+    )
+    argparser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="number of connections served at once, by default a few per cpu"
+    )
+    argparser.add_argument(
+        "--max-problems",
+        default=64,
+        type=int,
+        help="number of parsed problems kept in memory"
+    )
+    argparser.add_argument(
+        "--preload",
+        action="store_true",
+        help="import every day before listening instead of on first use"
+    )
+    args = argparser.parse_args(argv)
+
+    if args.preload:
+        for n in DAYS:
+            DAYS[n]
+    server = SolverServer(args.socket, args.workers, args.max_problems)
+    print(f"listening on {args.socket}", file=sys.stderr)
+    try:
+        server.serve_forever()
+    except FileExistsError as e:
+        print(e, file=sys.stderr)
+        return 1
+    except KeyboardInterrupt:
+        pass
+    return 0
@@ -1,10 +1,100 @@
+from collections import Counter
+import functools
+import time
 import typing as t
 
+from adventofcode2023.parallel import parallel_map
 from adventofcode2023.problem import Problem
 
+
+def derived[T](func: t.Callable[..., T]) -> t.Callable[..., T]:
+    """
+    Cache the result of a solution method on the problem it was called with,
+    so that work shared by both parts is only done once per problem. The
+    method must not depend on any state of the solution and its remaining
+    arguments must be hashable.
+    """
+    @functools.wraps(func)
+    def wrapper(self, problem: Problem, *args: t.Any, **kwargs: t.Any) -> T:
+        key = (func.__qualname__, args, tuple(sorted(kwargs.items())))
+        cache = problem.derived
+        if key not in cache:
+            cache[key] = func(self, problem, *args, **kwargs)
+        return cache[key]
+    return wrapper
+
+
+class Metrics(object):
+    """
+    Algorithmic counters that solvers report, like nodes pushed or cache
+    misses. Hot loops should count into a local and add the total once, or
+    check enabled first, so that disabled metrics cost next to nothing.
+    """
+    enabled: bool = True
+    
+    def __init__(self):
+        self.counters: Counter[str] = Counter()
+    
+    def add(self, name: str, n: int = 1):
+        self.counters[name] += n
+    
+    def snapshot(self) -> dict[str, int]:
+        return dict(self.counters)
+
+
+class NullMetrics(Metrics):
+    enabled = False
+    
+    def add(self, name: str, n: int = 1):
+        pass
+
+
+NULL_METRICS = NullMetrics()
+
+
 class Solution(object):
+    # replaced with a Metrics instance to collect counters
+    metrics: Metrics = NULL_METRICS
+    # "numpy" runs the vectorized versions of days that have one, see
+    # adventofcode2023.backend
+    backend: str = "python"
+    # number of workers parallel_map spreads calls over, see
+    # adventofcode2023.parallel
+    workers: int = 1
+    # set while solve_both solves both parts, so part 1 may do work that only
+    # pays off when part 2 shares it
+    solving_both: bool = False
+    
     def p1(self, problem: Problem) -> t.Any:
         raise NotImplemented
     
     def p2(self, problem: Problem) -> t.Any:
-        raise NotImplemented
\ No newline at end of file
+        raise NotImplemented
+    
+    def parallel_map[T](
+        self,
+        func: t.Callable[..., T],
+        *iterables: t.Iterable[t.Any]
+    ) -> t.Iterator[T]:
+        """
+        Map func over independent pieces of a part, in parallel when the
+        solution has more than one worker. func and the items must be
+        picklable unless the interpreter is free-threaded.
+        """
+        return parallel_map(self.workers, func, *iterables)
+    
+    def solve_both(self, problem: Problem) -> t.Iterator[tuple[t.Any, float]]:
+        """
+        Solve both parts of the same problem, reusing anything derived from it
+        in part 1 for part 2, yielding each answer along with the seconds its
+        part took as soon as it is known, so part 2 failing does not lose part
+        1. Work shared by both parts is counted against part 1, which did it.
+        """
+        self.solving_both = True
+        try:
+            start = time.perf_counter()
+            yield self.p1(problem), time.perf_counter() - start
+            start = time.perf_counter()
+            yield self.p2(problem), time.perf_counter() - start
+        finally:
+            self.solving_both = False
@@ -0,0 +1,67 @@
+"""
+Measure how long a fresh interpreter takes to resolve each day.
+
+Every sample runs in a new interpreter so that nothing is already sitting in
+`sys.modules`. Run with `python -m adventofcode2023.startup`.
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+from adventofcode2023.day import DAY_MODULES
+
+
+PROBE = """
+import time
+t0 = time.perf_counter()
+from adventofcode2023.day import search_day
+t1 = time.perf_counter()
+search_day({day!r})
+t2 = time.perf_counter()
+print(t1 - t0, t2 - t1)
+"""
+
+
+def probe(day: int) -> tuple[float, float]:
+    """
+    Returns the time taken to import the registry and the time taken to
+    import the requested day, in seconds
+    """
+    p = subprocess.run(
+        [sys.executable, "-c", PROBE.format(day=str(day))],
+        capture_output=True,
+        check=True,
+        text=True
+    )
+    registry, module = p.stdout.split()
+    return float(registry), float(module)
+
+
+def main(argv: list[str] | None = None) -> int:
+    argparser = argparse.ArgumentParser(prog="adventofcode2023.startup")
+    argparser.add_argument("days", nargs="*", type=int, help="days to probe, by default all")
+    argparser.add_argument("--repeat", "-r", default=5, type=int)
+    argparser.add_argument("--json", action="store_true", help="print results as json")
+    args = argparser.parse_args(argv)
+    days = args.days or list(DAY_MODULES)
+    results: dict[int, dict[str, float]] = {}
+    for day in days:
+        samples = [probe(day) for _ in range(args.repeat)]
+        results[day] = {
+            "registry_ms": statistics.median(r for r, _ in samples) * 1000,
+            "day_ms": statistics.median(m for _, m in samples) * 1000
+        }
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print(f"{"day":>3} {"registry ms":>12} {"day ms":>8}")
+        for day, r in results.items():
+            print(f"{day:>3} {r["registry_ms"]:>12.2f} {r["day_ms"]:>8.2f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())